@@ -0,0 +1,42 @@
+from typing import Callable, Optional, Tuple, Type
+
+from fastapi import HTTPException, Query, status
+from pydantic import BaseModel
+
+# -------------------------------------------------
+# Sparse fieldsets (?fields=a,b,c)
+# -------------------------------------------------
+
+
+def sparse_fields(
+    schema: Type[BaseModel],
+    always: Tuple[str, ...] = ("id",),
+) -> Callable[..., Tuple[str, ...]]:
+    """
+    Build a dependency that parses `?fields=` into the tuple of schema
+    fields to select and return. Without the parameter every field of
+    `schema` is returned; `always` fields are included regardless.
+    """
+    allowed = tuple(schema.model_fields)
+
+    def parse_fields(
+        fields: Optional[str] = Query(
+            default=None,
+            description="Comma-separated subset of: " + ", ".join(allowed),
+        ),
+    ) -> Tuple[str, ...]:
+        if not fields:
+            return allowed
+
+        requested = [name.strip() for name in fields.split(",") if name.strip()]
+        unknown = sorted(set(requested) - set(allowed))
+        if unknown:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Unknown fields: {', '.join(unknown)}",
+            )
+
+        # Keep request order, drop duplicates
+        return tuple(dict.fromkeys((*always, *requested)))
+
+    return parse_fields
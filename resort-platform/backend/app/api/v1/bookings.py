@@ -1,14 +1,22 @@
 from datetime import date
-from typing import List
+from typing import List, Optional, Tuple
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 
+from app.api.fields import sparse_fields
+from app.core.serialization import row_response, rows_response, schema_columns
+from app.db.loaders import BOOKING_PLAIN
 from app.db.session import get_db
 from app.models.booking import Booking
 from app.models.room import Room
 from app.models.guest import Guest
+from app.services.availability import MAX_STAY_NIGHTS, is_room_available
+from app.services.payment_service import with_balance
+from app.services.typeahead import BOOKING_DOCUMENT, typeahead
 from app.schemas.booking import (
+    BookingBalanceOut,
     BookingCreate,
     BookingOut,
     BookingUpdate,
@@ -17,31 +25,32 @@ from app.api.v1.auth import get_current_user
 
 router = APIRouter()
 
+booking_fields = sparse_fields(BookingOut)
+
+BALANCE_FIELDS = ("paid_total", "outstanding")
+
+include_balance = Query(
+    default=False,
+    alias="balance",
+    description="Also return paid_total and outstanding",
+)
+
 
 # -------------------------------------------------
 # Helper functions
 # -------------------------------------------------
 
-def check_room_availability(
-    db: Session,
-    room_id: int,
-    check_in: date,
-    check_out: date,
-) -> bool:
-    """
-    Returns True if the room is available for the given date range.
-    """
-    overlapping = (
-        db.query(Booking)
-        .filter(
-            Booking.room_id == room_id,
-            Booking.check_in < check_out,
-            Booking.check_out > check_in,
-            Booking.status == "CONFIRMED",
+def check_stay_dates(check_in: date, check_out: date) -> None:
+    if check_in >= check_out:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid date range",
+        )
+    if (check_out - check_in).days > MAX_STAY_NIGHTS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Stays are limited to {MAX_STAY_NIGHTS} nights",
         )
-        .first()
-    )
-    return overlapping is None
 
 
 # -------------------------------------------------
@@ -65,13 +74,9 @@ def create_booking(
             detail="Room not found",
         )
 
-    if payload.check_in >= payload.check_out:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Invalid date range",
-        )
+    check_stay_dates(payload.check_in, payload.check_out)
 
-    if not check_room_availability(
+    if not is_room_available(
         db,
         payload.room_id,
         payload.check_in,
@@ -113,14 +118,50 @@ def create_booking(
     summary="List all bookings (admin)",
 )
 def list_bookings(
+    limit: Optional[int] = Query(default=None, ge=1, le=1000),
+    offset: int = Query(default=0, ge=0),
+    fields: Tuple[str, ...] = Depends(booking_fields),
+    balance: bool = include_balance,
     db: Session = Depends(get_db),
     current_user: Guest = Depends(get_current_user),
 ):
-    return (
-        db.query(Booking)
-        .order_by(Booking.check_in.desc())
-        .all()
-    )
+    """
+    Latest check-in first. Every booking unless `limit` asks for a page.
+    """
+    order = (Booking.check_in.desc(), Booking.id.desc())
+
+    query = db.query(*schema_columns(Booking, fields))
+    if balance:
+        page = None
+        if limit is not None or offset:
+            # Only the page's payments are aggregated
+            page = select(Booking.id).order_by(*order).limit(limit).offset(offset)
+        query = with_balance(query, page)
+        fields += BALANCE_FIELDS
+
+    rows = query.order_by(*order).limit(limit).offset(offset).all()
+    return rows_response(rows, fields)
+
+
+@router.get(
+    "/search",
+    response_model=List[BookingOut],
+    summary="Typeahead search by guest name, email or phone (admin)",
+)
+def search_bookings(
+    q: str = Query(min_length=3, max_length=100),
+    limit: int = Query(default=10, ge=1, le=50),
+    fields: Tuple[str, ...] = Depends(booking_fields),
+    db: Session = Depends(get_db),
+    current_user: Guest = Depends(get_current_user),
+):
+    rows = typeahead(
+        db.query(*schema_columns(Booking, fields)),
+        BOOKING_DOCUMENT,
+        q,
+        limit,
+    ).all()
+    return rows_response(rows, fields)
 
 
 @router.get(
@@ -130,16 +171,46 @@ def list_bookings(
 )
 def get_booking(
     booking_id: int,
+    fields: Tuple[str, ...] = Depends(booking_fields),
+    balance: bool = include_balance,
     db: Session = Depends(get_db),
     current_user: Guest = Depends(get_current_user),
 ):
-    booking = db.query(Booking).filter(Booking.id == booking_id).first()
-    if not booking:
+    query = db.query(*schema_columns(Booking, fields))
+    if balance:
+        query = with_balance(query, [booking_id])
+        fields += BALANCE_FIELDS
+
+    row = query.filter(Booking.id == booking_id).first()
+    if not row:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Booking not found",
         )
-    return booking
+    return row_response(row, fields)
+
+
+@router.get(
+    "/{booking_id}/balance",
+    response_model=BookingBalanceOut,
+    summary="Paid total and outstanding balance of a booking (admin)",
+)
+def get_booking_balance(
+    booking_id: int,
+    db: Session = Depends(get_db),
+    current_user: Guest = Depends(get_current_user),
+):
+    row = (
+        with_balance(db.query(Booking.id, Booking.total_amount), [booking_id])
+        .filter(Booking.id == booking_id)
+        .first()
+    )
+    if not row:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Booking not found",
+        )
+    return row_response(row, BookingBalanceOut)
 
 
 @router.put(
@@ -153,14 +224,26 @@ def update_booking(
     db: Session = Depends(get_db),
     current_user: Guest = Depends(get_current_user),
 ):
-    booking = db.query(Booking).filter(Booking.id == booking_id).first()
+    booking = (
+        db.query(Booking)
+        .options(*BOOKING_PLAIN)
+        .filter(Booking.id == booking_id)
+        .first()
+    )
     if not booking:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Booking not found",
         )
 
-    for field, value in payload.model_dump(exclude_unset=True).items():
+    changes = payload.model_dump(exclude_unset=True)
+    if "check_in" in changes or "check_out" in changes:
+        check_stay_dates(
+            changes.get("check_in") or booking.check_in,
+            changes.get("check_out") or booking.check_out,
+        )
+
+    for field, value in changes.items():
         setattr(booking, field, value)
 
     db.commit()
@@ -179,7 +262,12 @@ def cancel_booking(
     db: Session = Depends(get_db),
     current_user: Guest = Depends(get_current_user),
 ):
-    booking = db.query(Booking).filter(Booking.id == booking_id).first()
+    booking = (
+        db.query(Booking)
+        .options(*BOOKING_PLAIN)
+        .filter(Booking.id == booking_id)
+        .first()
+    )
     if not booking:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
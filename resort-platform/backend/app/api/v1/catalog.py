@@ -0,0 +1,37 @@
+from fastapi import APIRouter, BackgroundTasks, Depends, Path
+from fastapi.responses import Response
+from sqlalchemy.orm import Session
+
+from app.db.session import get_read_db
+from app.services.catalog import CATALOG_DOCUMENTS, render_catalog
+from app.tasks.catalog import publish_catalog_snapshots
+
+router = APIRouter()
+
+
+def republish_catalog(background_tasks: BackgroundTasks) -> None:
+    """
+    Route dependency for admin writes to catalog data: refreshes the
+    static snapshots once the response has been sent. Failed requests
+    do not run background tasks, so nothing is published for them.
+    """
+    background_tasks.add_task(publish_catalog_snapshots)
+
+
+# -------------------------------------------------
+# Public Endpoints
+# -------------------------------------------------
+
+@router.get(
+    "/{name}",
+    summary="Public catalog document (rooms, dining, reviews)",
+)
+def get_catalog(
+    name: str = Path(pattern="^(" + "|".join(CATALOG_DOCUMENTS) + ")$"),
+    db: Session = Depends(get_read_db),
+):
+    """
+    Normally answered by nginx from the published snapshot; this renders
+    the same document live when no snapshot exists.
+    """
+    return Response(render_catalog(db, name), media_type="application/json")
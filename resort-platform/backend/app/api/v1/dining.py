@@ -1,9 +1,11 @@
-from typing import List
+from typing import List, Tuple
 
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
 
-from app.db.session import get_db
+from app.api.fields import sparse_fields
+from app.core.serialization import row_response, rows_response, schema_columns
+from app.db.session import get_db, get_read_db
 from app.models.dining import DiningItem
 from app.schemas.dining import (
     DiningCreate,
@@ -12,9 +14,12 @@ from app.schemas.dining import (
 )
 from app.models.guest import Guest
 from app.api.v1.auth import get_current_user
+from app.api.v1.catalog import republish_catalog
 
 router = APIRouter()
 
+dining_fields = sparse_fields(DiningOut)
+
 
 # -------------------------------------------------
 # Public Endpoints
@@ -26,16 +31,18 @@ router = APIRouter()
     summary="List dining items and meal plans",
 )
 def list_dining_items(
-    db: Session = Depends(get_db),
+    fields: Tuple[str, ...] = Depends(dining_fields),
+    db: Session = Depends(get_read_db),
 ):
     """
     Public endpoint to fetch all dining items and meal plans.
     """
-    return (
-        db.query(DiningItem)
+    rows = (
+        db.query(*schema_columns(DiningItem, fields))
         .order_by(DiningItem.display_order.asc())
         .all()
     )
+    return rows_response(rows, fields)
 
 
 @router.get(
@@ -45,15 +52,20 @@ def list_dining_items(
 )
 def get_dining_item(
     item_id: int,
-    db: Session = Depends(get_db),
+    fields: Tuple[str, ...] = Depends(dining_fields),
+    db: Session = Depends(get_read_db),
 ):
-    item = db.query(DiningItem).filter(DiningItem.id == item_id).first()
-    if not item:
+    row = (
+        db.query(*schema_columns(DiningItem, fields))
+        .filter(DiningItem.id == item_id)
+        .first()
+    )
+    if not row:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Dining item not found",
         )
-    return item
+    return row_response(row, fields)
 
 
 # -------------------------------------------------
@@ -65,6 +77,7 @@ def get_dining_item(
     response_model=DiningOut,
     status_code=status.HTTP_201_CREATED,
     summary="Create dining item (admin)",
+    dependencies=[Depends(republish_catalog)],
 )
 def create_dining_item(
     payload: DiningCreate,
@@ -92,6 +105,7 @@ def create_dining_item(
     "/{item_id}",
     response_model=DiningOut,
     summary="Update dining item (admin)",
+    dependencies=[Depends(republish_catalog)],
 )
 def update_dining_item(
     item_id: int,
@@ -119,6 +133,7 @@ def update_dining_item(
     "/{item_id}",
     status_code=status.HTTP_204_NO_CONTENT,
     summary="Delete dining item (admin)",
+    dependencies=[Depends(republish_catalog)],
 )
 def delete_dining_item(
     item_id: int,
@@ -1,13 +1,17 @@
 from typing import List
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.orm import Session
 
-from app.db.session import get_db
+from app.core.serialization import row_response, rows_response, schema_columns
+from app.db.session import get_db, get_read_db
 from app.models.guest import Guest
+from app.models.guest_stats import GuestStats
+from app.services.typeahead import GUEST_DOCUMENT, typeahead
 from app.schemas.guest import (
     GuestCreate,
     GuestOut,
+    GuestStatsOut,
     GuestUpdate,
 )
 from app.api.v1.auth import get_current_user
@@ -25,14 +29,83 @@ router = APIRouter()
     summary="List all guests (admin)",
 )
 def list_guests(
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user: Guest = Depends(get_current_user),
 ):
-    return (
-        db.query(Guest)
+    rows = (
+        db.query(*schema_columns(Guest, GuestOut))
         .order_by(Guest.created_at.desc())
         .all()
     )
+    return rows_response(rows, GuestOut)
+
+
+@router.get(
+    "/search",
+    response_model=List[GuestOut],
+    summary="Typeahead search by name, email or phone (admin)",
+)
+def search_guests(
+    q: str = Query(min_length=3, max_length=100),
+    limit: int = Query(default=10, ge=1, le=50),
+    db: Session = Depends(get_read_db),
+    current_user: Guest = Depends(get_current_user),
+):
+    rows = typeahead(
+        db.query(*schema_columns(Guest, GuestOut)),
+        GUEST_DOCUMENT,
+        q,
+        limit,
+    ).all()
+    return rows_response(rows, GuestOut)
+
+
+@router.get(
+    "/stats",
+    response_model=List[GuestStatsOut],
+    summary="Lifetime guest stats, top spenders first (admin)",
+)
+def list_guest_stats(
+    min_stays: int = Query(default=0, ge=0),
+    limit: int = Query(default=100, ge=1, le=1000),
+    db: Session = Depends(get_read_db),
+    current_user: Guest = Depends(get_current_user),
+):
+    """
+    Reads the precomputed guest_stats rows; `min_stays=2` lists repeat
+    guests.
+    """
+    rows = (
+        db.query(*schema_columns(GuestStats, GuestStatsOut))
+        .filter(GuestStats.stays >= min_stays)
+        .order_by(GuestStats.paid_total.desc(), GuestStats.guest_id.asc())
+        .limit(limit)
+        .all()
+    )
+    return rows_response(rows, GuestStatsOut)
+
+
+@router.get(
+    "/{guest_id}/stats",
+    response_model=GuestStatsOut,
+    summary="Lifetime stats for a guest (admin)",
+)
+def get_guest_stats(
+    guest_id: int,
+    db: Session = Depends(get_read_db),
+    current_user: Guest = Depends(get_current_user),
+):
+    row = (
+        db.query(*schema_columns(GuestStats, GuestStatsOut))
+        .filter(GuestStats.guest_id == guest_id)
+        .first()
+    )
+    if not row:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Guest not found",
+        )
+    return row_response(row, GuestStatsOut)
 
 
 @router.get(
@@ -42,7 +115,7 @@ def list_guests(
 )
 def get_guest(
     guest_id: int,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user: Guest = Depends(get_current_user),
 ):
     guest = db.query(Guest).filter(Guest.id == guest_id).first()
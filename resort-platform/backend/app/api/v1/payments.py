@@ -1,9 +1,26 @@
+import io
+from dataclasses import asdict
 from typing import List
 from datetime import datetime
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import (
+    APIRouter,
+    Depends,
+    File,
+    Header,
+    HTTPException,
+    Path,
+    Request,
+    Response,
+    UploadFile,
+    status,
+)
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
 
+from app.core.config import settings
+from app.core.serialization import rows_response, schema_columns
+from app.db.loaders import PAYMENT_PLAIN
 from app.db.session import get_db
 from app.models.payment import Payment
 from app.models.booking import Booking
@@ -12,11 +29,16 @@ from app.schemas.payment import (
     PaymentCreate,
     PaymentOut,
     PaymentUpdate,
+    ReconciliationOut,
 )
+from app.services.payment_events import enqueue_payment_event, verify_signature
+from app.services.reconciliation import reconcile_settlement
 from app.api.v1.auth import get_current_user
 
 router = APIRouter()
 
+RECONCILIATION_SAMPLE_SIZE = 100
+
 
 # -------------------------------------------------
 # Public Endpoints
@@ -32,8 +54,12 @@ def create_payment(
     payload: PaymentCreate,
     db: Session = Depends(get_db),
 ):
-    booking = db.query(Booking).filter(Booking.id == payload.booking_id).first()
-    if not booking:
+    booking_exists = (
+        db.query(Booking.id)
+        .filter(Booking.id == payload.booking_id)
+        .first()
+    )
+    if not booking_exists:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Booking not found",
@@ -61,6 +87,39 @@ def create_payment(
     return payment
 
 
+@router.post(
+    "/webhooks/{provider}",
+    status_code=status.HTTP_202_ACCEPTED,
+    response_class=Response,
+    summary="Payment gateway webhook",
+)
+async def payment_webhook(
+    request: Request,
+    provider: str = Path(max_length=50, pattern=r"^[a-z0-9_-]+$"),
+    x_signature: str | None = Header(default=None),
+    db: Session = Depends(get_db),
+):
+    """
+    Verifies the HMAC signature and stores the raw event; status changes
+    are applied asynchronously by `python -m app.tasks.payment_events`.
+    """
+    if not settings.PAYMENT_WEBHOOK_SECRET:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Payment webhooks are not configured",
+        )
+
+    body = await request.body()
+    if not verify_signature(settings.PAYMENT_WEBHOOK_SECRET, body, x_signature):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid signature",
+        )
+
+    await run_in_threadpool(enqueue_payment_event, db, provider, body)
+    return Response(status_code=status.HTTP_202_ACCEPTED)
+
+
 # -------------------------------------------------
 # Admin Endpoints
 # -------------------------------------------------
@@ -74,11 +133,42 @@ def list_payments(
     db: Session = Depends(get_db),
     current_user: Guest = Depends(get_current_user),
 ):
-    return (
-        db.query(Payment)
+    rows = (
+        db.query(*schema_columns(Payment, PaymentOut))
         .order_by(Payment.created_at.desc())
         .all()
     )
+    return rows_response(rows, PaymentOut)
+
+
+@router.post(
+    "/reconcile",
+    response_model=ReconciliationOut,
+    summary="Reconcile a gateway settlement file (admin)",
+)
+def reconcile_payments(
+    settlement: UploadFile = File(...),
+    db: Session = Depends(get_db),
+    current_user: Guest = Depends(get_current_user),
+):
+    """
+    Settlement CSV with `reference_id`, `status`, `amount` and optional
+    `settled_at` columns. The upload is spooled to disk and read in
+    chunks.
+    """
+    sample = []
+
+    def on_mismatch(item) -> None:
+        if len(sample) < RECONCILIATION_SAMPLE_SIZE:
+            sample.append(asdict(item))
+
+    lines = io.TextIOWrapper(settlement.file, encoding="utf-8-sig", newline="")
+    try:
+        report = reconcile_settlement(db, lines, on_mismatch)
+    finally:
+        lines.detach()
+
+    return ReconciliationOut(**asdict(report), sample=sample)
 
 
 @router.get(
@@ -91,7 +181,12 @@ def get_payment(
     db: Session = Depends(get_db),
     current_user: Guest = Depends(get_current_user),
 ):
-    payment = db.query(Payment).filter(Payment.id == payment_id).first()
+    payment = (
+        db.query(Payment)
+        .options(*PAYMENT_PLAIN)
+        .filter(Payment.id == payment_id)
+        .first()
+    )
     if not payment:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -111,7 +206,12 @@ def update_payment(
     db: Session = Depends(get_db),
     current_user: Guest = Depends(get_current_user),
 ):
-    payment = db.query(Payment).filter(Payment.id == payment_id).first()
+    payment = (
+        db.query(Payment)
+        .options(*PAYMENT_PLAIN)
+        .filter(Payment.id == payment_id)
+        .first()
+    )
     if not payment:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -4,16 +4,23 @@ from typing import List
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
 
-from app.db.session import get_db
+from app.core.serialization import FastJSONResponse
+from app.db.session import get_db, get_read_db
 from app.models.pricing import PricingRule
 from app.models.room import Room
 from app.schemas.pricing import (
     PricingCreate,
     PricingOut,
     PricingUpdate,
+    RateGridOut,
 )
 from app.models.guest import Guest
 from app.api.v1.auth import get_current_user
+from app.services.pricing_engine import (
+    RATE_GRID_MAX_NIGHTS,
+    calculate_total_price,
+    rate_grid,
+)
 
 router = APIRouter()
 
@@ -62,33 +69,14 @@ def calculate_price(
             detail="Invalid date range",
         )
 
-    room = db.query(Room).filter(Room.id == room_id).first()
-    if not room:
+    try:
+        total_price = calculate_total_price(db, room_id, check_in, check_out)
+    except ValueError:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Room not found",
         )
 
-    rules = (
-        db.query(PricingRule)
-        .filter(PricingRule.room_id == room_id)
-        .all()
-    )
-
-    total_price = 0
-    current_date = check_in
-
-    while current_date < check_out:
-        daily_price = room.base_price
-
-        for rule in rules:
-            if rule.start_date <= current_date <= rule.end_date:
-                daily_price = rule.price
-                break
-
-        total_price += daily_price
-        current_date = current_date.fromordinal(current_date.toordinal() + 1)
-
     return {
         "room_id": room_id,
         "check_in": check_in,
@@ -102,6 +90,32 @@ def calculate_price(
 # Admin Endpoints
 # -------------------------------------------------
 
+@router.get(
+    "/grid",
+    response_model=RateGridOut,
+    summary="Nightly rates of all active rooms for a date window (admin)",
+)
+def get_rate_grid(
+    start: date,
+    end: date,
+    occupancy: bool = False,
+    db: Session = Depends(get_read_db),
+    current_user: Guest = Depends(get_current_user),
+):
+    if start >= end:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid date range",
+        )
+    if (end - start).days > RATE_GRID_MAX_NIGHTS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Date range exceeds {RATE_GRID_MAX_NIGHTS} nights",
+        )
+
+    return FastJSONResponse(rate_grid(db, start, end, occupancy))
+
+
 @router.post(
     "/",
     response_model=PricingOut,
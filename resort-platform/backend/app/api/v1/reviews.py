@@ -1,22 +1,46 @@
-from typing import List
+from typing import List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy import func
 from sqlalchemy.orm import Session
 
-from app.db.session import get_db
-from app.models.review import Review
+from app.core.serialization import rows_response, schema_columns
+from app.db.loaders import REVIEW_PLAIN
+from app.db.session import get_db, get_read_db
+from app.models.review import SEARCH_CONFIG, Review
 from app.models.booking import Booking
 from app.models.guest import Guest
 from app.schemas.review import (
+    ReviewBulkAction,
+    ReviewBulkResult,
     ReviewCreate,
     ReviewOut,
+    ReviewSearchHit,
     ReviewUpdate,
 )
 from app.api.v1.auth import get_current_user
+from app.api.v1.catalog import republish_catalog
 
 router = APIRouter()
 
 
+def _search(db: Session, q: str, limit: int, approved: Optional[bool]):
+    """
+    Rank reviews against a web-style query (quoted phrases, OR, -term)
+    using the GIN-indexed `search_vector`.
+    """
+    query = func.websearch_to_tsquery(SEARCH_CONFIG, q)
+    rank = func.ts_rank_cd(Review.search_vector, query)
+
+    rows = db.query(*schema_columns(Review, ReviewOut), rank.label("rank")).filter(
+        Review.search_vector.op("@@")(query)
+    )
+    if approved is not None:
+        rows = rows.filter(Review.is_approved.is_(approved))
+
+    return rows.order_by(rank.desc(), Review.id.desc()).limit(limit).all()
+
+
 # -------------------------------------------------
 # Public Endpoints
 # -------------------------------------------------
@@ -27,17 +51,31 @@ router = APIRouter()
     summary="List approved reviews",
 )
 def list_reviews(
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ):
     """
     Returns only approved reviews for public display.
     """
-    return (
-        db.query(Review)
+    rows = (
+        db.query(*schema_columns(Review, ReviewOut))
         .filter(Review.is_approved.is_(True))
         .order_by(Review.created_at.desc())
         .all()
     )
+    return rows_response(rows, ReviewOut)
+
+
+@router.get(
+    "/search",
+    response_model=List[ReviewSearchHit],
+    summary="Search approved reviews",
+)
+def search_reviews(
+    q: str = Query(min_length=1, max_length=200),
+    limit: int = Query(default=20, ge=1, le=100),
+    db: Session = Depends(get_read_db),
+):
+    return rows_response(_search(db, q, limit, approved=True), ReviewSearchHit)
 
 
 @router.post(
@@ -55,15 +93,19 @@ def create_review(
     Reviews are unapproved by default and require admin moderation.
     """
 
-    booking = db.query(Booking).filter(Booking.id == payload.booking_id).first()
-    if not booking:
+    booking_exists = (
+        db.query(Booking.id)
+        .filter(Booking.id == payload.booking_id)
+        .first()
+    )
+    if not booking_exists:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Booking not found",
         )
 
     existing = (
-        db.query(Review)
+        db.query(Review.id)
         .filter(Review.booking_id == payload.booking_id)
         .first()
     )
@@ -98,20 +140,108 @@ def create_review(
     summary="List all reviews (admin)",
 )
 def list_all_reviews(
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user: Guest = Depends(get_current_user),
 ):
-    return (
-        db.query(Review)
+    rows = (
+        db.query(*schema_columns(Review, ReviewOut))
         .order_by(Review.created_at.desc())
         .all()
     )
+    return rows_response(rows, ReviewOut)
+
+
+@router.get(
+    "/admin/search",
+    response_model=List[ReviewSearchHit],
+    summary="Search all reviews (admin)",
+)
+def search_all_reviews(
+    q: str = Query(min_length=1, max_length=200),
+    approved: Optional[bool] = None,
+    limit: int = Query(default=50, ge=1, le=200),
+    db: Session = Depends(get_read_db),
+    current_user: Guest = Depends(get_current_user),
+):
+    return rows_response(_search(db, q, limit, approved), ReviewSearchHit)
+
+
+@router.get(
+    "/admin/pending",
+    response_model=List[ReviewOut],
+    summary="Moderation queue (admin)",
+)
+def list_pending_reviews(
+    after_id: int = Query(default=0, ge=0),
+    limit: int = Query(default=50, ge=1, le=200),
+    db: Session = Depends(get_db),
+    current_user: Guest = Depends(get_current_user),
+):
+    """
+    Unapproved reviews, oldest first, one page at a time.
+    Pass the last `id` of a page as `after_id` to fetch the next one.
+    """
+    rows = (
+        db.query(*schema_columns(Review, ReviewOut))
+        .filter(Review.is_approved.is_(False), Review.id > after_id)
+        .order_by(Review.id.asc())
+        .limit(limit)
+        .all()
+    )
+    return rows_response(rows, ReviewOut)
+
+
+@router.post(
+    "/admin/approve",
+    response_model=ReviewBulkResult,
+    summary="Approve reviews in bulk (admin)",
+    dependencies=[Depends(republish_catalog)],
+)
+def approve_reviews(
+    payload: ReviewBulkAction,
+    db: Session = Depends(get_db),
+    current_user: Guest = Depends(get_current_user),
+):
+    affected = (
+        db.query(Review)
+        .filter(Review.id.in_(payload.ids), Review.is_approved.is_(False))
+        .update({Review.is_approved: True}, synchronize_session=False)
+    )
+    db.commit()
+
+    return ReviewBulkResult(affected=affected)
+
+
+@router.post(
+    "/admin/reject",
+    response_model=ReviewBulkResult,
+    summary="Reject pending reviews in bulk (admin)",
+    dependencies=[Depends(republish_catalog)],
+)
+def reject_reviews(
+    payload: ReviewBulkAction,
+    db: Session = Depends(get_db),
+    current_user: Guest = Depends(get_current_user),
+):
+    """
+    Deletes the given reviews if they are still pending; approved
+    reviews are left alone.
+    """
+    affected = (
+        db.query(Review)
+        .filter(Review.id.in_(payload.ids), Review.is_approved.is_(False))
+        .delete(synchronize_session=False)
+    )
+    db.commit()
+
+    return ReviewBulkResult(affected=affected)
 
 
 @router.put(
     "/{review_id}",
     response_model=ReviewOut,
     summary="Update or approve review (admin)",
+    dependencies=[Depends(republish_catalog)],
 )
 def update_review(
     review_id: int,
@@ -119,7 +249,12 @@ def update_review(
     db: Session = Depends(get_db),
     current_user: Guest = Depends(get_current_user),
 ):
-    review = db.query(Review).filter(Review.id == review_id).first()
+    review = (
+        db.query(Review)
+        .options(*REVIEW_PLAIN)
+        .filter(Review.id == review_id)
+        .first()
+    )
     if not review:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -139,6 +274,7 @@ def update_review(
     "/{review_id}",
     status_code=status.HTTP_204_NO_CONTENT,
     summary="Delete review (admin)",
+    dependencies=[Depends(republish_catalog)],
 )
 def delete_review(
     review_id: int,
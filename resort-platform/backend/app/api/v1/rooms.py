@@ -1,10 +1,15 @@
-from typing import List
+from datetime import date
+from decimal import Decimal
+from typing import List, Optional, Tuple
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.orm import Session
 
-from app.db.session import get_db
+from app.api.fields import sparse_fields
+from app.core.serialization import row_response, rows_response, schema_columns
+from app.db.session import get_db, get_read_db
 from app.models.room import Room
+from app.services.availability import overlapping_bookings
 from app.schemas.room import (
     RoomCreate,
     RoomOut,
@@ -12,9 +17,12 @@ from app.schemas.room import (
 )
 from app.models.guest import Guest
 from app.api.v1.auth import get_current_user
+from app.api.v1.catalog import republish_catalog
 
 router = APIRouter()
 
+room_fields = sparse_fields(RoomOut)
+
 
 # -------------------------------------------------
 # Public Endpoints
@@ -26,18 +34,76 @@ router = APIRouter()
     summary="List all active rooms",
 )
 def list_rooms(
-    db: Session = Depends(get_db),
+    fields: Tuple[str, ...] = Depends(room_fields),
+    db: Session = Depends(get_read_db),
 ):
     """
     Public endpoint to list rooms available for booking.
     Only rooms marked as active are returned.
     """
-    return (
-        db.query(Room)
+    rows = (
+        db.query(*schema_columns(Room, fields))
         .filter(Room.is_active.is_(True))
         .order_by(Room.display_order.asc())
         .all()
     )
+    return rows_response(rows, fields)
+
+
+@router.get(
+    "/search",
+    response_model=List[RoomOut],
+    summary="Search active rooms by amenities, capacity, price and dates",
+)
+def search_rooms(
+    amenities: Optional[str] = Query(
+        default=None,
+        description="Comma-separated amenities the room must all have, e.g. pool,sea_view",
+    ),
+    adults: int = Query(default=1, ge=1),
+    children: int = Query(default=0, ge=0),
+    min_price: Optional[Decimal] = Query(default=None, ge=0),
+    max_price: Optional[Decimal] = Query(default=None, ge=0),
+    check_in: Optional[date] = None,
+    check_out: Optional[date] = None,
+    fields: Tuple[str, ...] = Depends(room_fields),
+    db: Session = Depends(get_db),
+):
+    """
+    All filters are applied in one query: amenities through the GIN
+    index on rooms.amenities, availability as an anti-join against
+    confirmed bookings when both dates are given.
+    """
+    query = db.query(*schema_columns(Room, fields)).filter(
+        Room.is_active.is_(True),
+        Room.max_adults >= adults,
+        Room.max_children >= children,
+    )
+
+    wanted = [name.strip() for name in (amenities or "").split(",") if name.strip()]
+    if wanted:
+        query = query.filter(Room.amenities.contains({name: True for name in wanted}))
+
+    if min_price is not None:
+        query = query.filter(Room.base_price >= min_price)
+    if max_price is not None:
+        query = query.filter(Room.base_price <= max_price)
+
+    if (check_in is None) != (check_out is None):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="check_in and check_out must be given together",
+        )
+    if check_in is not None:
+        if check_in >= check_out:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Invalid date range",
+            )
+        query = query.filter(~overlapping_bookings(Room.id, check_in, check_out).exists())
+
+    rows = query.order_by(Room.display_order.asc()).all()
+    return rows_response(rows, fields)
 
 
 @router.get(
@@ -47,15 +113,20 @@ def list_rooms(
 )
 def get_room(
     room_id: int,
-    db: Session = Depends(get_db),
+    fields: Tuple[str, ...] = Depends(room_fields),
+    db: Session = Depends(get_read_db),
 ):
-    room = db.query(Room).filter(Room.id == room_id).first()
-    if not room or not room.is_active:
+    row = (
+        db.query(*schema_columns(Room, fields))
+        .filter(Room.id == room_id, Room.is_active.is_(True))
+        .first()
+    )
+    if not row:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Room not found",
         )
-    return room
+    return row_response(row, fields)
 
 
 # -------------------------------------------------
@@ -67,6 +138,7 @@ def get_room(
     response_model=RoomOut,
     status_code=status.HTTP_201_CREATED,
     summary="Create room (admin)",
+    dependencies=[Depends(republish_catalog)],
 )
 def create_room(
     payload: RoomCreate,
@@ -95,6 +167,7 @@ def create_room(
     "/{room_id}",
     response_model=RoomOut,
     summary="Update room (admin)",
+    dependencies=[Depends(republish_catalog)],
 )
 def update_room(
     room_id: int,
@@ -122,6 +195,7 @@ def update_room(
     "/{room_id}",
     status_code=status.HTTP_204_NO_CONTENT,
     summary="Delete room (admin)",
+    dependencies=[Depends(republish_catalog)],
 )
 def delete_room(
     room_id: int,
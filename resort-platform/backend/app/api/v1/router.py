@@ -9,6 +9,7 @@ from app.api.v1 import (
     guests,
     reviews,
     dining,
+    catalog,
 )
 
 api_router = APIRouter()
@@ -84,3 +85,12 @@ api_router.include_router(
     prefix="/dining",
     tags=["Dining"],
 )
+
+# ---------------------------------------
+# Public catalog (static snapshots)
+# ---------------------------------------
+api_router.include_router(
+    catalog.router,
+    prefix="/catalog",
+    tags=["Catalog"],
+)
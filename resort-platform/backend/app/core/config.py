@@ -1,4 +1,4 @@
-from typing import List
+from typing import Dict, List
 from pydantic import AnyHttpUrl, Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -33,12 +33,112 @@ class Settings(BaseSettings):
 
     DATABASE_URL: str | None = None
 
+    # Streaming replicas for get_read_db. A replica is used while its
+    # replay lag is below REPLICA_MAX_LAG_SECONDS; otherwise reads fall
+    # back to the primary.
+    DATABASE_REPLICA_URLS: List[str] = []
+    REPLICA_MAX_LAG_SECONDS: float = 5.0
+    REPLICA_LAG_CHECK_SECONDS: float = 2.0
+    REPLICA_CONNECT_TIMEOUT_SECONDS: int = 1
+
+    # Yearly bookings / payments partitions are kept created this many
+    # years past the current one (python -m app.tasks.partitions)
+    PARTITION_YEARS_AHEAD: int = 2
+
+    # -------------------------------------------------
+    # Pricing
+    # -------------------------------------------------
+    # Price quotes kept in memory per worker (app.services.pricing_engine)
+    PRICE_QUOTE_CACHE_SIZE: int = 10000
+
+    # Yield pricing (python -m app.tasks.yield_pricing, hourly). Each
+    # room-night's static rate is scaled by
+    #   1 + OCCUPANCY_WEIGHT * (occupancy - last year's occupancy)
+    #     + PICKUP_WEIGHT * pickup
+    # clamped to [MIN_FACTOR, MAX_FACTOR]. Suggestions are only stored
+    # unless YIELD_AUTO_APPLY, which makes them the quoted rates.
+    YIELD_HORIZON_DAYS: int = 365
+    YIELD_PICKUP_DAYS: int = 7
+    YIELD_OCCUPANCY_WEIGHT: float = 0.5
+    YIELD_PICKUP_WEIGHT: float = 1.0
+    YIELD_MIN_FACTOR: float = 0.8
+    YIELD_MAX_FACTOR: float = 1.5
+    YIELD_AUTO_APPLY: bool = False
+
+    # -------------------------------------------------
+    # Email & SMS delivery
+    # -------------------------------------------------
+    EMAIL_API_URL: str | None = None
+    EMAIL_API_KEY: str | None = None
+    EMAIL_FROM: str = "Resort Team <no-reply@resort.com>"
+    EMAIL_BATCH_SIZE: int = 100
+
+    SMS_API_URL: str | None = None
+    SMS_API_KEY: str | None = None
+    SMS_SENDER_ID: str = "RESORT"
+    SMS_BATCH_SIZE: int = 100
+
+    DELIVERY_MAX_CONNECTIONS: int = 20
+    DELIVERY_CONCURRENCY: int = 10
+    DELIVERY_TIMEOUT_SECONDS: float = 10.0
+    DELIVERY_MAX_ATTEMPTS: int = 4
+
+    # -------------------------------------------------
+    # Payment gateway webhooks
+    # -------------------------------------------------
+    # HMAC-SHA256 secret shared with the gateway; webhooks are rejected
+    # while unset
+    PAYMENT_WEBHOOK_SECRET: str | None = None
+    PAYMENT_EVENTS_BATCH_SIZE: int = 500
+    PAYMENT_EVENTS_POLL_SECONDS: float = 1.0
+
+    # -------------------------------------------------
+    # Static catalog snapshots
+    # -------------------------------------------------
+    # Directory nginx serves /api/v1/catalog/* from (shared volume);
+    # publishing is skipped while unset
+    CATALOG_DIR: str | None = None
+    CATALOG_LATEST_REVIEWS: int = 20
+
+    # -------------------------------------------------
+    # Booking archive
+    # -------------------------------------------------
+    # Completed / cancelled bookings that checked out more than
+    # ARCHIVE_AFTER_DAYS ago move, with their payments and reviews, to
+    # Parquet files here (python -m app.tasks.archive); skipped while unset
+    ARCHIVE_DIR: str | None = None
+    ARCHIVE_AFTER_DAYS: int = 3 * 365
+    ARCHIVE_BATCH_SIZE: int = 5000
+
     # -------------------------------------------------
     # Environment
     # -------------------------------------------------
     ENVIRONMENT: str = "development"
     DEBUG: bool = False
 
+    # -------------------------------------------------
+    # Logging
+    # -------------------------------------------------
+    LOG_LEVEL: str = "INFO"
+    LOG_JSON: bool = False
+    # Fraction of sub-WARNING records kept per logger prefix,
+    # e.g. {"sqlalchemy.engine": 0.05}
+    LOG_SAMPLING: Dict[str, float] = {}
+    LOG_QUEUE_SIZE: int = 10000
+
+    # -------------------------------------------------
+    # Metrics
+    # -------------------------------------------------
+    METRICS_ENABLED: bool = True
+
+    # -------------------------------------------------
+    # Query debugging (development only)
+    # -------------------------------------------------
+    QUERY_DEBUG: bool = False
+    QUERY_DEBUG_MAX_QUERIES: int = 20
+    QUERY_DEBUG_REPEAT_THRESHOLD: int = 5
+    QUERY_DEBUG_STRICT: bool = False
+
     model_config = SettingsConfigDict(
         env_file=".env",
         case_sensitive=True,
@@ -1,9 +1,20 @@
+import atexit
+import inspect
+import json
 import logging
+import queue
+import random
 import sys
-from typing import Optional
+import threading
+import traceback
+import uuid
+from contextvars import ContextVar
+from typing import Dict, Optional, TextIO
 
 from loguru import logger
 
+from app.core.config import settings
+
 # -------------------------------------------------
 # Configuration
 # -------------------------------------------------
@@ -15,6 +26,138 @@ LOG_FORMAT = (
     "<cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> - "
     "<level>{message}</level>"
 )
+JSON_FORMAT = "{extra[_json]}\n"
+
+REQUEST_ID_HEADER = b"x-request-id"
+
+# Correlation id of the request currently being served
+request_id_var: ContextVar[Optional[str]] = ContextVar("request_id", default=None)
+
+# Stdlib record being forwarded by InterceptHandler (same thread only)
+_forwarded = threading.local()
+
+
+# -------------------------------------------------
+# Record patching
+# -------------------------------------------------
+
+def _patch_record(record: dict) -> None:
+    """
+    Global loguru patcher.
+
+    Copies source location from the forwarded stdlib record (so no
+    frame walk is needed) and attaches the request id.
+    """
+    stdlib_record = getattr(_forwarded, "record", None)
+    if stdlib_record is not None:
+        record["name"] = stdlib_record.name
+        record["function"] = stdlib_record.funcName
+        record["line"] = stdlib_record.lineno
+
+    record["extra"].setdefault("request_id", request_id_var.get())
+
+
+def _patch_json(record: dict) -> None:
+    _patch_record(record)
+
+    payload = {
+        "ts": record["time"].isoformat(),
+        "level": record["level"].name,
+        "logger": record["name"],
+        "func": record["function"],
+        "line": record["line"],
+        "msg": record["message"],
+        "request_id": record["extra"]["request_id"],
+    }
+    if record["exception"] is not None:
+        exc_type, exc_value, exc_tb = record["exception"]
+        payload["exc"] = f"{exc_type.__name__}: {exc_value}"
+        payload["traceback"] = "".join(
+            traceback.format_exception(exc_type, exc_value, exc_tb)
+        )
+
+    record["extra"]["_json"] = json.dumps(payload, default=str)
+
+
+# -------------------------------------------------
+# Non-blocking sink
+# -------------------------------------------------
+
+class NonBlockingSink:
+    """
+    Loguru sink that hands messages to a writer thread through a
+    bounded queue. When the queue is full the message is dropped and
+    counted instead of stalling the request thread; messages the
+    stream fails to take are counted as errors.
+    """
+
+    def __init__(self, stream: TextIO, maxsize: int = 10_000) -> None:
+        self.stream = stream
+        self._dropped = 0
+        self._errors = 0
+        self._dropped_lock = threading.Lock()
+        self._queue: "queue.Queue[Optional[str]]" = queue.Queue(maxsize=maxsize)
+        self._thread = threading.Thread(
+            target=self._run,
+            name="log-writer",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def __call__(self, message: str) -> None:
+        try:
+            self._queue.put_nowait(message)
+        except queue.Full:
+            # Only taken on overflow, so the fast path stays lock-free
+            with self._dropped_lock:
+                self._dropped += 1
+
+    @property
+    def dropped(self) -> int:
+        """
+        Messages dropped because the queue was full.
+        """
+        with self._dropped_lock:
+            return self._dropped
+
+    @property
+    def errors(self) -> int:
+        """
+        Messages lost to a failed write or flush (e.g. a closed stream).
+        """
+        with self._dropped_lock:
+            return self._errors
+
+    def _run(self) -> None:
+        while True:
+            message = self._queue.get()
+            if message is None:
+                break
+            # The thread must outlive a bad write, or every later
+            # message would be lost without a trace
+            try:
+                self.stream.write(message)
+                if self._queue.empty():
+                    self.stream.flush()
+            except Exception:
+                with self._dropped_lock:
+                    self._errors += 1
+
+        try:
+            self.stream.flush()
+        except Exception:
+            pass
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """
+        Flush queued messages and stop the writer thread, giving up
+        after `timeout` seconds.
+        """
+        try:
+            self._queue.put(None, timeout=timeout)
+        except queue.Full:
+            return
+        self._thread.join(timeout=timeout)
 
 
 # -------------------------------------------------
@@ -25,16 +168,64 @@ class InterceptHandler(logging.Handler):
     """
     Redirects standard logging (logging module)
     to Loguru.
+
+    With `resolve_frames=False` the source location is taken from
+    the LogRecord itself instead of walking the stack. Records below
+    WARNING can be sampled per logger name (prefix match).
     """
 
+    def __init__(
+        self,
+        resolve_frames: bool = True,
+        sampling: Optional[Dict[str, float]] = None,
+    ) -> None:
+        super().__init__()
+        self.resolve_frames = resolve_frames
+        self.sampling = sampling or {}
+        self._rates: Dict[str, float] = {}
+        self._levels: Dict[int, object] = {}
+
+    def _sample_rate(self, name: str) -> float:
+        rate = self._rates.get(name)
+        if rate is None:
+            rate = 1.0
+            prefix = name
+            while prefix:
+                if prefix in self.sampling:
+                    rate = self.sampling[prefix]
+                    break
+                prefix = prefix.rpartition(".")[0]
+            self._rates[name] = rate
+        return rate
+
+    def _level(self, record: logging.LogRecord):
+        level = self._levels.get(record.levelno)
+        if level is None:
+            try:
+                level = logger.level(record.levelname).name
+            except ValueError:
+                level = record.levelno
+            self._levels[record.levelno] = level
+        return level
+
     def emit(self, record: logging.LogRecord) -> None:
-        try:
-            level = logger.level(record.levelname).name
-        except ValueError:
-            level = record.levelno
+        if self.sampling and record.levelno < logging.WARNING:
+            rate = self._sample_rate(record.name)
+            if rate < 1.0 and random.random() >= rate:
+                return
+
+        level = self._level(record)
 
-        frame, depth = logging.currentframe(), 2
-        while frame and frame.f_code.co_filename == logging.__file__:
+        if not self.resolve_frames:
+            _forwarded.record = record
+            try:
+                logger.opt(exception=record.exc_info).log(level, record.getMessage())
+            finally:
+                _forwarded.record = None
+            return
+
+        frame, depth = inspect.currentframe(), 0
+        while frame and (depth == 0 or frame.f_code.co_filename == logging.__file__):
             frame = frame.f_back
             depth += 1
 
@@ -44,21 +235,79 @@ class InterceptHandler(logging.Handler):
         ).log(level, record.getMessage())
 
 
+# -------------------------------------------------
+# Request id middleware
+# -------------------------------------------------
+
+class RequestIdMiddleware:
+    """
+    Pure ASGI middleware that takes the request id from the incoming
+    X-Request-ID header (or generates one), exposes it through
+    `request_id_var` and echoes it on the response.
+    """
+
+    def __init__(self, app) -> None:
+        self.app = app
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request_id = None
+        for name, value in scope["headers"]:
+            if name == REQUEST_ID_HEADER:
+                request_id = value.decode("latin-1")[:128]
+                break
+        if not request_id:
+            request_id = uuid.uuid4().hex
+
+        async def send_with_request_id(message) -> None:
+            if message["type"] == "http.response.start":
+                headers = list(message.get("headers", []))
+                headers.append((REQUEST_ID_HEADER, request_id.encode("latin-1")))
+                message["headers"] = headers
+            await send(message)
+
+        token = request_id_var.set(request_id)
+        try:
+            await self.app(scope, receive, send_with_request_id)
+        finally:
+            request_id_var.reset(token)
+
+
 # -------------------------------------------------
 # Setup function
 # -------------------------------------------------
 
+_sink: Optional[NonBlockingSink] = None
+
+
 def setup_logging(
     level: Optional[int] = None,
+    json_logs: Optional[bool] = None,
 ) -> None:
     """
     Configure Loguru and intercept standard logging.
 
     Call this once at application startup.
     """
+    global _sink
 
-    logging.root.handlers = [InterceptHandler()]
-    logging.root.setLevel(level or LOG_LEVEL)
+    level = level or logging.getLevelNamesMapping().get(
+        settings.LOG_LEVEL.upper(),
+        LOG_LEVEL,
+    )
+    json_logs = settings.LOG_JSON if json_logs is None else json_logs
+
+    # Location comes from the LogRecord, so no per-record frame walk
+    logging.root.handlers = [
+        InterceptHandler(
+            resolve_frames=False,
+            sampling=settings.LOG_SAMPLING,
+        )
+    ]
+    logging.root.setLevel(level)
 
     for logger_name in (
         "uvicorn",
@@ -72,11 +321,18 @@ def setup_logging(
         logging_logger.propagate = True
 
     logger.remove()
+    logger.configure(patcher=_patch_json if json_logs else _patch_record)
+
+    if _sink is None:
+        _sink = NonBlockingSink(sys.stdout, maxsize=settings.LOG_QUEUE_SIZE)
+        atexit.register(_sink.stop)
+
     logger.add(
-        sys.stdout,
-        level=level or LOG_LEVEL,
-        format=LOG_FORMAT,
-        enqueue=True,
+        _sink,
+        level=level,
+        # A callable format stops loguru appending tracebacks to JSON lines
+        format=(lambda _: JSON_FORMAT) if json_logs else LOG_FORMAT,
+        colorize=not json_logs and sys.stdout.isatty(),
         backtrace=False,
         diagnose=False,
     )
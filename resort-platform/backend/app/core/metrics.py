@@ -0,0 +1,289 @@
+import bisect
+import threading
+import time
+from contextvars import ContextVar
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+# -------------------------------------------------
+# Metric primitives
+# -------------------------------------------------
+# A deliberately small in-process registry rendering the Prometheus
+# text format. Every update is a dict lookup plus a few additions under
+# a per-metric lock, cheap enough to leave on in production.
+
+DEFAULT_BUCKETS = (
+    0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0,
+)
+
+LabelValues = Tuple[str, ...]
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(names: Iterable[str], values: Iterable[str]) -> str:
+    pairs = [
+        f'{name}="{_escape(str(value))}"'
+        for name, value in zip(names, values)
+    ]
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+class _Metric:
+    kind = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Tuple[str, ...] = ()) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = labelnames
+        self._lock = threading.Lock()
+
+    def _header(self) -> List[str]:
+        return [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.kind}",
+        ]
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self._values: Dict[LabelValues, float] = {}
+
+    def inc(self, labels: LabelValues = (), amount: float = 1.0) -> None:
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0.0) + amount
+
+    def render(self) -> List[str]:
+        lines = self._header()
+        with self._lock:
+            items = list(self._values.items())
+        for labels, value in items:
+            lines.append(f"{self.name}{_format_labels(self.labelnames, labels)} {value}")
+        return lines
+
+
+class Gauge(Counter):
+    kind = "gauge"
+
+    def dec(self, labels: LabelValues = (), amount: float = 1.0) -> None:
+        self.inc(labels, -amount)
+
+    def set(self, labels: LabelValues = (), value: float = 0.0) -> None:
+        with self._lock:
+            self._values[labels] = value
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(self, *args, buckets: Tuple[float, ...] = DEFAULT_BUCKETS, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.buckets = tuple(sorted(buckets))
+        # labels -> [bucket counts..., +Inf count, sum]
+        self._values: Dict[LabelValues, List[float]] = {}
+
+    def observe(self, value: float, labels: LabelValues = ()) -> None:
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._values.get(labels)
+            if series is None:
+                series = self._values[labels] = [0] * (len(self.buckets) + 2)
+            series[index] += 1
+            series[-1] += value
+
+    def render(self) -> List[str]:
+        lines = self._header()
+        with self._lock:
+            items = [(labels, list(series)) for labels, series in self._values.items()]
+
+        for labels, series in items:
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float("inf"),), series[:-1]):
+                cumulative += count
+                le = "+Inf" if bound == float("inf") else repr(bound)
+                label_str = _format_labels(self.labelnames + ("le",), labels + (le,))
+                lines.append(f"{self.name}_bucket{label_str} {cumulative}")
+            label_str = _format_labels(self.labelnames, labels)
+            lines.append(f"{self.name}_sum{label_str} {series[-1]}")
+            lines.append(f"{self.name}_count{label_str} {cumulative}")
+        return lines
+
+
+class Registry:
+    def __init__(self) -> None:
+        self._metrics: List[_Metric] = []
+
+    def register(self, metric: _Metric) -> _Metric:
+        self._metrics.append(metric)
+        return metric
+
+    def render(self) -> str:
+        lines: List[str] = []
+        for metric in self._metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+registry = Registry()
+
+# -------------------------------------------------
+# Application metrics
+# -------------------------------------------------
+
+UNMATCHED_ROUTE = "<unmatched>"
+BACKGROUND_ROUTE = "<background>"
+
+HTTP_REQUESTS = registry.register(Counter(
+    "http_requests_total",
+    "HTTP requests by route template and status code.",
+    ("method", "route", "status"),
+))
+HTTP_LATENCY = registry.register(Histogram(
+    "http_request_duration_seconds",
+    "HTTP request latency by route template.",
+    ("method", "route"),
+))
+HTTP_IN_PROGRESS = registry.register(Gauge(
+    "http_requests_in_progress",
+    "HTTP requests currently being served.",
+    ("method",),
+))
+DB_QUERIES = registry.register(Counter(
+    "db_queries_total",
+    "SQL statements executed, attributed to the serving route.",
+    ("route",),
+))
+DB_TIME = registry.register(Counter(
+    "db_query_seconds_total",
+    "Time spent executing SQL, attributed to the serving route.",
+    ("route",),
+))
+DB_READ_SESSIONS = registry.register(Counter(
+    "db_read_sessions_total",
+    "Read-only sessions by the database that served them.",
+    ("target",),
+))
+DB_REPLICA_LAG = registry.register(Gauge(
+    "db_replica_lag_seconds",
+    "Last measured replay lag per read replica (-1 when unreachable).",
+    ("replica",),
+))
+PRICE_QUOTE_LOOKUPS = registry.register(Counter(
+    "price_quote_cache_lookups_total",
+    "Price quote cache lookups by result (hit / miss).",
+    ("result",),
+))
+PRICE_QUOTE_EVICTIONS = registry.register(Counter(
+    "price_quote_cache_evictions_total",
+    "Price quotes dropped from the cache by reason (lru / invalidated).",
+    ("reason",),
+))
+DB_QUERIES_PER_REQUEST = registry.register(Histogram(
+    "http_request_db_queries",
+    "SQL statements per request.",
+    ("route",),
+    buckets=(1, 2, 5, 10, 20, 50, 100, 250),
+))
+
+
+# -------------------------------------------------
+# Per-request DB accounting
+# -------------------------------------------------
+
+class RequestDbStats:
+    __slots__ = ("queries", "seconds")
+
+    def __init__(self) -> None:
+        self.queries = 0
+        self.seconds = 0.0
+
+
+# Mutable stats object of the request being served. Sync endpoints run
+# in a worker thread with a copy of the context, which still points at
+# the same object.
+current_db_stats: ContextVar[Optional[RequestDbStats]] = ContextVar(
+    "current_db_stats",
+    default=None,
+)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_start", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    elapsed = time.perf_counter() - conn.info["query_start"].pop()
+
+    stats = current_db_stats.get()
+    if stats is None:
+        DB_QUERIES.inc((BACKGROUND_ROUTE,))
+        DB_TIME.inc((BACKGROUND_ROUTE,), elapsed)
+        return
+
+    stats.queries += 1
+    stats.seconds += elapsed
+
+
+def instrument_engine(engine: Engine) -> None:
+    """
+    Attach cursor execution hooks that feed the DB metrics.
+    """
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+
+
+# -------------------------------------------------
+# ASGI middleware
+# -------------------------------------------------
+
+class MetricsMiddleware:
+    """
+    Pure ASGI middleware recording latency, in-flight requests, status
+    codes and DB usage per route template (e.g. /api/v1/bookings/{booking_id}).
+    """
+
+    def __init__(self, app) -> None:
+        self.app = app
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        status_code = 500
+
+        async def send_with_status(message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        stats = RequestDbStats()
+        token = current_db_stats.set(stats)
+        HTTP_IN_PROGRESS.inc((method,))
+        start = time.perf_counter()
+
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            elapsed = time.perf_counter() - start
+            HTTP_IN_PROGRESS.dec((method,))
+            current_db_stats.reset(token)
+
+            # Templated path keeps label cardinality bounded
+            route_path = getattr(scope.get("route"), "path", UNMATCHED_ROUTE)
+
+            HTTP_REQUESTS.inc((method, route_path, str(status_code)))
+            HTTP_LATENCY.observe(elapsed, (method, route_path))
+            DB_QUERIES_PER_REQUEST.observe(stats.queries, (route_path,))
+            if stats.queries:
+                DB_QUERIES.inc((route_path,), stats.queries)
+                DB_TIME.inc((route_path,), stats.seconds)
@@ -0,0 +1,237 @@
+import re
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, List, Optional
+
+from loguru import logger
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from starlette.routing import Match
+
+from app.core.config import settings
+
+# -------------------------------------------------
+# Statement fingerprinting
+# -------------------------------------------------
+
+_WHITESPACE = re.compile(r"\s+")
+_PARAM_LIST = re.compile(r"\((?:\s*(?:%\([^)]+\)s|\?|\$\d+|:\w+)\s*,?)+\)")
+_NUMBER = re.compile(r"\b\d+\b")
+_STRING = re.compile(r"'(?:[^']|'')*'")
+
+
+def fingerprint(statement: str) -> str:
+    """
+    Normalize a SQL statement so that executions differing only in
+    parameters (including expanded IN lists) share one fingerprint.
+    """
+    statement = _WHITESPACE.sub(" ", statement.strip())
+    statement = _STRING.sub("?", statement)
+    statement = _NUMBER.sub("?", statement)
+    return _PARAM_LIST.sub("(?)", statement)
+
+
+class QueryBudgetExceeded(RuntimeError):
+    """
+    Raised in strict mode when a request runs too many statements
+    or repeats one statement shape (the N+1 pattern).
+    """
+
+
+# -------------------------------------------------
+# Tracker
+# -------------------------------------------------
+
+class QueryTracker:
+    """
+    Counts statements and their fingerprints for one unit of work
+    (a request or a test block).
+    """
+
+    def __init__(
+        self,
+        label: str = "",
+        max_queries: Optional[int] = None,
+        repeat_threshold: Optional[int] = None,
+        strict: bool = False,
+    ) -> None:
+        self.label = label
+        self.max_queries = max_queries
+        self.repeat_threshold = repeat_threshold
+        self.strict = strict
+        self.count = 0
+        self.fingerprints: Counter = Counter()
+
+    def record(self, statement: str) -> None:
+        self.count += 1
+        key = fingerprint(statement)
+        self.fingerprints[key] += 1
+
+        if not self.strict:
+            return
+        if self.max_queries is not None and self.count > self.max_queries:
+            raise QueryBudgetExceeded(self.describe())
+        if (
+            self.repeat_threshold is not None
+            and self.fingerprints[key] >= self.repeat_threshold
+        ):
+            raise QueryBudgetExceeded(self.describe())
+
+    def repeated(self) -> List[tuple]:
+        threshold = self.repeat_threshold or 2
+        return [
+            (statement, n)
+            for statement, n in self.fingerprints.most_common()
+            if n >= threshold
+        ]
+
+    def violations(self) -> bool:
+        over_budget = self.max_queries is not None and self.count > self.max_queries
+        return over_budget or bool(self.repeat_threshold and self.repeated())
+
+    def describe(self) -> str:
+        lines = [f"{self.label or 'block'} ran {self.count} statements"]
+        if self.max_queries is not None:
+            lines[0] += f" (budget {self.max_queries})"
+        for statement, n in self.repeated()[:5]:
+            lines.append(f"  {n}x {statement[:200]}")
+        return "\n".join(lines)
+
+
+# -------------------------------------------------
+# Per-route statement budgets
+# -------------------------------------------------
+# Keyed by "METHOD route-template". Admin routes include the
+# statement issued by the get_current_user dependency.
+
+QUERY_BUDGETS = {
+    "GET /api/v1/auth/me": 1,
+    "GET /api/v1/rooms/": 1,
+    "GET /api/v1/rooms/search": 1,
+    "GET /api/v1/rooms/{room_id}": 1,
+    "GET /api/v1/catalog/{name}": 2,
+    "POST /api/v1/bookings/": 8,
+    "GET /api/v1/bookings/": 2,
+    "GET /api/v1/bookings/search": 2,
+    "GET /api/v1/bookings/{booking_id}": 2,
+    "GET /api/v1/bookings/{booking_id}/balance": 2,
+    "GET /api/v1/pricing/room/{room_id}": 2,
+    "GET /api/v1/pricing/room/{room_id}/price": 2,
+    "GET /api/v1/pricing/grid": 2,
+    "POST /api/v1/payments/": 6,
+    "POST /api/v1/payments/webhooks/{provider}": 1,
+    "GET /api/v1/payments/": 2,
+    "GET /api/v1/payments/{payment_id}": 2,
+    "GET /api/v1/guests/": 2,
+    "GET /api/v1/guests/search": 2,
+    "GET /api/v1/guests/stats": 2,
+    "GET /api/v1/guests/{guest_id}/stats": 2,
+    "GET /api/v1/guests/{guest_id}": 2,
+    "GET /api/v1/reviews/": 1,
+    "GET /api/v1/reviews/admin": 2,
+    "GET /api/v1/reviews/search": 1,
+    "GET /api/v1/reviews/admin/search": 2,
+    "GET /api/v1/reviews/admin/pending": 2,
+    "POST /api/v1/reviews/admin/approve": 2,
+    "POST /api/v1/reviews/admin/reject": 2,
+    "GET /api/v1/dining/": 1,
+    "GET /api/v1/dining/{item_id}": 1,
+}
+
+
+def route_budget(method: str, route_path: str) -> Optional[int]:
+    return QUERY_BUDGETS.get(f"{method} {route_path}")
+
+
+def match_route(scope) -> Optional[str]:
+    """
+    Route template the application will dispatch `scope` to, resolved
+    ahead of the router (which only sets scope["route"] on the way in
+    to the handler).
+    """
+    router = getattr(scope.get("app"), "router", None)
+    for route in getattr(router, "routes", ()):
+        match, _ = route.matches(scope)
+        if match == Match.FULL:
+            return route.path
+    return None
+
+
+current_tracker: ContextVar[Optional[QueryTracker]] = ContextVar(
+    "current_query_tracker",
+    default=None,
+)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    tracker = current_tracker.get()
+    if tracker is not None:
+        tracker.record(statement)
+
+
+def enable_query_debug(engine: Engine) -> None:
+    """
+    Attach the statement counter to the engine (idempotent).
+    """
+    if not event.contains(engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+
+
+@contextmanager
+def track_queries(
+    label: str = "",
+    max_queries: Optional[int] = None,
+    repeat_threshold: Optional[int] = None,
+    strict: bool = False,
+) -> Iterator[QueryTracker]:
+    """
+    Track statements executed inside the block.
+    """
+    tracker = QueryTracker(label, max_queries, repeat_threshold, strict)
+    token = current_tracker.set(tracker)
+    try:
+        yield tracker
+    finally:
+        current_tracker.reset(token)
+
+
+# -------------------------------------------------
+# ASGI middleware (development only)
+# -------------------------------------------------
+
+class QueryDebugMiddleware:
+    """
+    Counts statements per request and reports requests that exceed
+    QUERY_DEBUG_MAX_QUERIES or repeat one statement shape
+    QUERY_DEBUG_REPEAT_THRESHOLD times; routes listed in QUERY_BUDGETS
+    use their own budget instead. With QUERY_DEBUG_STRICT the offending
+    statement raises instead.
+    """
+
+    def __init__(self, app) -> None:
+        self.app = app
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        # Resolved up front so strict mode enforces the route's own budget
+        route_path = match_route(scope)
+        budget = None
+        if route_path is not None:
+            budget = route_budget(scope["method"], route_path)
+        if budget is None:
+            budget = settings.QUERY_DEBUG_MAX_QUERIES
+
+        with track_queries(
+            label=f"{scope['method']} {route_path or scope['path']}",
+            max_queries=budget,
+            repeat_threshold=settings.QUERY_DEBUG_REPEAT_THRESHOLD,
+            strict=settings.QUERY_DEBUG_STRICT,
+        ) as tracker:
+            await self.app(scope, receive, send)
+
+        if tracker.violations():
+            logger.warning("Query budget exceeded: {}", tracker.describe())
@@ -0,0 +1,63 @@
+from decimal import Decimal
+from typing import Any, List, Sequence, Tuple, Type, Union
+
+import orjson
+from fastapi.responses import Response
+from pydantic import BaseModel
+
+# -------------------------------------------------
+# Fast JSON response path
+# -------------------------------------------------
+# List endpoints select plain row tuples for exactly the columns of the
+# response schema and encode them with orjson. Rows read from our own
+# tables are trusted, so the ORM object -> Pydantic validation ->
+# jsonable_encoder round trip is skipped. Output matches what FastAPI
+# produces for the same `*Out` schema (Decimal as string, ISO dates).
+
+
+def _default(value: Any) -> Any:
+    if isinstance(value, Decimal):
+        return str(value)
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+
+
+def dumps(content: Any) -> bytes:
+    return orjson.dumps(content, default=_default, option=orjson.OPT_NON_STR_KEYS)
+
+
+class FastJSONResponse(Response):
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
+
+
+FieldSpec = Union[Type[BaseModel], Sequence[str]]
+
+
+def field_names(fields: FieldSpec) -> Tuple[str, ...]:
+    """
+    Field names of a response schema, or an explicit (sparse) field list.
+    """
+    if isinstance(fields, type) and issubclass(fields, BaseModel):
+        return tuple(fields.model_fields)
+    return tuple(fields)
+
+
+def schema_columns(model: type, fields: FieldSpec) -> List:
+    """
+    ORM columns backing `fields`, in field order.
+    """
+    return [getattr(model, name) for name in field_names(fields)]
+
+
+def rows_response(rows: Sequence, fields: FieldSpec) -> FastJSONResponse:
+    """
+    Encode rows selected with `schema_columns(model, fields)`.
+    """
+    keys = field_names(fields)
+    return FastJSONResponse([dict(zip(keys, row)) for row in rows])
+
+
+def row_response(row: Sequence, fields: FieldSpec) -> FastJSONResponse:
+    return FastJSONResponse(dict(zip(field_names(fields), row)))
@@ -19,3 +19,8 @@ from app.models.payment import Payment  # noqa
 from app.models.pricing import PricingRule  # noqa
 from app.models.review import Review  # noqa
 from app.models.dining import DiningItem  # noqa
+from app.models.guest_stats import GuestStats  # noqa
+from app.models.payment_event import PaymentEvent, PaymentEventKey  # noqa
+from app.models.revenue import RevenueLedger  # noqa
+from app.models.archive import ArchiveBatch, ArchivedGuestStats, ArchivedRevenue  # noqa
+from app.models.yield_rate import YieldRate  # noqa
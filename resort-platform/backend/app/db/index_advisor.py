@@ -0,0 +1,202 @@
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import List, Optional
+
+from sqlalchemy import text
+from sqlalchemy.engine import Connection
+
+# -------------------------------------------------
+# Index advisor
+# -------------------------------------------------
+# Reads the cumulative statistics views (pg_stat_user_indexes /
+# pg_stat_user_tables, and pg_stat_statements when installed) and the
+# catalog. Counters are per server and since the last stats reset, so
+# an index unused on the primary may still serve replica reads: run it
+# against every server (python -m app.tasks.index_advisor does).
+#
+# Partitions are folded into their partitioned table / index, so
+# bookings_y2025_overlap counts towards idx_bookings_overlap.
+
+# Every table and index of the current schema with the top-level
+# (non-partition) relation it belongs to
+_TREE = """
+    WITH RECURSIVE tree AS (
+        SELECT c.oid AS root, c.oid AS rel
+        FROM pg_class c
+        JOIN pg_namespace n ON n.oid = c.relnamespace
+        WHERE n.nspname = current_schema()
+          AND c.relkind IN ('r', 'p', 'i', 'I')
+          AND NOT EXISTS (SELECT 1 FROM pg_inherits h WHERE h.inhrelid = c.oid)
+        UNION ALL
+        SELECT tree.root, h.inhrelid
+        FROM tree
+        JOIN pg_inherits h ON h.inhparent = tree.rel
+    )
+"""
+
+UNUSED_SQL = text(
+    _TREE
+    + """
+    SELECT
+        i.indexrelid::regclass::text AS index,
+        i.indrelid::regclass::text AS table,
+        sum(coalesce(s.idx_scan, 0)) AS scans,
+        sum(pg_relation_size(tree.rel)) AS bytes
+    FROM tree
+    JOIN pg_index i ON i.indexrelid = tree.root
+    LEFT JOIN pg_stat_user_indexes s ON s.indexrelid = tree.rel
+    -- Unique / primary key / constraint indexes are needed unscanned
+    WHERE NOT i.indisunique
+      AND NOT EXISTS (SELECT 1 FROM pg_constraint WHERE conindid = i.indexrelid)
+    GROUP BY 1, 2
+    HAVING sum(coalesce(s.idx_scan, 0)) = 0
+    ORDER BY bytes DESC, 1
+    """
+)
+
+# Same table, method, predicate and opclasses, and the key columns of
+# `index` are a leading prefix of (or equal to) those of `covered_by`
+REDUNDANT_SQL = text(
+    _TREE
+    + """
+    SELECT
+        a.indexrelid::regclass::text AS index,
+        b.indexrelid::regclass::text AS covered_by,
+        a.indrelid::regclass::text AS table
+    FROM pg_index a
+    JOIN pg_index b ON b.indrelid = a.indrelid AND b.indexrelid <> a.indexrelid
+    JOIN pg_class ca ON ca.oid = a.indexrelid
+    JOIN pg_class cb ON cb.oid = b.indexrelid
+    WHERE a.indexrelid IN (SELECT root FROM tree)
+      AND ca.relam = cb.relam
+      AND NOT a.indisunique
+      AND a.indexprs IS NULL
+      AND b.indexprs IS NULL
+      AND coalesce(pg_get_expr(a.indpred, a.indrelid), '')
+          = coalesce(pg_get_expr(b.indpred, b.indrelid), '')
+      AND b.indkey::text || ' ' LIKE a.indkey::text || ' %'
+      AND b.indclass::text || ' ' LIKE a.indclass::text || ' %'
+      -- Of two identical plain indexes, report one
+      AND (b.indisunique OR a.indkey::text <> b.indkey::text OR a.indexrelid > b.indexrelid)
+    ORDER BY 3, 1
+    """
+)
+
+SEQ_SCANNED_SQL = text(
+    _TREE
+    + """
+    SELECT
+        tree.root::regclass::text AS table,
+        sum(s.seq_scan) AS seq_scans,
+        sum(s.seq_tup_read) / nullif(sum(s.seq_scan), 0) AS rows_per_scan,
+        sum(coalesce(s.idx_scan, 0)) AS index_scans,
+        sum(s.n_live_tup) AS live_rows
+    FROM tree
+    JOIN pg_stat_user_tables s ON s.relid = tree.rel
+    GROUP BY 1
+    HAVING sum(s.n_live_tup) >= :min_rows
+       AND sum(s.seq_scan) >= :min_seq_scans
+       AND sum(s.seq_tup_read) / nullif(sum(s.seq_scan), 0) >= :min_rows
+    ORDER BY sum(s.seq_tup_read) DESC
+    """
+)
+
+STATEMENTS_SQL = text(
+    """
+    SELECT query, calls, mean_exec_time, rows / nullif(calls, 0) AS rows_per_call
+    FROM pg_stat_statements
+    WHERE dbid = (SELECT oid FROM pg_database WHERE datname = current_database())
+      AND query ILIKE '%' || :table || '%'
+      AND query NOT ILIKE '%pg_stat%'
+    ORDER BY total_exec_time DESC
+    LIMIT :limit
+    """
+)
+
+
+@dataclass
+class UnusedIndex:
+    index: str
+    table: str
+    bytes: int
+
+
+@dataclass
+class RedundantIndex:
+    index: str
+    covered_by: str
+    table: str
+
+
+@dataclass
+class SeqScannedTable:
+    table: str
+    seq_scans: int
+    rows_per_scan: int
+    index_scans: int
+    live_rows: int
+    # Costliest statements on the table (pg_stat_statements only)
+    statements: List[str] = field(default_factory=list)
+
+
+@dataclass
+class IndexReport:
+    stats_since: Optional[datetime]
+    unused: List[UnusedIndex] = field(default_factory=list)
+    redundant: List[RedundantIndex] = field(default_factory=list)
+    seq_scanned: List[SeqScannedTable] = field(default_factory=list)
+
+    @property
+    def findings(self) -> int:
+        return len(self.unused) + len(self.redundant) + len(self.seq_scanned)
+
+
+def _has_pg_stat_statements(connection: Connection) -> bool:
+    return connection.execute(text("SELECT to_regclass('pg_stat_statements') IS NOT NULL")).scalar()
+
+
+def index_report(
+    connection: Connection,
+    min_rows: int = 10000,
+    min_seq_scans: int = 100,
+    statements_per_table: int = 3,
+) -> IndexReport:
+    """
+    Unused and redundant indexes, and tables of at least `min_rows`
+    that were sequentially scanned at least `min_seq_scans` times
+    reading `min_rows` rows per scan on average (missing index
+    candidates).
+    """
+    report = IndexReport(
+        stats_since=connection.execute(
+            text("SELECT stats_reset FROM pg_stat_database WHERE datname = current_database()")
+        ).scalar(),
+    )
+
+    for index, table, _, size in connection.execute(UNUSED_SQL):
+        report.unused.append(UnusedIndex(index, table, int(size)))
+
+    for index, covered_by, table in connection.execute(REDUNDANT_SQL):
+        report.redundant.append(RedundantIndex(index, covered_by, table))
+
+    rows = connection.execute(
+        SEQ_SCANNED_SQL,
+        {"min_rows": min_rows, "min_seq_scans": min_seq_scans},
+    )
+    for table, seq_scans, rows_per_scan, index_scans, live_rows in rows:
+        report.seq_scanned.append(
+            SeqScannedTable(table, int(seq_scans), int(rows_per_scan), int(index_scans), int(live_rows))
+        )
+
+    if report.seq_scanned and _has_pg_stat_statements(connection):
+        for item in report.seq_scanned:
+            statements = connection.execute(
+                STATEMENTS_SQL,
+                {"table": item.table, "limit": statements_per_table},
+            )
+            item.statements = [
+                f"{mean:.1f}ms x {calls}, {int(per_call or 0)} rows: {' '.join(query.split())[:200]}"
+                for query, calls, mean, per_call in statements
+            ]
+
+    return report
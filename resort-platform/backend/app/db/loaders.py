@@ -0,0 +1,44 @@
+from sqlalchemy.orm import joinedload, load_only, raiseload, selectinload
+
+from app.models.booking import Booking
+from app.models.payment import Payment
+from app.models.review import Review
+
+# -------------------------------------------------
+# Relationship loading profiles
+# -------------------------------------------------
+# Relationships are lazy at the model level; each query states what it
+# needs. Every profile ends with raiseload("*") so an accidental lazy
+# load (e.g. a schema growing a nested field) fails loudly instead of
+# issuing one SELECT per row.
+#
+#     db.query(Booking).options(*BOOKING_PLAIN)
+#
+# Do not apply these to objects that are about to be deleted with
+# `db.delete()`: the unit of work may need to load collections.
+
+RAISE_ALL = raiseload("*")
+
+# Booking columns only (BookingOut has no nested relations)
+BOOKING_PLAIN = (RAISE_ALL,)
+
+# Booking with its room in the same round trip
+BOOKING_WITH_ROOM = (joinedload(Booking.room), RAISE_ALL)
+
+# Booking with payments fetched in one extra IN query for the page
+BOOKING_WITH_PAYMENTS = (selectinload(Booking.payments), RAISE_ALL)
+
+# Status transitions that touch nothing but the row itself
+# (guest_id is read by the guest_stats flush hook)
+BOOKING_STATUS_ONLY = (
+    load_only(Booking.id, Booking.guest_id, Booking.status),
+    RAISE_ALL,
+)
+
+PAYMENT_PLAIN = (RAISE_ALL,)
+
+PAYMENT_WITH_BOOKING = (joinedload(Payment.booking), RAISE_ALL)
+
+REVIEW_PLAIN = (RAISE_ALL,)
+
+REVIEW_WITH_BOOKING = (joinedload(Review.booking), RAISE_ALL)
@@ -0,0 +1,39 @@
+"""review full-text search and moderation queue index
+
+Revision ID: 0001_review_search
+Revises:
+Create Date: 2026-10-19 00:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0001_review_search"
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute(
+        """
+        ALTER TABLE reviews
+        ADD COLUMN search_vector tsvector
+        GENERATED ALWAYS AS (
+            setweight(to_tsvector('english', coalesce(guest_name, '')), 'A') ||
+            setweight(to_tsvector('english', coalesce(comment, '')), 'B')
+        ) STORED
+        """
+    )
+    op.execute("CREATE INDEX idx_reviews_search ON reviews USING gin (search_vector)")
+
+    # The moderation queue only ever reads pending rows
+    op.execute("CREATE INDEX idx_reviews_pending ON reviews (id) WHERE is_approved = false")
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS idx_reviews_pending")
+    op.execute("DROP INDEX IF EXISTS idx_reviews_search")
+    op.execute("ALTER TABLE reviews DROP COLUMN IF EXISTS search_vector")
@@ -0,0 +1,31 @@
+"""pg_trgm indexes for guest and booking typeahead
+
+Revision ID: 0002_trigram_typeahead
+Revises: 0001_review_search
+Create Date: 2026-10-19 00:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0002_trigram_typeahead"
+down_revision: Union[str, None] = "0001_review_search"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Must match GUEST_DOCUMENT / BOOKING_DOCUMENT in app.services.typeahead
+GUEST_DOCUMENT = "lower(full_name || ' ' || email || ' ' || coalesce(phone, ''))"
+BOOKING_DOCUMENT = "lower(guest_name || ' ' || guest_email || ' ' || guest_phone)"
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.execute(f"CREATE INDEX idx_guests_trgm ON guests USING gin (({GUEST_DOCUMENT}) gin_trgm_ops)")
+    op.execute(f"CREATE INDEX idx_bookings_guest_trgm ON bookings USING gin (({BOOKING_DOCUMENT}) gin_trgm_ops)")
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS idx_bookings_guest_trgm")
+    op.execute("DROP INDEX IF EXISTS idx_guests_trgm")
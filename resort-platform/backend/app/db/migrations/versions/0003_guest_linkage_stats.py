@@ -0,0 +1,105 @@
+"""link bookings to guests and add guest_stats
+
+Revision ID: 0003_guest_linkage_stats
+Revises: 0002_trigram_typeahead
+Create Date: 2026-10-19 00:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0003_guest_linkage_stats"
+down_revision: Union[str, None] = "0002_trigram_typeahead"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE INDEX idx_guests_email_normalized ON guests (lower(trim(email)))")
+
+    op.execute(
+        """
+        ALTER TABLE bookings
+        ADD COLUMN guest_id INTEGER
+            CONSTRAINT fk_bookings_guest REFERENCES guests (id) ON DELETE SET NULL
+        """
+    )
+
+    # Every distinct booking email becomes a CRM guest (latest details win)
+    op.execute(
+        """
+        INSERT INTO guests (full_name, email, phone, is_admin, created_at)
+        SELECT DISTINCT ON (lower(trim(b.guest_email)))
+               b.guest_name, lower(trim(b.guest_email)), b.guest_phone, FALSE, b.created_at
+        FROM bookings b
+        WHERE NOT EXISTS (
+            SELECT 1 FROM guests g
+            WHERE lower(trim(g.email)) = lower(trim(b.guest_email))
+        )
+        ORDER BY lower(trim(b.guest_email)), b.created_at DESC
+        ON CONFLICT (email) DO NOTHING
+        """
+    )
+    op.execute(
+        """
+        UPDATE bookings b
+        SET guest_id = g.id
+        FROM (
+            SELECT DISTINCT ON (lower(trim(email))) id, lower(trim(email)) AS email
+            FROM guests
+            ORDER BY lower(trim(email)), id
+        ) g
+        WHERE lower(trim(b.guest_email)) = g.email
+        """
+    )
+    op.execute("CREATE INDEX idx_bookings_guest_id ON bookings (guest_id)")
+
+    op.execute(
+        """
+        CREATE TABLE guest_stats (
+            guest_id INTEGER PRIMARY KEY
+                REFERENCES guests (id) ON DELETE CASCADE,
+            stays INTEGER NOT NULL DEFAULT 0,
+            nights INTEGER NOT NULL DEFAULT 0,
+            last_stay DATE,
+            paid_total NUMERIC(12, 2) NOT NULL DEFAULT 0,
+            updated_at TIMESTAMP WITHOUT TIME ZONE NOT NULL DEFAULT CURRENT_TIMESTAMP
+        )
+        """
+    )
+    op.execute(
+        """
+        INSERT INTO guest_stats (guest_id, stays, nights, last_stay, paid_total)
+        SELECT g.id,
+               coalesce(s.stays, 0),
+               coalesce(s.nights, 0),
+               s.last_stay,
+               coalesce(p.paid_total, 0)
+        FROM guests g
+        LEFT JOIN (
+            SELECT guest_id,
+                   count(*) FILTER (WHERE status <> 'CANCELLED' AND check_out <= current_date) AS stays,
+                   sum(check_out - check_in) FILTER (WHERE status <> 'CANCELLED' AND check_out <= current_date) AS nights,
+                   max(check_out) FILTER (WHERE status <> 'CANCELLED' AND check_out <= current_date) AS last_stay
+            FROM bookings
+            WHERE guest_id IS NOT NULL
+            GROUP BY guest_id
+        ) s ON s.guest_id = g.id
+        LEFT JOIN (
+            SELECT b.guest_id, sum(p.amount) AS paid_total
+            FROM payments p
+            JOIN bookings b ON b.id = p.booking_id
+            WHERE p.status = 'PAID' AND b.guest_id IS NOT NULL
+            GROUP BY b.guest_id
+        ) p ON p.guest_id = g.id
+        """
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP TABLE IF EXISTS guest_stats")
+    op.execute("DROP INDEX IF EXISTS idx_bookings_guest_id")
+    op.execute("ALTER TABLE bookings DROP COLUMN IF EXISTS guest_id")
+    op.execute("DROP INDEX IF EXISTS idx_guests_email_normalized")
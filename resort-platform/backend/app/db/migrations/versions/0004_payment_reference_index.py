@@ -0,0 +1,24 @@
+"""index payments.reference_id for settlement reconciliation
+
+Revision ID: 0004_payment_reference_index
+Revises: 0003_guest_linkage_stats
+Create Date: 2026-10-19 00:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0004_payment_reference_index"
+down_revision: Union[str, None] = "0003_guest_linkage_stats"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE INDEX idx_payments_reference_id ON payments (reference_id)")
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS idx_payments_reference_id")
@@ -0,0 +1,48 @@
+"""payment webhook event queue
+
+Revision ID: 0005_payment_events
+Revises: 0004_payment_reference_index
+Create Date: 2026-10-19 00:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0005_payment_events"
+down_revision: Union[str, None] = "0004_payment_reference_index"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute(
+        """
+        CREATE TABLE payment_events (
+            id BIGSERIAL PRIMARY KEY,
+            provider VARCHAR(50) NOT NULL,
+            payload TEXT NOT NULL,
+            received_at TIMESTAMP WITHOUT TIME ZONE NOT NULL DEFAULT CURRENT_TIMESTAMP,
+            processed_at TIMESTAMP WITHOUT TIME ZONE,
+            error VARCHAR(255)
+        )
+        """
+    )
+    op.execute("CREATE INDEX idx_payment_events_pending ON payment_events (id) WHERE processed_at IS NULL")
+
+    op.execute(
+        """
+        CREATE TABLE payment_event_keys (
+            provider VARCHAR(50) NOT NULL,
+            event_id VARCHAR(255) NOT NULL,
+            payment_event_id BIGINT NOT NULL,
+            PRIMARY KEY (provider, event_id)
+        )
+        """
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP TABLE IF EXISTS payment_event_keys")
+    op.execute("DROP TABLE IF EXISTS payment_events")
@@ -0,0 +1,53 @@
+"""per-day, per-method revenue ledger
+
+Revision ID: 0006_revenue_ledger
+Revises: 0005_payment_events
+Create Date: 2026-10-19 00:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0006_revenue_ledger"
+down_revision: Union[str, None] = "0005_payment_events"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute(
+        """
+        CREATE INDEX idx_payments_revenue_day
+        ON payments ((coalesce(paid_at, created_at)::date), method)
+        WHERE status = 'PAID'
+        """
+    )
+
+    op.execute(
+        """
+        CREATE TABLE revenue_ledger (
+            day DATE NOT NULL,
+            method VARCHAR(50) NOT NULL,
+            amount NUMERIC(14, 2) NOT NULL DEFAULT 0,
+            payments INTEGER NOT NULL DEFAULT 0,
+            updated_at TIMESTAMP WITHOUT TIME ZONE NOT NULL DEFAULT CURRENT_TIMESTAMP,
+            PRIMARY KEY (day, method)
+        )
+        """
+    )
+    op.execute(
+        """
+        INSERT INTO revenue_ledger (day, method, amount, payments)
+        SELECT coalesce(paid_at, created_at)::date, method, sum(amount), count(*)
+        FROM payments
+        WHERE status = 'PAID'
+        GROUP BY 1, 2
+        """
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP TABLE revenue_ledger")
+    op.execute("DROP INDEX idx_payments_revenue_day")
@@ -0,0 +1,36 @@
+"""jsonb amenities with a GIN index; confirmed-booking overlap index
+
+Revision ID: 0007_room_amenity_search
+Revises: 0006_revenue_ledger
+Create Date: 2026-10-19 00:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0007_room_amenity_search"
+down_revision: Union[str, None] = "0006_revenue_ledger"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # No-op rewrite-wise where schemas.sql already created it as JSONB
+    op.execute("ALTER TABLE rooms ALTER COLUMN amenities TYPE JSONB USING amenities::jsonb")
+    op.execute("CREATE INDEX idx_rooms_amenities ON rooms USING GIN (amenities jsonb_path_ops)")
+
+    op.execute(
+        """
+        CREATE INDEX idx_bookings_room_confirmed
+        ON bookings (room_id, check_out)
+        WHERE status = 'CONFIRMED'
+        """
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX idx_bookings_room_confirmed")
+    op.execute("DROP INDEX idx_rooms_amenities")
+    op.execute("ALTER TABLE rooms ALTER COLUMN amenities TYPE JSON USING amenities::json")
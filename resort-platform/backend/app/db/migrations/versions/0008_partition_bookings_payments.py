@@ -0,0 +1,155 @@
+"""range-partition bookings by check_in and payments by created_at
+
+Revision ID: 0008_partition_bookings_payments
+Revises: 0007_room_amenity_search
+Create Date: 2026-10-19 00:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0008_partition_bookings_payments"
+down_revision: Union[str, None] = "0007_room_amenity_search"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Must match BOOKING_DOCUMENT in app.services.typeahead
+BOOKING_DOCUMENT = "lower(guest_name || ' ' || guest_email || ' ' || guest_phone)"
+
+# Must match database/schemas.sql
+INDEXES = {
+    "bookings": [
+        "CREATE INDEX idx_bookings_room_id ON bookings (room_id)",
+        "CREATE INDEX idx_bookings_guest_id ON bookings (guest_id)",
+        "CREATE INDEX idx_bookings_dates ON bookings (check_in, check_out)",
+        "CREATE INDEX idx_bookings_status ON bookings (status)",
+        "CREATE INDEX idx_bookings_room_confirmed ON bookings (room_id, check_out) WHERE status = 'CONFIRMED'",
+        f"CREATE INDEX idx_bookings_guest_trgm ON bookings USING GIN (({BOOKING_DOCUMENT}) gin_trgm_ops)",
+    ],
+    "payments": [
+        "CREATE INDEX idx_payments_booking_id ON payments (booking_id)",
+        "CREATE INDEX idx_payments_status ON payments (status)",
+        "CREATE INDEX idx_payments_reference_id ON payments (reference_id)",
+        "CREATE INDEX idx_payments_revenue_day ON payments "
+        "((coalesce(paid_at, created_at)::date), method) WHERE status = 'PAID'",
+    ],
+}
+
+FOREIGN_KEYS = {
+    "bookings": [
+        "ADD CONSTRAINT fk_bookings_room FOREIGN KEY (room_id) REFERENCES rooms (id) ON DELETE RESTRICT",
+        "ADD CONSTRAINT fk_bookings_guest FOREIGN KEY (guest_id) REFERENCES guests (id) ON DELETE SET NULL",
+    ],
+    "payments": [],
+}
+
+# Foreign keys into bookings, restored on downgrade
+BOOKING_REFERENCES = {
+    "payments": "ADD CONSTRAINT fk_payments_booking FOREIGN KEY (booking_id) "
+    "REFERENCES bookings (id) ON DELETE CASCADE",
+    "reviews": "ADD CONSTRAINT fk_reviews_booking FOREIGN KEY (booking_id) "
+    "REFERENCES bookings (id) ON DELETE CASCADE",
+}
+
+
+def _drop_foreign_keys(referenced: str) -> None:
+    # Constraint names differ between schemas.sql and create_all databases
+    op.execute(
+        f"""
+        DO $$
+        DECLARE fk record;
+        BEGIN
+            FOR fk IN
+                SELECT conrelid::regclass AS tbl, conname
+                FROM pg_constraint
+                WHERE contype = 'f' AND confrelid = '{referenced}'::regclass
+            LOOP
+                EXECUTE format('ALTER TABLE %s DROP CONSTRAINT %I', fk.tbl, fk.conname);
+            END LOOP;
+        END $$
+        """
+    )
+
+
+def _rebuild(table: str, key: str, partitioned: bool) -> None:
+    """
+    Copy `table` into a new (partitioned or plain) table of the same
+    shape and swap it in. The id sequence moves over unchanged.
+    """
+    old = f"{table}_old"
+    op.execute(f"ALTER TABLE {table} RENAME TO {old}")
+    op.execute(
+        f"""
+        CREATE TABLE {table} (LIKE {old} INCLUDING DEFAULTS INCLUDING CONSTRAINTS)
+        {f"PARTITION BY RANGE ({key})" if partitioned else ""}
+        """
+    )
+
+    if partitioned:
+        op.execute(f"CREATE TABLE {table}_default PARTITION OF {table} DEFAULT")
+        # Every year with data, up to two years ahead (app.tasks.partitions
+        # keeps extending this)
+        op.execute(
+            f"""
+            DO $$
+            DECLARE year int;
+            BEGIN
+                FOR year IN
+                    SELECT generate_series(
+                        coalesce(extract(year FROM min({key}))::int, extract(year FROM now())::int),
+                        extract(year FROM now())::int + 2
+                    )
+                    FROM {old}
+                LOOP
+                    EXECUTE format(
+                        'CREATE TABLE %I PARTITION OF {table} FOR VALUES FROM (%L) TO (%L)',
+                        '{table}_y' || year,
+                        make_date(year, 1, 1),
+                        make_date(year + 1, 1, 1)
+                    );
+                END LOOP;
+            END $$
+            """
+        )
+
+    op.execute(f"INSERT INTO {table} SELECT * FROM {old}")
+
+    # The serial sequence would be dropped with the old table
+    op.execute(
+        f"""
+        DO $$
+        BEGIN
+            EXECUTE format(
+                'ALTER SEQUENCE %s OWNED BY {table}.id',
+                pg_get_serial_sequence('{old}', 'id')
+            );
+        END $$
+        """
+    )
+    op.execute(f"DROP TABLE {old}")
+
+    # Built after the copy, and after the old table's names are freed
+    primary_key = f"id, {key}" if partitioned else "id"
+    op.execute(f"ALTER TABLE {table} ADD PRIMARY KEY ({primary_key})")
+    for statement in INDEXES[table]:
+        op.execute(statement)
+    for constraint in FOREIGN_KEYS[table]:
+        op.execute(f"ALTER TABLE {table} {constraint}")
+
+
+def upgrade() -> None:
+    # A foreign key into a partitioned table must cover its partition
+    # key; payments and reviews only know booking_id, so these move to
+    # the ORM (Booking.payments / Booking.review cascades).
+    _drop_foreign_keys("bookings")
+    _rebuild("bookings", "check_in", partitioned=True)
+    _rebuild("payments", "created_at", partitioned=True)
+
+
+def downgrade() -> None:
+    _rebuild("payments", "created_at", partitioned=False)
+    _rebuild("bookings", "check_in", partitioned=False)
+    for table, constraint in BOOKING_REFERENCES.items():
+        op.execute(f"ALTER TABLE {table} {constraint}")
@@ -0,0 +1,64 @@
+"""booking archive bookkeeping: batches and carried-over totals
+
+Revision ID: 0009_booking_archive
+Revises: 0008_partition_bookings_payments
+Create Date: 2026-10-19 00:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0009_booking_archive"
+down_revision: Union[str, None] = "0008_partition_bookings_payments"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute(
+        """
+        CREATE TABLE archive_batches (
+            name VARCHAR(64) PRIMARY KEY,
+            bookings INTEGER NOT NULL,
+            payments INTEGER NOT NULL,
+            reviews INTEGER NOT NULL,
+            first_check_in DATE NOT NULL,
+            last_check_out DATE NOT NULL,
+            archived_at TIMESTAMP WITHOUT TIME ZONE NOT NULL DEFAULT CURRENT_TIMESTAMP
+        )
+        """
+    )
+    op.execute(
+        """
+        CREATE TABLE archived_revenue (
+            day DATE NOT NULL,
+            method VARCHAR(50) NOT NULL,
+            amount NUMERIC(14, 2) NOT NULL DEFAULT 0,
+            payments INTEGER NOT NULL DEFAULT 0,
+            PRIMARY KEY (day, method)
+        )
+        """
+    )
+    op.execute(
+        """
+        CREATE TABLE archived_guest_stats (
+            guest_id INTEGER PRIMARY KEY,
+            stays INTEGER NOT NULL DEFAULT 0,
+            nights INTEGER NOT NULL DEFAULT 0,
+            last_stay DATE,
+            paid_total NUMERIC(12, 2) NOT NULL DEFAULT 0,
+            CONSTRAINT fk_archived_guest_stats_guest
+                FOREIGN KEY (guest_id)
+                REFERENCES guests (id)
+                ON DELETE CASCADE
+        )
+        """
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP TABLE archived_guest_stats")
+    op.execute("DROP TABLE archived_revenue")
+    op.execute("DROP TABLE archive_batches")
@@ -0,0 +1,26 @@
+"""rooms.pricing_version for the price quote cache
+
+Revision ID: 0010_room_pricing_version
+Revises: 0009_booking_archive
+Create Date: 2026-10-19 00:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0010_room_pricing_version"
+down_revision: Union[str, None] = "0009_booking_archive"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute(
+        "ALTER TABLE rooms ADD COLUMN pricing_version INTEGER NOT NULL DEFAULT 1"
+    )
+
+
+def downgrade() -> None:
+    op.execute("ALTER TABLE rooms DROP COLUMN pricing_version")
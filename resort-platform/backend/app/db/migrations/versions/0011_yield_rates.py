@@ -0,0 +1,41 @@
+"""yield_rates: per room-night demand signals and yield rates
+
+Revision ID: 0011_yield_rates
+Revises: 0010_room_pricing_version
+Create Date: 2026-10-19 00:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0011_yield_rates"
+down_revision: Union[str, None] = "0010_room_pricing_version"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute(
+        """
+        CREATE TABLE yield_rates (
+            room_id INTEGER NOT NULL,
+            night DATE NOT NULL,
+            occupancy NUMERIC(5, 4) NOT NULL,
+            pickup NUMERIC(5, 4) NOT NULL,
+            last_year_occupancy NUMERIC(5, 4) NOT NULL,
+            static_rate NUMERIC(10, 2) NOT NULL,
+            suggested_rate NUMERIC(10, 2) NOT NULL,
+            applied_rate NUMERIC(10, 2),
+            computed_at TIMESTAMP WITHOUT TIME ZONE NOT NULL DEFAULT CURRENT_TIMESTAMP,
+            PRIMARY KEY (room_id, night),
+            CONSTRAINT fk_yield_rates_room
+                FOREIGN KEY (room_id) REFERENCES rooms (id) ON DELETE CASCADE
+        )
+        """
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP TABLE yield_rates")
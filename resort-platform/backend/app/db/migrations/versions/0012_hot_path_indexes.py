@@ -0,0 +1,103 @@
+"""hot-path indexes: booking overlap and expiry sweep, payments by created_at
+
+Revision ID: 0012_hot_path_indexes
+Revises: 0011_yield_rates
+Create Date: 2026-10-19 00:00:00
+
+"""
+from typing import List, Sequence, Union
+
+from alembic import op
+from sqlalchemy import text
+
+# revision identifiers, used by Alembic.
+revision: str = "0012_hot_path_indexes"
+down_revision: Union[str, None] = "0011_yield_rates"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Must match database/schemas.sql and the models; (name, table, definition)
+INDEXES = [
+    # Overlap probe: room_id, check_out > ?, check_in in (? - 365, ?)
+    ("idx_bookings_overlap", "bookings", "(room_id, check_out, check_in) WHERE status = 'CONFIRMED'"),
+    # Expiry sweep (app.tasks.cleanup)
+    ("idx_bookings_confirmed_created", "bookings", "(created_at) WHERE status = 'CONFIRMED'"),
+    # list_payments orders by created_at
+    ("idx_payments_created_at", "payments", "(created_at)"),
+]
+
+# Prefix of idx_bookings_overlap; restored on downgrade
+SUPERSEDED = ("idx_bookings_room_confirmed", "bookings", "(room_id, check_out) WHERE status = 'CONFIRMED'")
+
+
+def _partitions(table: str) -> List[str]:
+    return list(
+        op.get_bind().execute(
+            text(
+                """
+                SELECT child.relname
+                FROM pg_inherits
+                JOIN pg_class child ON child.oid = pg_inherits.inhrelid
+                WHERE pg_inherits.inhparent = CAST(:table AS regclass)
+                ORDER BY child.relname
+                """
+            ),
+            {"table": table},
+        ).scalars()
+    )
+
+
+def _is_valid(index: str) -> bool:
+    return bool(
+        op.get_bind().execute(
+            text(
+                """
+                SELECT indisvalid FROM pg_index
+                WHERE indexrelid = to_regclass(:index)
+                """
+            ),
+            {"index": index},
+        ).scalar()
+    )
+
+
+def _create_partitioned_index(name: str, table: str, definition: str) -> None:
+    """
+    CREATE INDEX CONCURRENTLY does not work on a partitioned table. The
+    parent index is created ON ONLY the parent (invalid, nothing built),
+    then each partition's index is built concurrently and attached; the
+    parent becomes valid once every partition has one. Partitions
+    created later get it when attached (app.db.partitions).
+    """
+    op.execute(f"CREATE INDEX IF NOT EXISTS {name} ON ONLY {table} {definition}")
+
+    suffix = name.removeprefix(f"idx_{table}_")
+    for partition in _partitions(table):
+        child = f"{partition}_{suffix}"
+        # Left invalid by an interrupted earlier run
+        if not _is_valid(child):
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {child}")
+        op.execute(f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {child} ON {partition} {definition}")
+        op.execute(f"ALTER INDEX {name} ATTACH PARTITION {child}")
+
+
+def upgrade() -> None:
+    # Concurrent builds cannot run inside a transaction
+    with op.get_context().autocommit_block():
+        for name, table, definition in INDEXES:
+            _create_partitioned_index(name, table, definition)
+
+        # A partitioned index cannot be dropped concurrently; this only
+        # holds the bookings lock for the catalog update
+        op.execute(f"DROP INDEX IF EXISTS {SUPERSEDED[0]}")
+
+        # Duplicate of the guests.email UNIQUE constraint's index
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_guests_email")
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute("CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_guests_email ON guests (email)")
+        _create_partitioned_index(*SUPERSEDED)
+        for name, _, _ in reversed(INDEXES):
+            op.execute(f"DROP INDEX IF EXISTS {name}")
@@ -0,0 +1,135 @@
+from datetime import date
+from typing import Dict, List
+
+from sqlalchemy import func, select, text
+from sqlalchemy.engine import Connection
+
+# -------------------------------------------------
+# Yearly range partitions
+# -------------------------------------------------
+# bookings is partitioned by check_in and payments by created_at, one
+# partition per calendar year (<table>_y<year>) plus <table>_default for
+# anything outside them. Queries that bound the key (availability,
+# date-range reports) only scan the years they touch, and old years can
+# be detached or archived as a whole.
+
+PARTITIONED_TABLES: Dict[str, str] = {
+    "bookings": "check_in",
+    "payments": "created_at",
+}
+
+# Serializes partition maintenance across workers; arbitrary but fixed
+PARTITIONS_LOCK_ID = 0x70617274
+
+
+def partition_name(table: str, year: int) -> str:
+    return f"{table}_y{year}"
+
+
+def existing_partitions(connection: Connection, table: str) -> List[str]:
+    return list(
+        connection.execute(
+            text(
+                """
+                SELECT child.relname
+                FROM pg_inherits
+                JOIN pg_class child ON child.oid = pg_inherits.inhrelid
+                WHERE pg_inherits.inhparent = CAST(:table AS regclass)
+                ORDER BY child.relname
+                """
+            ),
+            {"table": table},
+        ).scalars()
+    )
+
+
+def create_partition(connection: Connection, table: str, year: int) -> bool:
+    """
+    Attach the partition of `table` for `year`, moving rows of that year
+    out of the default partition first. False if it already exists.
+    """
+    name = partition_name(table, year)
+    if name in existing_partitions(connection, table):
+        return False
+
+    column = PARTITIONED_TABLES[table]
+    bounds = {"start": date(year, 1, 1), "end": date(year + 1, 1, 1)}
+
+    # Created detached so the rows can move in before it is attached;
+    # attaching creates the parent's indexes on it.
+    connection.execute(
+        text(f"CREATE TABLE {name} (LIKE {table} INCLUDING DEFAULTS INCLUDING CONSTRAINTS)")
+    )
+    connection.execute(
+        text(
+            f"""
+            WITH moved AS (
+                DELETE FROM {table}_default
+                WHERE {column} >= :start AND {column} < :end
+                RETURNING *
+            )
+            INSERT INTO {name} SELECT * FROM moved
+            """
+        ),
+        bounds,
+    )
+    connection.execute(
+        text(
+            f"ALTER TABLE {table} ATTACH PARTITION {name} "
+            f"FOR VALUES FROM ('{bounds['start']}') TO ('{bounds['end']}')"
+        )
+    )
+    return True
+
+
+def ensure_partitions(connection: Connection, first_year: int, last_year: int) -> List[str]:
+    """
+    Create every missing yearly partition of the partitioned tables for
+    first_year..last_year inside the caller's transaction. Returns the
+    names of the partitions created.
+    """
+    connection.execute(select(func.pg_advisory_xact_lock(PARTITIONS_LOCK_ID)))
+
+    created = []
+    for table in PARTITIONED_TABLES:
+        for year in range(first_year, last_year + 1):
+            if create_partition(connection, table, year):
+                created.append(partition_name(table, year))
+    return created
+
+
+# -------------------------------------------------
+# Booking references
+# -------------------------------------------------
+# payments.booking_id and reviews.booking_id have no foreign key (a
+# partitioned bookings table can only be referenced by (id, check_in)).
+# The ORM cascades deletes, but Core / bulk deletes and manual fixes can
+# leave rows pointing at no booking; orphaned_rows finds them.
+
+BOOKING_REFERENCES = ("payments", "reviews")
+
+
+def orphaned_rows(connection: Connection) -> Dict[str, List[int]]:
+    """
+    Ids of payments / reviews whose booking_id matches no booking, per
+    table (tables without orphans are left out).
+    """
+    orphans = {}
+    for table in BOOKING_REFERENCES:
+        ids = list(
+            connection.execute(
+                text(
+                    f"""
+                    SELECT child.id
+                    FROM {table} child
+                    WHERE NOT EXISTS (
+                        SELECT 1 FROM bookings WHERE bookings.id = child.booking_id
+                    )
+                    ORDER BY child.id
+                    """
+                )
+            ).scalars()
+        )
+        if ids:
+            orphans[table] = ids
+    return orphans
@@ -0,0 +1,130 @@
+import itertools
+import threading
+import time
+from typing import List, Optional
+
+from loguru import logger
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
+
+from app.core.metrics import DB_REPLICA_LAG
+
+# -------------------------------------------------
+# Read replica selection
+# -------------------------------------------------
+# Seconds of replay lag; 0 on a caught-up standby (or on a primary, so a
+# replica URL pointing at the primary in development just works) and
+# NULL while a standby has not replayed anything yet. "Caught up" needs
+# a running WAL receiver: a standby cut off from the primary has replayed
+# everything it received too, so its lag is measured from the last
+# replayed transaction instead and grows until it is no longer used.
+# Without pg_read_all_stats the receiver's status is hidden (NULL); a
+# running receiver is then taken as streaming.
+LAG_QUERY = text(
+    """
+    SELECT CASE
+        WHEN NOT pg_is_in_recovery() THEN 0
+        WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn()
+            AND EXISTS (
+                SELECT 1 FROM pg_stat_wal_receiver
+                WHERE coalesce(status, 'streaming') = 'streaming'
+            )
+            THEN 0
+        ELSE EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp())
+    END
+    """
+)
+
+# Server-side bound on the probe query (milliseconds)
+PROBE_STATEMENT_TIMEOUT_MS = 1000
+
+
+class Replica:
+    def __init__(self, name: str, engine: Engine) -> None:
+        self.name = name
+        self.engine = engine
+        self.lag: Optional[float] = None
+        self.reachable: Optional[bool] = None
+        self.checked_at = float("-inf")
+        self.probing = False
+
+
+class ReplicaSet:
+    """
+    Round-robin over replicas whose measured lag is within `max_lag`.
+    Lag is probed at most every `check_interval` seconds per replica, on
+    a background thread started by the request that finds the
+    measurement stale; requests never wait for a probe and use the last
+    measurement (none yet means the primary).
+    """
+
+    def __init__(
+        self,
+        engines: List[Engine],
+        max_lag: float,
+        check_interval: float,
+    ) -> None:
+        self.replicas = [Replica(str(i), engine) for i, engine in enumerate(engines)]
+        self.max_lag = max_lag
+        self.check_interval = check_interval
+        self._lock = threading.Lock()
+        self._cycle = itertools.cycle(self.replicas) if self.replicas else None
+
+    def _probe(self, replica: Replica) -> None:
+        try:
+            with replica.engine.begin() as conn:
+                conn.exec_driver_sql(f"SET LOCAL statement_timeout = {PROBE_STATEMENT_TIMEOUT_MS}")
+                lag = conn.execute(LAG_QUERY).scalar()
+            lag = None if lag is None else float(lag)
+            replica.reachable = True
+        except Exception as exc:
+            if replica.reachable is not False:
+                logger.warning("Read replica {} unreachable: {}", replica.name, exc)
+            replica.reachable = False
+            lag = None
+
+        was_usable = self._usable(replica)
+        replica.lag = lag
+        DB_REPLICA_LAG.set((replica.name,), -1.0 if lag is None else lag)
+        if was_usable and replica.reachable and not self._usable(replica):
+            logger.warning("Read replica {} lagging ({}s); reading from primary", replica.name, lag)
+
+    def _usable(self, replica: Replica) -> bool:
+        return replica.lag is not None and replica.lag <= self.max_lag
+
+    def _probe_in_background(self, replica: Replica) -> None:
+        try:
+            self._probe(replica)
+        finally:
+            replica.probing = False
+
+    def _refresh(self, replica: Replica) -> None:
+        now = time.monotonic()
+        with self._lock:
+            # A probe still hanging on a dead replica is not stacked on
+            if replica.probing or now - replica.checked_at < self.check_interval:
+                return
+            replica.checked_at = now
+            replica.probing = True
+
+        threading.Thread(
+            target=self._probe_in_background,
+            args=(replica,),
+            name=f"replica-probe-{replica.name}",
+            daemon=True,
+        ).start()
+
+    def pick(self) -> Optional[Engine]:
+        """
+        A replica engine that is within the lag budget, or None.
+        """
+        if self._cycle is None:
+            return None
+
+        for _ in range(len(self.replicas)):
+            with self._lock:
+                replica = next(self._cycle)
+            self._refresh(replica)
+            if self._usable(replica):
+                return replica.engine
+        return None
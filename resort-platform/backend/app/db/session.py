@@ -4,6 +4,14 @@ from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker, Session
 
 from app.core.config import settings
+from app.core.metrics import DB_READ_SESSIONS, instrument_engine
+from app.core.query_debug import enable_query_debug
+from app.db.replicas import ReplicaSet
+
+import app.db.base  # noqa: F401  (registers all models before the flush hooks import them)
+from app.services.guest_stats import track_guest_stats
+from app.services.pricing_engine import track_pricing
+from app.services.revenue import track_revenue
 
 # -------------------------------------------------
 # Engine
@@ -14,6 +22,32 @@ engine = create_engine(
     pool_pre_ping=True,
 )
 
+replica_engines = [
+    create_engine(
+        url,
+        pool_pre_ping=True,
+        # An unreachable replica fails fast instead of stalling reads
+        connect_args={"connect_timeout": settings.REPLICA_CONNECT_TIMEOUT_SECONDS},
+        execution_options={"postgresql_readonly": True},
+    )
+    for url in settings.DATABASE_REPLICA_URLS
+]
+
+for _engine in (engine, *replica_engines):
+    if settings.METRICS_ENABLED:
+        instrument_engine(_engine)
+    if settings.QUERY_DEBUG:
+        enable_query_debug(_engine)
+
+# Primary fallback for get_read_db; shares the primary's pool
+read_only_engine = engine.execution_options(postgresql_readonly=True)
+
+replicas = ReplicaSet(
+    replica_engines,
+    max_lag=settings.REPLICA_MAX_LAG_SECONDS,
+    check_interval=settings.REPLICA_LAG_CHECK_SECONDS,
+)
+
 # -------------------------------------------------
 # Session factory
 # -------------------------------------------------
@@ -24,6 +58,16 @@ SessionLocal = sessionmaker(
     bind=engine,
 )
 
+track_guest_stats(SessionLocal)
+track_revenue(SessionLocal)
+track_pricing(SessionLocal)
+
+# Read-only sessions; bound per request to a replica or the primary
+ReadSessionLocal = sessionmaker(
+    autocommit=False,
+    autoflush=False,
+)
+
 # -------------------------------------------------
 # Dependency
 # -------------------------------------------------
@@ -38,3 +82,20 @@ def get_db() -> Generator[Session, None, None]:
         yield db
     finally:
         db.close()
+
+
+def get_read_db() -> Generator[Session, None, None]:
+    """
+    Read-only session on a replica within the lag budget, falling back
+    to the primary. Only for reads that tolerate a few seconds of
+    staleness (public catalog, reporting); anything feeding a write or
+    an availability decision must use `get_db`.
+    """
+    bind = replicas.pick()
+    DB_READ_SESSIONS.inc(("replica" if bind is not None else "primary",))
+
+    db = ReadSessionLocal(bind=bind or read_only_engine)
+    try:
+        yield db
+    finally:
+        db.close()
@@ -1,14 +1,20 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import PlainTextResponse
 
 from app.api.v1.router import api_router
 from app.core.config import settings
+from app.core.logging import RequestIdMiddleware, setup_logging
+from app.core.metrics import MetricsMiddleware, registry
+from app.core.query_debug import QueryDebugMiddleware
 
 
 def create_application() -> FastAPI:
     """
     Create and configure the FastAPI application instance.
     """
+    setup_logging()
+
     app = FastAPI(
         title=settings.PROJECT_NAME,
         version=settings.VERSION,
@@ -28,6 +34,23 @@ def create_application() -> FastAPI:
         allow_headers=["*"],
     )
 
+    # ---------------------------------------
+    # N+1 / query budget detection (development)
+    # ---------------------------------------
+    if settings.QUERY_DEBUG:
+        app.add_middleware(QueryDebugMiddleware)
+
+    # ---------------------------------------
+    # Metrics
+    # ---------------------------------------
+    if settings.METRICS_ENABLED:
+        app.add_middleware(MetricsMiddleware)
+
+    # ---------------------------------------
+    # Request correlation (outermost)
+    # ---------------------------------------
+    app.add_middleware(RequestIdMiddleware)
+
     # ---------------------------------------
     # API Routers
     # ---------------------------------------
@@ -44,6 +67,17 @@ def create_application() -> FastAPI:
             "version": settings.VERSION,
         }
 
+    # ---------------------------------------
+    # Prometheus Metrics
+    # ---------------------------------------
+    if settings.METRICS_ENABLED:
+        @app.get("/metrics", include_in_schema=False)
+        async def metrics():
+            return PlainTextResponse(
+                registry.render(),
+                media_type="text/plain; version=0.0.4",
+            )
+
     return app
 
 
@@ -0,0 +1,83 @@
+from datetime import datetime
+
+from sqlalchemy import (
+    Column,
+    Integer,
+    Numeric,
+    String,
+    Date,
+    DateTime,
+    ForeignKey,
+)
+
+from app.db.base import Base
+
+
+class ArchiveBatch(Base):
+    """
+    One batch of bookings moved to Parquet by app.services.archive,
+    with the row counts its files were verified against.
+    """
+
+    __tablename__ = "archive_batches"
+
+    # Directory name under ARCHIVE_DIR
+    name = Column(String(64), primary_key=True)
+
+    bookings = Column(Integer, nullable=False)
+    payments = Column(Integer, nullable=False)
+    reviews = Column(Integer, nullable=False)
+
+    first_check_in = Column(Date, nullable=False)
+    last_check_out = Column(Date, nullable=False)
+
+    archived_at = Column(
+        DateTime,
+        nullable=False,
+        default=datetime.utcnow,
+    )
+
+    def __repr__(self) -> str:
+        return f"<ArchiveBatch name={self.name} bookings={self.bookings}>"
+
+
+class ArchivedRevenue(Base):
+    """
+    PAID revenue per (day, method) of archived payments. Added into
+    revenue_ledger by app.services.revenue; never written directly.
+    """
+
+    __tablename__ = "archived_revenue"
+
+    day = Column(Date, primary_key=True)
+    method = Column(String(50), primary_key=True)
+
+    amount = Column(Numeric(14, 2), nullable=False, default=0)
+    payments = Column(Integer, nullable=False, default=0)
+
+    def __repr__(self) -> str:
+        return f"<ArchivedRevenue day={self.day} method={self.method} amount={self.amount}>"
+
+
+class ArchivedGuestStats(Base):
+    """
+    Stay and spend figures of a guest's archived bookings. Added into
+    guest_stats by app.services.guest_stats; never written directly.
+    """
+
+    __tablename__ = "archived_guest_stats"
+
+    guest_id = Column(
+        Integer,
+        ForeignKey("guests.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+
+    stays = Column(Integer, nullable=False, default=0)
+    nights = Column(Integer, nullable=False, default=0)
+    last_stay = Column(Date, nullable=True)
+
+    paid_total = Column(Numeric(12, 2), nullable=False, default=0)
+
+    def __repr__(self) -> str:
+        return f"<ArchivedGuestStats guest_id={self.guest_id} stays={self.stays}>"
@@ -1,14 +1,18 @@
 from datetime import date, datetime
 
 from sqlalchemy import (
+    DDL,
     Column,
     Integer,
     String,
     Date,
     DateTime,
     ForeignKey,
+    Index,
     Numeric,
     Text,
+    event,
+    text,
 )
 from sqlalchemy.orm import relationship
 
@@ -21,11 +25,41 @@ class Booking(Base):
     """
 
     __tablename__ = "bookings"
+    __table_args__ = (
+        Index("idx_bookings_room_id", "room_id"),
+        Index("idx_bookings_guest_id", "guest_id"),
+        Index("idx_bookings_dates", "check_in", "check_out"),
+        Index("idx_bookings_status", "status"),
+        # Overlap checks (app.services.availability): room_id = ? AND
+        # check_out > ? AND check_in < ? AND check_in > ?, all bounded
+        # inside the index
+        Index(
+            "idx_bookings_overlap",
+            "room_id",
+            "check_out",
+            "check_in",
+            postgresql_where=text("status = 'CONFIRMED'"),
+        ),
+        # Expiry sweep (app.tasks.cleanup): only bookings still
+        # CONFIRMED are indexed
+        Index(
+            "idx_bookings_confirmed_created",
+            "created_at",
+            postgresql_where=text("status = 'CONFIRMED'"),
+        ),
+        # idx_bookings_guest_trgm (typeahead) needs pg_trgm and is only
+        # created by database/schemas.sql and the migrations
+        # Yearly partitions are managed by app.db.partitions
+        {"postgresql_partition_by": "RANGE (check_in)"},
+    )
 
     # -------------------------------------------------
     # Primary Key
     # -------------------------------------------------
-    id = Column(Integer, primary_key=True, index=True)
+    # The table key is (id, check_in) because Postgres requires the
+    # partition key in it; ids are still unique (one sequence) and the
+    # ORM identifies rows by id alone (see __mapper_args__).
+    id = Column(Integer, primary_key=True, autoincrement=True)
 
     # -------------------------------------------------
     # Relationships
@@ -34,21 +68,27 @@ class Booking(Base):
         Integer,
         ForeignKey("rooms.id", ondelete="RESTRICT"),
         nullable=False,
-        index=True,
+    )
+
+    # Linked by normalized email (app.services.guest_stats)
+    guest_id = Column(
+        Integer,
+        ForeignKey("guests.id", ondelete="SET NULL"),
+        nullable=True,
     )
 
     # -------------------------------------------------
     # Guest snapshot data
     # -------------------------------------------------
     guest_name = Column(String(255), nullable=False)
-    guest_email = Column(String(255), nullable=False, index=True)
+    guest_email = Column(String(255), nullable=False)
     guest_phone = Column(String(50), nullable=False)
 
     # -------------------------------------------------
     # Stay details
     # -------------------------------------------------
-    check_in = Column(Date, nullable=False, index=True)
-    check_out = Column(Date, nullable=False, index=True)
+    check_in = Column(Date, primary_key=True, nullable=False)
+    check_out = Column(Date, nullable=False)
     adults = Column(Integer, nullable=False, default=1)
     children = Column(Integer, nullable=False, default=0)
 
@@ -64,7 +104,6 @@ class Booking(Base):
         String(50),
         nullable=False,
         default="CONFIRMED",  # CONFIRMED | CANCELLED | COMPLETED
-        index=True,
     )
 
     special_requests = Column(Text, nullable=True)
@@ -87,25 +126,32 @@ class Booking(Base):
     # -------------------------------------------------
     # ORM Relationships
     # -------------------------------------------------
+    # Loading strategy is chosen per query (see app.db.loaders)
     room = relationship(
         "Room",
         back_populates="bookings",
-        lazy="joined",
     )
 
+    # payments / reviews cannot carry a database foreign key to a
+    # partitioned bookings table, so these joins and the delete cascade
+    # live in the ORM only
     payments = relationship(
         "Payment",
+        primaryjoin="Booking.id == foreign(Payment.booking_id)",
         back_populates="booking",
         cascade="all, delete-orphan",
     )
 
     review = relationship(
         "Review",
+        primaryjoin="Booking.id == foreign(Review.booking_id)",
         back_populates="booking",
         uselist=False,
         cascade="all, delete-orphan",
     )
 
+    __mapper_args__ = {"primary_key": [id]}
+
     def __repr__(self) -> str:
         return (
             f"<Booking id={self.id} "
@@ -114,3 +160,11 @@ class Booking(Base):
             f"check_out={self.check_out} "
             f"status={self.status}>"
         )
+
+
+# Catch-all for check_in dates without a yearly partition yet
+event.listen(
+    Booking.__table__,
+    "after_create",
+    DDL("CREATE TABLE bookings_default PARTITION OF bookings DEFAULT"),
+)
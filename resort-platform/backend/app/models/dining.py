@@ -7,6 +7,7 @@ from sqlalchemy import (
     Boolean,
     Numeric,
     DateTime,
+    Index,
     Text,
 )
 from sqlalchemy.orm import relationship
@@ -20,8 +21,12 @@ class DiningItem(Base):
     """
 
     __tablename__ = "dining_items"
+    __table_args__ = (
+        Index("idx_dining_available", "is_available"),
+        Index("idx_dining_order", "display_order"),
+    )
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
 
     name = Column(String(255), nullable=False)
     description = Column(Text, nullable=True)
@@ -6,6 +6,8 @@ from sqlalchemy import (
     String,
     Boolean,
     DateTime,
+    Index,
+    text,
 )
 from sqlalchemy.orm import relationship
 
@@ -18,11 +20,17 @@ class Guest(Base):
     """
 
     __tablename__ = "guests"
+    __table_args__ = (
+        # Booking -> guest linkage matches on normalized email
+        Index("idx_guests_email_normalized", text("lower(trim(email))")),
+        # idx_guests_trgm (typeahead) needs pg_trgm and is only created
+        # by database/schemas.sql and the migrations
+    )
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
 
     full_name = Column(String(255), nullable=False)
-    email = Column(String(255), nullable=False, unique=True, index=True)
+    email = Column(String(255), nullable=False, unique=True)
     phone = Column(String(50), nullable=True)
 
     hashed_password = Column(String(255), nullable=True)
@@ -0,0 +1,43 @@
+from datetime import datetime
+
+from sqlalchemy import (
+    Column,
+    Integer,
+    Numeric,
+    Date,
+    DateTime,
+    ForeignKey,
+)
+
+from app.db.base import Base
+
+
+class GuestStats(Base):
+    """
+    Lifetime stay and spend figures per guest.
+    Maintained by app.services.guest_stats; never written directly.
+    """
+
+    __tablename__ = "guest_stats"
+
+    guest_id = Column(
+        Integer,
+        ForeignKey("guests.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+
+    # Non-cancelled bookings that have checked out (no upcoming stays)
+    stays = Column(Integer, nullable=False, default=0)
+    nights = Column(Integer, nullable=False, default=0)
+    last_stay = Column(Date, nullable=True)  # latest check-out
+
+    paid_total = Column(Numeric(12, 2), nullable=False, default=0)
+
+    updated_at = Column(
+        DateTime,
+        nullable=False,
+        default=datetime.utcnow,
+    )
+
+    def __repr__(self) -> str:
+        return f"<GuestStats guest_id={self.guest_id} stays={self.stays} paid_total={self.paid_total}>"
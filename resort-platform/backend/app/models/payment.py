@@ -1,12 +1,15 @@
 from datetime import datetime
 
 from sqlalchemy import (
+    DDL,
     Column,
     Integer,
     Numeric,
     String,
     DateTime,
-    ForeignKey,
+    Index,
+    event,
+    text,
 )
 from sqlalchemy.orm import relationship
 
@@ -19,14 +22,30 @@ class Payment(Base):
     """
 
     __tablename__ = "payments"
+    __table_args__ = (
+        Index("idx_payments_booking_id", "booking_id"),
+        Index("idx_payments_status", "status"),
+        Index("idx_payments_reference_id", "reference_id"),
+        # Admin list, newest first
+        Index("idx_payments_created_at", "created_at"),
+        # Revenue ledger buckets (app.services.revenue.REVENUE_DAY)
+        Index(
+            "idx_payments_revenue_day",
+            text("(coalesce(paid_at, created_at)::date)"),
+            "method",
+            postgresql_where=text("status = 'PAID'"),
+        ),
+        # Yearly partitions are managed by app.db.partitions
+        {"postgresql_partition_by": "RANGE (created_at)"},
+    )
 
-    id = Column(Integer, primary_key=True, index=True)
+    # Table key is (id, created_at), see Booking.id
+    id = Column(Integer, primary_key=True, autoincrement=True)
 
+    # No database foreign key: bookings is partitioned (see Booking.payments)
     booking_id = Column(
         Integer,
-        ForeignKey("bookings.id", ondelete="CASCADE"),
         nullable=False,
-        index=True,
     )
 
     amount = Column(Numeric(10, 2), nullable=False)
@@ -43,14 +62,26 @@ class Payment(Base):
 
     created_at = Column(
         DateTime,
+        primary_key=True,
         nullable=False,
         default=datetime.utcnow,
     )
 
     booking = relationship(
         "Booking",
+        primaryjoin="Booking.id == foreign(Payment.booking_id)",
         back_populates="payments",
     )
 
+    __mapper_args__ = {"primary_key": [id]}
+
     def __repr__(self) -> str:
         return f"<Payment id={self.id} booking_id={self.booking_id} amount={self.amount}>"
+
+
+# Catch-all for created_at values without a yearly partition yet
+event.listen(
+    Payment.__table__,
+    "after_create",
+    DDL("CREATE TABLE payments_default PARTITION OF payments DEFAULT"),
+)
@@ -0,0 +1,63 @@
+from datetime import datetime
+
+from sqlalchemy import (
+    BigInteger,
+    Column,
+    DateTime,
+    Index,
+    String,
+    Text,
+    text,
+)
+
+from app.db.base import Base
+
+
+class PaymentEvent(Base):
+    """
+    Raw payment gateway webhook, stored exactly as received.
+    Rows are only ever inserted, then stamped once processed.
+    """
+
+    __tablename__ = "payment_events"
+    __table_args__ = (
+        # Consumer queue: only unprocessed rows are indexed
+        Index(
+            "idx_payment_events_pending",
+            "id",
+            postgresql_where=text("processed_at IS NULL"),
+        ),
+    )
+
+    id = Column(BigInteger, primary_key=True)
+
+    provider = Column(String(50), nullable=False)
+    payload = Column(Text, nullable=False)
+
+    received_at = Column(
+        DateTime,
+        nullable=False,
+        default=datetime.utcnow,
+    )
+    processed_at = Column(DateTime, nullable=True)
+    error = Column(String(255), nullable=True)
+
+    def __repr__(self) -> str:
+        return f"<PaymentEvent id={self.id} provider={self.provider} processed_at={self.processed_at}>"
+
+
+class PaymentEventKey(Base):
+    """
+    Provider event ids that have been applied; used to drop gateway
+    retries of the same event.
+    """
+
+    __tablename__ = "payment_event_keys"
+
+    provider = Column(String(50), primary_key=True)
+    event_id = Column(String(255), primary_key=True)
+
+    payment_event_id = Column(BigInteger, nullable=False)
+
+    def __repr__(self) -> str:
+        return f"<PaymentEventKey provider={self.provider} event_id={self.event_id}>"
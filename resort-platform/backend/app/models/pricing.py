@@ -7,6 +7,7 @@ from sqlalchemy import (
     Date,
     String,
     ForeignKey,
+    Index,
 )
 from sqlalchemy.orm import relationship
 
@@ -19,14 +20,17 @@ class PricingRule(Base):
     """
 
     __tablename__ = "pricing_rules"
+    __table_args__ = (
+        Index("idx_pricing_room_id", "room_id"),
+        Index("idx_pricing_dates", "start_date", "end_date"),
+    )
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
 
     room_id = Column(
         Integer,
         ForeignKey("rooms.id", ondelete="CASCADE"),
         nullable=False,
-        index=True,
     )
 
     name = Column(String(255), nullable=True)
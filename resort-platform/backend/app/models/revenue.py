@@ -0,0 +1,37 @@
+from datetime import datetime
+
+from sqlalchemy import (
+    Column,
+    Integer,
+    Numeric,
+    String,
+    Date,
+    DateTime,
+)
+
+from app.db.base import Base
+
+
+class RevenueLedger(Base):
+    """
+    PAID revenue per day and payment method.
+    Maintained by app.services.revenue; never written directly.
+    """
+
+    __tablename__ = "revenue_ledger"
+
+    # Day of paid_at (created_at for legacy rows without one), UTC
+    day = Column(Date, primary_key=True)
+    method = Column(String(50), primary_key=True)
+
+    amount = Column(Numeric(14, 2), nullable=False, default=0)
+    payments = Column(Integer, nullable=False, default=0)
+
+    updated_at = Column(
+        DateTime,
+        nullable=False,
+        default=datetime.utcnow,
+    )
+
+    def __repr__(self) -> str:
+        return f"<RevenueLedger day={self.day} method={self.method} amount={self.amount}>"
@@ -2,17 +2,22 @@ from datetime import datetime
 
 from sqlalchemy import (
     Column,
+    Computed,
     Integer,
     String,
     Boolean,
     DateTime,
     Text,
-    ForeignKey,
+    Index,
+    text,
 )
-from sqlalchemy.orm import relationship
+from sqlalchemy.dialects.postgresql import TSVECTOR
+from sqlalchemy.orm import deferred, relationship
 
 from app.db.base import Base
 
+SEARCH_CONFIG = "english"
+
 
 class Review(Base):
     """
@@ -20,15 +25,24 @@ class Review(Base):
     """
 
     __tablename__ = "reviews"
+    __table_args__ = (
+        Index("idx_reviews_approved", "is_approved"),
+        Index("idx_reviews_search", "search_vector", postgresql_using="gin"),
+        # Moderation queue: only pending rows are indexed
+        Index(
+            "idx_reviews_pending",
+            "id",
+            postgresql_where=text("is_approved = false"),
+        ),
+    )
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
 
+    # No database foreign key: bookings is partitioned (see Booking.review)
     booking_id = Column(
         Integer,
-        ForeignKey("bookings.id", ondelete="CASCADE"),
         nullable=False,
         unique=True,
-        index=True,
     )
 
     guest_name = Column(String(255), nullable=False)
@@ -43,8 +57,21 @@ class Review(Base):
         default=datetime.utcnow,
     )
 
+    # Maintained by Postgres; guest name ranks above comment text
+    search_vector = deferred(
+        Column(
+            TSVECTOR,
+            Computed(
+                f"setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(guest_name, '')), 'A') || "
+                f"setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(comment, '')), 'B')",
+                persisted=True,
+            ),
+        )
+    )
+
     booking = relationship(
         "Booking",
+        primaryjoin="Booking.id == foreign(Review.booking_id)",
         back_populates="review",
     )
 
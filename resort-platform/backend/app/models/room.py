@@ -7,9 +7,10 @@ from sqlalchemy import (
     Boolean,
     Numeric,
     DateTime,
-    JSON,
+    Index,
     Text,
 )
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import relationship
 
 from app.db.base import Base
@@ -21,8 +22,18 @@ class Room(Base):
     """
 
     __tablename__ = "rooms"
+    __table_args__ = (
+        Index("idx_rooms_active", "is_active"),
+        # Amenity containment (amenities @> '{"pool": true}')
+        Index(
+            "idx_rooms_amenities",
+            "amenities",
+            postgresql_using="gin",
+            postgresql_ops={"amenities": "jsonb_path_ops"},
+        ),
+    )
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
 
     name = Column(String(255), nullable=False)
     description = Column(Text, nullable=True)
@@ -32,7 +43,12 @@ class Room(Base):
     max_adults = Column(Integer, nullable=False, default=2)
     max_children = Column(Integer, nullable=False, default=0)
 
-    amenities = Column(JSON, nullable=True)
+    # Flags keyed by amenity, e.g. {"pool": true, "sea_view": true}
+    amenities = Column(JSONB, nullable=True)
+
+    # Bumped whenever base_price or a pricing rule of the room changes;
+    # part of the price quote cache key (app.services.pricing_engine)
+    pricing_version = Column(Integer, nullable=False, default=1)
 
     is_active = Column(Boolean, nullable=False, default=True)
     display_order = Column(Integer, nullable=False, default=0)
@@ -0,0 +1,51 @@
+from datetime import datetime
+
+from sqlalchemy import (
+    Column,
+    Integer,
+    Numeric,
+    Date,
+    DateTime,
+    ForeignKey,
+)
+
+from app.db.base import Base
+
+
+class YieldRate(Base):
+    """
+    Demand signals and the resulting rate for one room-night.
+    Maintained by app.services.yield_pricing; never written directly.
+    """
+
+    __tablename__ = "yield_rates"
+
+    room_id = Column(
+        Integer,
+        ForeignKey("rooms.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    night = Column(Date, primary_key=True)
+
+    # Resort-wide share of active rooms: on the books now, booked within
+    # the pickup window, and on the books at the same lead time for the
+    # same weekday last year
+    occupancy = Column(Numeric(5, 4), nullable=False)
+    pickup = Column(Numeric(5, 4), nullable=False)
+    last_year_occupancy = Column(Numeric(5, 4), nullable=False)
+
+    # Seasonal rule or base price the suggestion starts from
+    static_rate = Column(Numeric(10, 2), nullable=False)
+    suggested_rate = Column(Numeric(10, 2), nullable=False)
+
+    # Quoted instead of the static rate while set
+    applied_rate = Column(Numeric(10, 2), nullable=True)
+
+    computed_at = Column(
+        DateTime,
+        nullable=False,
+        default=datetime.utcnow,
+    )
+
+    def __repr__(self) -> str:
+        return f"<YieldRate room_id={self.room_id} night={self.night} suggested={self.suggested_rate}>"
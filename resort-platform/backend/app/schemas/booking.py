@@ -38,3 +38,10 @@ class BookingOut(BookingBase):
 
     class Config:
         from_attributes = True
+
+
+class BookingBalanceOut(BaseModel):
+    id: int
+    total_amount: Decimal
+    paid_total: Decimal
+    outstanding: Decimal
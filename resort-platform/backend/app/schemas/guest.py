@@ -1,3 +1,5 @@
+from datetime import date
+from decimal import Decimal
 from typing import Optional
 
 from pydantic import BaseModel, EmailStr
@@ -24,3 +26,14 @@ class GuestOut(GuestBase):
 
     class Config:
         from_attributes = True
+
+
+class GuestStatsOut(BaseModel):
+    guest_id: int
+    stays: int
+    nights: int
+    last_stay: Optional[date] = None
+    paid_total: Decimal
+
+    class Config:
+        from_attributes = True
@@ -1,6 +1,6 @@
 from datetime import datetime
 from decimal import Decimal
-from typing import Optional
+from typing import Dict, List, Optional
 
 from pydantic import BaseModel
 
@@ -28,3 +28,25 @@ class PaymentOut(PaymentBase):
 
     class Config:
         from_attributes = True
+
+
+class SettlementMismatchOut(BaseModel):
+    line: int
+    reference_id: str
+    reason: str
+    file_status: str
+    file_amount: str
+    payment_id: Optional[int] = None
+    payment_status: Optional[str] = None
+    payment_amount: Optional[Decimal] = None
+
+
+class ReconciliationOut(BaseModel):
+    lines: int
+    marked_paid: int
+    marked_failed: int
+    unchanged: int
+    mismatches: int
+    by_reason: Dict[str, int]
+    # First mismatches only; use the CLI for the full report
+    sample: List[SettlementMismatchOut]
@@ -1,6 +1,6 @@
 from datetime import date
 from decimal import Decimal
-from typing import Optional
+from typing import List, Optional
 
 from pydantic import BaseModel
 
@@ -29,3 +29,21 @@ class PricingOut(PricingBase):
 
     class Config:
         from_attributes = True
+
+
+class RateGridRoom(BaseModel):
+    room_id: int
+    name: str
+    # One entry per night of RateGridOut.nights
+    rates: List[Decimal]
+    booked: Optional[List[bool]] = None
+
+
+class RateGridOut(BaseModel):
+    start: date
+    end: date
+    currency: str
+    nights: List[date]
+    rooms: List[RateGridRoom]
+    # Share of active rooms booked per night (occupancy overlay only)
+    occupancy: Optional[List[float]] = None
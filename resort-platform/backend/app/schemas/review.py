@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import List, Optional
 
 from pydantic import BaseModel, Field
 
@@ -26,3 +26,15 @@ class ReviewOut(ReviewBase):
 
     class Config:
         from_attributes = True
+
+
+class ReviewSearchHit(ReviewOut):
+    rank: float
+
+
+class ReviewBulkAction(BaseModel):
+    ids: List[int] = Field(min_length=1, max_length=500)
+
+
+class ReviewBulkResult(BaseModel):
+    affected: int
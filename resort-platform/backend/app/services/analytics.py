@@ -1,23 +1,35 @@
+from datetime import date
+from decimal import Decimal
+from typing import Optional
+
 from sqlalchemy.orm import Session
 from sqlalchemy import func
 
+from app.models.archive import ArchiveBatch
 from app.models.booking import Booking
-from app.models.payment import Payment
+from app.services.revenue import revenue_totals
 
 
 def get_booking_count(db: Session) -> int:
     """
-    Return total number of bookings.
+    Return total number of bookings, archived ones included.
     """
-    return db.query(func.count(Booking.id)).scalar() or 0
+    live = db.query(func.count(Booking.id)).scalar() or 0
+    archived = db.query(func.sum(ArchiveBatch.bookings)).scalar() or 0
+    return live + archived
 
 
-def get_total_revenue(db: Session):
+def get_total_revenue(
+    db: Session,
+    start: Optional[date] = None,
+    end: Optional[date] = None,
+    method: Optional[str] = None,
+):
     """
-    Return total paid revenue.
+    Return total paid revenue, optionally for days in [start, end) and
+    one payment method. Read from the revenue ledger.
     """
-    return (
-        db.query(func.coalesce(func.sum(Payment.amount), 0))
-        .filter(Payment.status == "PAID")
-        .scalar()
-    )
+    totals = revenue_totals(db, start, end)
+    if method is not None:
+        return totals.get(method, Decimal("0"))
+    return sum(totals.values(), Decimal("0"))
@@ -0,0 +1,389 @@
+import glob
+import os
+import shutil
+from datetime import date, timedelta
+from typing import Dict, List, Optional, Tuple
+
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+from sqlalchemy import (
+    BigInteger,
+    Boolean,
+    Date,
+    DateTime,
+    Integer,
+    Numeric,
+    String,
+    Table,
+    delete,
+    func,
+    select,
+)
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.models.archive import ArchiveBatch, ArchivedGuestStats, ArchivedRevenue
+from app.models.booking import Booking
+from app.models.payment import Payment
+from app.models.review import Review
+from app.services.guest_stats import refresh_guest_stats
+from app.services.revenue import REVENUE_DAY, paid_buckets, refresh_revenue
+
+# -------------------------------------------------
+# Booking archive
+# -------------------------------------------------
+# Completed and cancelled bookings past ARCHIVE_AFTER_DAYS are moved, in
+# batches, to ARCHIVE_DIR/<batch>/{bookings,payments,reviews}.parquet
+# together with their payments and reviews. A batch is written under
+# .staging/, read back and compared, and only then deleted from Postgres
+# in one transaction that also records it in archive_batches; after the
+# commit the directory is renamed into place. Revenue and guest totals of
+# archived rows carry over through archived_revenue / archived_guest_stats.
+
+ARCHIVE_STATUSES = ("COMPLETED", "CANCELLED")
+
+ARCHIVE_TABLES: Dict[str, Table] = {
+    "bookings": Booking.__table__,
+    "payments": Payment.__table__,
+    "reviews": Review.__table__,
+}
+
+STAGING = ".staging"
+
+# Serializes archivers; arbitrary but fixed
+ARCHIVE_LOCK_ID = 0x61726368
+
+
+def _columns(table: Table) -> list:
+    # Generated columns (reviews.search_vector) are derived, not archived
+    return [column for column in table.columns if column.computed is None]
+
+
+def _arrow_type(type_) -> pa.DataType:
+    if isinstance(type_, Numeric):
+        return pa.decimal128(type_.precision, type_.scale)
+    if isinstance(type_, BigInteger):
+        return pa.int64()
+    if isinstance(type_, Integer):
+        return pa.int32()
+    if isinstance(type_, DateTime):
+        return pa.timestamp("us")
+    if isinstance(type_, Date):
+        return pa.date32()
+    if isinstance(type_, Boolean):
+        return pa.bool_()
+    if isinstance(type_, String):
+        return pa.string()
+    raise TypeError(f"No Parquet type for {type_!r}")
+
+
+def arrow_schema(table: Table) -> pa.Schema:
+    return pa.schema(
+        [
+            pa.field(column.name, _arrow_type(column.type), nullable=column.nullable)
+            for column in _columns(table)
+        ]
+    )
+
+
+def archivable(cutoff: date) -> list:
+    """
+    Criteria for bookings that are due for the archive.
+    """
+    return [
+        Booking.status.in_(ARCHIVE_STATUSES),
+        Booking.check_out < cutoff,
+        # Implied by the above; lets the planner skip newer partitions
+        Booking.check_in < cutoff,
+    ]
+
+
+# -------------------------------------------------
+# Files
+# -------------------------------------------------
+
+def _fsync(path: str) -> None:
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def _write_batch(path: str, tables: Dict[str, pa.Table]) -> None:
+    shutil.rmtree(path, ignore_errors=True)
+    os.makedirs(path)
+
+    for name, table in tables.items():
+        file = os.path.join(path, f"{name}.parquet")
+        pq.write_table(table, file, compression="zstd")
+        _fsync(file)
+        # Read back before a single row is deleted
+        if not pq.read_table(file, schema=table.schema).equals(table):
+            raise RuntimeError(f"Archive file {file} does not match the rows written")
+        os.chmod(file, 0o444)
+    _fsync(path)
+
+
+def _promote(directory: str, name: str) -> None:
+    try:
+        os.replace(os.path.join(directory, STAGING, name), os.path.join(directory, name))
+    except FileNotFoundError:
+        # Already promoted by another run's recovery
+        return
+    _fsync(directory)
+
+
+def _recover(connection: Connection, directory: str) -> None:
+    """
+    Settle batches left in .staging by an interrupted run: committed
+    ones are promoted, the rest (rows still in Postgres) are removed.
+    Must run under ARCHIVE_LOCK_ID.
+    """
+    staging = os.path.join(directory, STAGING)
+    if not os.path.isdir(staging):
+        return
+
+    names = os.listdir(staging)
+    committed = set(
+        connection.execute(
+            select(ArchiveBatch.name).where(ArchiveBatch.name.in_(names))
+        ).scalars()
+    )
+    for name in names:
+        if name in committed:
+            _promote(directory, name)
+        else:
+            shutil.rmtree(os.path.join(staging, name))
+
+
+# -------------------------------------------------
+# Carried-over totals
+# -------------------------------------------------
+
+def _carry_over_revenue(connection: Connection, booking_ids: List[int]) -> None:
+    rows = (
+        select(REVENUE_DAY, Payment.method, func.sum(Payment.amount), func.count())
+        .where(Payment.booking_id.in_(booking_ids), Payment.status == "PAID")
+        .group_by(REVENUE_DAY, Payment.method)
+    )
+    stmt = insert(ArchivedRevenue).from_select(["day", "method", "amount", "payments"], rows)
+    archived = ArchivedRevenue.__table__
+    connection.execute(
+        stmt.on_conflict_do_update(
+            index_elements=[ArchivedRevenue.day, ArchivedRevenue.method],
+            set_={
+                "amount": archived.c.amount + stmt.excluded.amount,
+                "payments": archived.c.payments + stmt.excluded.payments,
+            },
+        )
+    )
+
+
+def _carry_over_guest_stats(connection: Connection, booking_ids: List[int]) -> None:
+    # Same figures as app.services.guest_stats computes from live rows
+    active = Booking.status != "CANCELLED"
+    paid = (
+        select(Payment.booking_id, func.sum(Payment.amount).label("amount"))
+        .where(Payment.booking_id.in_(booking_ids), Payment.status == "PAID")
+        .group_by(Payment.booking_id)
+        .subquery()
+    )
+    rows = (
+        select(
+            Booking.guest_id,
+            func.count().filter(active),
+            func.coalesce(func.sum(Booking.check_out - Booking.check_in).filter(active), 0),
+            func.max(Booking.check_out).filter(active),
+            func.coalesce(func.sum(paid.c.amount), 0),
+        )
+        .outerjoin(paid, paid.c.booking_id == Booking.id)
+        .where(Booking.id.in_(booking_ids), Booking.guest_id.is_not(None))
+        .group_by(Booking.guest_id)
+    )
+    stmt = insert(ArchivedGuestStats).from_select(
+        ["guest_id", "stays", "nights", "last_stay", "paid_total"],
+        rows,
+    )
+    archived = ArchivedGuestStats.__table__
+    connection.execute(
+        stmt.on_conflict_do_update(
+            index_elements=[ArchivedGuestStats.guest_id],
+            set_={
+                "stays": archived.c.stays + stmt.excluded.stays,
+                "nights": archived.c.nights + stmt.excluded.nights,
+                "last_stay": func.greatest(archived.c.last_stay, stmt.excluded.last_stay),
+                "paid_total": archived.c.paid_total + stmt.excluded.paid_total,
+            },
+        )
+    )
+
+
+def _delete(connection: Connection, statement, expected: int) -> None:
+    deleted = connection.execute(statement).rowcount
+    if deleted != expected:
+        # e.g. a payment added to an old booking after it was read
+        raise RuntimeError(
+            f"Archive delete from {statement.table.name} hit {deleted} rows, expected {expected}"
+        )
+
+
+# -------------------------------------------------
+# Archiving
+# -------------------------------------------------
+
+def _read(connection: Connection, table: Table, *criteria, order_by) -> pa.Table:
+    rows = connection.execute(
+        select(*_columns(table))
+        .where(*criteria)
+        .order_by(*order_by)
+        .with_for_update()
+    ).mappings()
+    return pa.Table.from_pylist([dict(row) for row in rows], schema=arrow_schema(table))
+
+
+def archive_batch(db: Session, directory: str, cutoff: date, batch_size: int) -> Tuple[int, int]:
+    """
+    Move up to `batch_size` archivable bookings, with their payments and
+    reviews, into one archive batch. Returns the number of bookings and
+    reviews moved; no bookings once nothing is left.
+    """
+    connection = db.connection()
+    connection.execute(select(func.pg_advisory_xact_lock(ARCHIVE_LOCK_ID)))
+    _recover(connection, directory)
+
+    # Locked until the commit, so nothing edits them mid-archive
+    booking_ids = list(
+        connection.execute(
+            select(Booking.id)
+            .where(*archivable(cutoff))
+            .order_by(Booking.check_in, Booking.id)
+            .limit(batch_size)
+            .with_for_update()
+        ).scalars()
+    )
+    if not booking_ids:
+        db.rollback()
+        return 0, 0
+
+    tables = {
+        "bookings": _read(connection, Booking.__table__, Booking.id.in_(booking_ids), order_by=[Booking.id]),
+        "payments": _read(connection, Payment.__table__, Payment.booking_id.in_(booking_ids), order_by=[Payment.id]),
+        "reviews": _read(connection, Review.__table__, Review.booking_id.in_(booking_ids), order_by=[Review.id]),
+    }
+    bookings = tables["bookings"]
+    name = f"{min(booking_ids):010d}-{max(booking_ids):010d}"
+    staging = os.path.join(directory, STAGING, name)
+
+    try:
+        _write_batch(staging, tables)
+
+        buckets = paid_buckets(connection, tables["payments"].column("id").to_pylist())
+        guest_ids = set(bookings.column("guest_id").to_pylist())
+        _carry_over_revenue(connection, booking_ids)
+        _carry_over_guest_stats(connection, booking_ids)
+
+        _delete(connection, delete(Review).where(Review.booking_id.in_(booking_ids)), tables["reviews"].num_rows)
+        _delete(connection, delete(Payment).where(Payment.booking_id.in_(booking_ids)), tables["payments"].num_rows)
+        _delete(
+            connection,
+            delete(Booking).where(
+                Booking.id.in_(booking_ids),
+                Booking.check_in < cutoff,
+            ),
+            bookings.num_rows,
+        )
+
+        connection.execute(
+            insert(ArchiveBatch).values(
+                name=name,
+                bookings=bookings.num_rows,
+                payments=tables["payments"].num_rows,
+                reviews=tables["reviews"].num_rows,
+                first_check_in=min(bookings.column("check_in").to_pylist()),
+                last_check_out=max(bookings.column("check_out").to_pylist()),
+            )
+        )
+
+        # Unchanged totals: what left the live tables is now carried over
+        refresh_revenue(connection, buckets)
+        refresh_guest_stats(connection, guest_ids)
+
+        db.commit()
+    except Exception:
+        db.rollback()
+        shutil.rmtree(staging, ignore_errors=True)
+        raise
+
+    _promote(directory, name)
+    return bookings.num_rows, tables["reviews"].num_rows
+
+
+def archive_bookings(
+    db: Session,
+    directory: Optional[str] = None,
+    cutoff: Optional[date] = None,
+    batch_size: Optional[int] = None,
+) -> Tuple[int, int]:
+    """
+    Archive every booking due (default: checked out more than
+    ARCHIVE_AFTER_DAYS ago) into `directory` (default ARCHIVE_DIR).
+    Returns the number of bookings and reviews moved.
+    """
+    directory = directory or settings.ARCHIVE_DIR
+    if not directory:
+        return 0, 0
+
+    cutoff = cutoff or date.today() - timedelta(days=settings.ARCHIVE_AFTER_DAYS)
+    batch_size = batch_size or settings.ARCHIVE_BATCH_SIZE
+    os.makedirs(os.path.join(directory, STAGING), exist_ok=True)
+
+    moved = reviews = 0
+    while True:
+        batch, batch_reviews = archive_batch(db, directory, cutoff, batch_size)
+        if not batch:
+            return moved, reviews
+        moved += batch
+        reviews += batch_reviews
+
+
+# -------------------------------------------------
+# Reads
+# -------------------------------------------------
+
+def archive_dataset(table: str, directory: Optional[str] = None) -> ds.Dataset:
+    """
+    Read-only view of one archived table across all batches, e.g.
+
+        archive_dataset("payments").to_table(
+            columns=["method", "amount"],
+            filter=ds.field("status") == "PAID",
+        )
+
+    Filters on a column skip row groups whose statistics rule it out.
+    """
+    directory = directory or settings.ARCHIVE_DIR
+    files = sorted(glob.glob(os.path.join(directory, "*", f"{table}.parquet")))
+    return ds.dataset(files, schema=arrow_schema(ARCHIVE_TABLES[table]), format="parquet")
+
+
+def verify_archive(db: Session, directory: Optional[str] = None) -> List[str]:
+    """
+    Problems found comparing archive_batches with the files on disk.
+    Empty when every batch is complete.
+    """
+    directory = directory or settings.ARCHIVE_DIR
+    problems = []
+    for batch in db.query(ArchiveBatch).order_by(ArchiveBatch.name):
+        for table in ARCHIVE_TABLES:
+            path = os.path.join(directory, batch.name, f"{table}.parquet")
+            if not os.path.exists(path):
+                problems.append(f"{path}: missing")
+                continue
+            rows = pq.ParquetFile(path).metadata.num_rows
+            if rows != getattr(batch, table):
+                problems.append(f"{path}: {rows} rows, expected {getattr(batch, table)}")
+    return problems
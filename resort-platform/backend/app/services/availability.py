@@ -1,8 +1,14 @@
-from datetime import date
+from datetime import date, timedelta
+from sqlalchemy import Select, select
 from sqlalchemy.orm import Session
 
 from app.models.booking import Booking
 
+# Longest stay a booking may span. Overlap checks rely on it for a lower
+# bound on check_in, which lets Postgres skip the bookings partitions of
+# years that cannot overlap.
+MAX_STAY_NIGHTS = 365
+
 
 def is_room_available(
     db: Session,
@@ -13,15 +19,19 @@ def is_room_available(
     """
     Check whether a room is available for the given date range.
     """
-    overlapping_booking = (
-        db.query(Booking)
-        .filter(
-            Booking.room_id == room_id,
-            Booking.status == "CONFIRMED",
-            Booking.check_in < check_out,
-            Booking.check_out > check_in,
-        )
-        .first()
-    )
+    overlapping = db.execute(overlapping_bookings(room_id, check_in, check_out).limit(1)).first()
+    return overlapping is None
+
 
-    return overlapping_booking is None
+def overlapping_bookings(room_id, check_in: date, check_out: date) -> Select:
+    """
+    Confirmed bookings of `room_id` (a value or a correlated column such
+    as Room.id) that overlap [check_in, check_out).
+    """
+    return select(Booking.id).where(
+        Booking.room_id == room_id,
+        Booking.status == "CONFIRMED",
+        Booking.check_in < check_out,
+        Booking.check_in > check_in - timedelta(days=MAX_STAY_NIGHTS),
+        Booking.check_out > check_in,
+    )
@@ -0,0 +1,130 @@
+import gzip
+import os
+from typing import Any, Callable, Dict, Optional
+
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.serialization import dumps, field_names, schema_columns
+from app.models.dining import DiningItem
+from app.models.review import Review
+from app.models.room import Room
+from app.schemas.dining import DiningOut
+from app.schemas.review import ReviewOut
+from app.schemas.room import RoomOut
+
+# -------------------------------------------------
+# Public catalog snapshots
+# -------------------------------------------------
+# The public catalog changes only when an admin edits it. After each such
+# write the documents below are rendered once to CATALOG_DIR as
+# <name>.json and <name>.json.gz. nginx serves those files for
+# /api/v1/catalog/<name> (gzip_static), and the same documents are
+# rendered live by the API when a file is missing.
+
+# Serializes publishers across workers; arbitrary but fixed
+CATALOG_LOCK_ID = 0x6361746C
+
+
+def _rows(db: Session, model: type, schema: type, *criteria, order_by=(), limit=None) -> list:
+    keys = field_names(schema)
+    query = (
+        db.query(*schema_columns(model, schema))
+        .filter(*criteria)
+        .order_by(*order_by)
+        .limit(limit)
+    )
+    return [dict(zip(keys, row)) for row in query]
+
+
+def build_rooms(db: Session) -> list:
+    """
+    Active rooms, as returned by GET /rooms/.
+    """
+    return _rows(db, Room, RoomOut, Room.is_active.is_(True), order_by=[Room.display_order.asc()])
+
+
+def build_dining(db: Session) -> Dict[str, list]:
+    """
+    Dining items grouped by meal_type, each group in display order.
+    """
+    menu: Dict[str, list] = {}
+    for item in _rows(db, DiningItem, DiningOut, order_by=[DiningItem.display_order.asc(), DiningItem.id]):
+        menu.setdefault(item["meal_type"], []).append(item)
+    return menu
+
+
+def build_reviews(db: Session) -> Dict[str, Any]:
+    """
+    Approved-review summary: count, average, rating histogram and the
+    latest reviews.
+    """
+    approved = Review.is_approved.is_(True)
+    stats = db.execute(
+        select(
+            func.count(),
+            func.round(func.avg(Review.rating), 2),
+            *(func.count().filter(Review.rating == rating) for rating in range(1, 6)),
+        ).where(approved)
+    ).one()
+
+    return {
+        "count": stats[0],
+        "average_rating": stats[1],
+        "ratings": {str(rating): stats[rating + 1] for rating in range(1, 6)},
+        "latest": _rows(
+            db,
+            Review,
+            ReviewOut,
+            approved,
+            order_by=[Review.created_at.desc(), Review.id.desc()],
+            limit=settings.CATALOG_LATEST_REVIEWS,
+        ),
+    }
+
+
+CATALOG_DOCUMENTS: Dict[str, Callable[[Session], Any]] = {
+    "rooms": build_rooms,
+    "dining": build_dining,
+    "reviews": build_reviews,
+}
+
+
+def render_catalog(db: Session, name: str) -> bytes:
+    return dumps(CATALOG_DOCUMENTS[name](db))
+
+
+def _write_atomic(path: str, body: bytes) -> None:
+    tmp = f"{path}.tmp"
+    with open(tmp, "wb") as handle:
+        handle.write(body)
+    os.replace(tmp, path)
+
+
+def publish_catalog(db: Session, directory: Optional[str] = None) -> bool:
+    """
+    Render every catalog document to `directory` (default CATALOG_DIR).
+    Returns False when publishing is not configured.
+    """
+    directory = directory or settings.CATALOG_DIR
+    if not directory:
+        return False
+
+    os.makedirs(directory, exist_ok=True)
+
+    # Concurrent publishers queue here; each one then reads a snapshot
+    # that includes every write committed before it got the lock, so an
+    # older snapshot can never overwrite a newer one.
+    db.execute(select(func.pg_advisory_xact_lock(CATALOG_LOCK_ID)))
+    try:
+        for name in CATALOG_DOCUMENTS:
+            body = render_catalog(db, name)
+            path = os.path.join(directory, f"{name}.json")
+            # .gz first, so a fresh .json never pairs with a stale .gz
+            _write_atomic(f"{path}.gz", gzip.compress(body, compresslevel=9, mtime=0))
+            _write_atomic(path, body)
+    finally:
+        db.rollback()
+
+    return True
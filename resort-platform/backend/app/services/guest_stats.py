@@ -0,0 +1,247 @@
+from datetime import date, timedelta
+from typing import Iterable, List, Optional, Set
+
+from sqlalchemy import event, func, inspect, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.models.archive import ArchivedGuestStats
+from app.models.booking import Booking
+from app.models.guest import Guest
+from app.models.guest_stats import GuestStats
+from app.models.payment import Payment
+from app.services.availability import MAX_STAY_NIGHTS
+
+# -------------------------------------------------
+# Guest linkage
+# -------------------------------------------------
+# Bookings keep the guest details they were made with; `guest_id` links
+# them to the CRM guest with the same normalized email, creating that
+# guest on first sight.
+
+
+def normalize_email(email: str) -> str:
+    return email.strip().lower()
+
+
+def _find_guest_id(connection: Connection, email: str) -> Optional[int]:
+    return connection.execute(
+        select(Guest.id)
+        .where(func.lower(func.trim(Guest.email)) == email)
+        .order_by(Guest.id)
+        .limit(1)
+    ).scalar()
+
+
+def resolve_guest_id(
+    connection: Connection,
+    name: str,
+    email: str,
+    phone: Optional[str],
+) -> int:
+    """
+    Id of the guest owning `email`, created if there is none yet.
+    """
+    email = normalize_email(email)
+
+    guest_id = _find_guest_id(connection, email)
+    if guest_id is None:
+        guest_id = connection.execute(
+            insert(Guest)
+            .values(full_name=name, email=email, phone=phone)
+            .on_conflict_do_nothing(index_elements=[Guest.email])
+            .returning(Guest.id)
+        ).scalar()
+    if guest_id is None:
+        # Created by a concurrent booking between the lookup and insert
+        guest_id = _find_guest_id(connection, email)
+
+    return guest_id
+
+
+# -------------------------------------------------
+# Lifetime stats
+# -------------------------------------------------
+# A stay counts once it has checked out; upcoming bookings do not.
+# Stays ending move into the figures without any write, so
+# python -m app.tasks.guest_stats refreshes those guests daily.
+
+def _stats_upsert(guest_ids: Optional[Iterable[int]] = None):
+    active = (Booking.status != "CANCELLED") & (Booking.check_out <= func.current_date())
+
+    stays = (
+        select(
+            Booking.guest_id,
+            func.count().filter(active).label("stays"),
+            func.sum(Booking.check_out - Booking.check_in).filter(active).label("nights"),
+            func.max(Booking.check_out).filter(active).label("last_stay"),
+        )
+        .group_by(Booking.guest_id)
+    )
+    paid = (
+        select(Booking.guest_id, func.sum(Payment.amount).label("paid_total"))
+        .join(Payment, Payment.booking_id == Booking.id)
+        .where(Payment.status == "PAID")
+        .group_by(Booking.guest_id)
+    )
+    guests = select(Guest.id)
+
+    if guest_ids is not None:
+        stays = stays.where(Booking.guest_id.in_(guest_ids))
+        paid = paid.where(Booking.guest_id.in_(guest_ids))
+        guests = guests.where(Guest.id.in_(guest_ids))
+    else:
+        stays = stays.where(Booking.guest_id.is_not(None))
+        paid = paid.where(Booking.guest_id.is_not(None))
+
+    stays = stays.subquery()
+    paid = paid.subquery()
+    guests = guests.subquery()
+    # Bookings moved out by app.services.archive
+    archived = ArchivedGuestStats.__table__
+
+    rows = (
+        select(
+            guests.c.id,
+            func.coalesce(stays.c.stays, 0) + func.coalesce(archived.c.stays, 0),
+            func.coalesce(stays.c.nights, 0) + func.coalesce(archived.c.nights, 0),
+            func.greatest(stays.c.last_stay, archived.c.last_stay),
+            func.coalesce(paid.c.paid_total, 0) + func.coalesce(archived.c.paid_total, 0),
+            func.now(),
+        )
+        .outerjoin(stays, stays.c.guest_id == guests.c.id)
+        .outerjoin(paid, paid.c.guest_id == guests.c.id)
+        .outerjoin(archived, archived.c.guest_id == guests.c.id)
+    )
+
+    stmt = insert(GuestStats).from_select(
+        ["guest_id", "stays", "nights", "last_stay", "paid_total", "updated_at"],
+        rows,
+    )
+    return stmt.on_conflict_do_update(
+        index_elements=[GuestStats.guest_id],
+        set_={
+            name: stmt.excluded[name]
+            for name in ("stays", "nights", "last_stay", "paid_total", "updated_at")
+        },
+    )
+
+
+def refresh_guest_stats(connection: Connection, guest_ids: Iterable[int]) -> None:
+    """
+    Recompute the stats rows of the given guests inside the caller's
+    transaction.
+    """
+    guest_ids = sorted({guest_id for guest_id in guest_ids if guest_id is not None})
+    if not guest_ids:
+        return
+
+    # Lock (creating if needed) the rows first: a concurrent writer for
+    # the same guest then waits here, and the aggregate below runs on a
+    # snapshot that includes its committed changes.
+    lock = insert(GuestStats).values([{"guest_id": guest_id} for guest_id in guest_ids])
+    connection.execute(
+        lock.on_conflict_do_update(
+            index_elements=[GuestStats.guest_id],
+            set_={"guest_id": lock.excluded.guest_id},
+        )
+    )
+    connection.execute(_stats_upsert(guest_ids))
+
+
+def ended_stay_guest_ids(connection: Connection, since: date) -> List[int]:
+    """
+    Guests with a non-cancelled stay that checked out after `since`
+    and by today.
+    """
+    return list(
+        connection.execute(
+            select(Booking.guest_id)
+            .where(
+                Booking.status != "CANCELLED",
+                Booking.check_out > since,
+                Booking.check_out <= func.current_date(),
+                # Lets the planner skip older check_in partitions
+                Booking.check_in > since - timedelta(days=MAX_STAY_NIGHTS),
+                Booking.guest_id.is_not(None),
+            )
+            .distinct()
+        ).scalars()
+    )
+
+
+def rebuild_guest_stats(connection: Connection) -> None:
+    """
+    Recompute stats for every guest (after bulk loads or backfills).
+    """
+    connection.execute(_stats_upsert())
+
+
+# -------------------------------------------------
+# Session hooks
+# -------------------------------------------------
+
+def _before_flush(session: Session, flush_context, instances) -> None:
+    guest_ids: Set[int] = set()
+    booking_ids: Set[int] = set()
+
+    for obj in session.new:
+        if isinstance(obj, Booking):
+            if obj.guest_id is None:
+                obj.guest_id = resolve_guest_id(
+                    session.connection(),
+                    obj.guest_name,
+                    obj.guest_email,
+                    obj.guest_phone,
+                )
+            guest_ids.add(obj.guest_id)
+        elif isinstance(obj, Payment):
+            booking_ids.add(obj.booking_id)
+
+    for obj in session.dirty:
+        if not session.is_modified(obj, include_collections=False):
+            continue
+        if isinstance(obj, Booking):
+            guest_ids.add(obj.guest_id)
+            if inspect(obj).attrs.guest_email.history.has_changes():
+                obj.guest_id = resolve_guest_id(
+                    session.connection(),
+                    obj.guest_name,
+                    obj.guest_email,
+                    obj.guest_phone,
+                )
+                guest_ids.add(obj.guest_id)
+        elif isinstance(obj, Payment):
+            booking_ids.add(obj.booking_id)
+
+    for obj in session.deleted:
+        if isinstance(obj, Booking):
+            guest_ids.add(obj.guest_id)
+        elif isinstance(obj, Payment):
+            booking_ids.add(obj.booking_id)
+
+    session.info["guest_stats_pending"] = (guest_ids, booking_ids)
+
+
+def _after_flush(session: Session, flush_context) -> None:
+    guest_ids, booking_ids = session.info.pop("guest_stats_pending", (set(), set()))
+    connection = session.connection()
+
+    if booking_ids:
+        guest_ids |= set(
+            connection.execute(
+                select(Booking.guest_id).where(Booking.id.in_(booking_ids))
+            ).scalars()
+        )
+
+    refresh_guest_stats(connection, guest_ids)
+
+
+def track_guest_stats(session_factory: sessionmaker) -> None:
+    """
+    Link new bookings to guests and refresh guest_stats on every flush
+    that touches bookings or payments.
+    """
+    event.listen(session_factory, "before_flush", _before_flush)
+    event.listen(session_factory, "after_flush", _after_flush)
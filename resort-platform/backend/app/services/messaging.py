@@ -0,0 +1,469 @@
+import abc
+import asyncio
+import atexit
+import threading
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+import httpx
+from loguru import logger
+from tenacity import (
+    AsyncRetrying,
+    retry_if_exception_type,
+    stop_after_attempt,
+    wait_random_exponential,
+)
+
+from app.core.config import settings
+
+# -------------------------------------------------
+# Messages
+# -------------------------------------------------
+
+
+@dataclass
+class EmailMessage:
+    to: str
+    subject: str
+    text: str
+
+
+@dataclass
+class SmsMessage:
+    to: str
+    body: str
+
+
+@dataclass
+class DeliveryResult:
+    """
+    Outcome of a bulk send. Failed entries carry the provider error.
+    """
+
+    sent: int = 0
+    failed: List[tuple] = field(default_factory=list)
+
+
+class RetryableProviderError(Exception):
+    """
+    Raised for provider responses worth retrying (429 / 5xx).
+    `retry_after` is the delay the provider asked for, if any.
+    """
+
+    def __init__(self, message: str, retry_after: Optional[float] = None) -> None:
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+# Longest Retry-After honoured; longer requests are retried this soon
+MAX_RETRY_AFTER_SECONDS = 30.0
+
+
+def _retry_after(response: httpx.Response) -> Optional[float]:
+    """
+    Seconds to wait from a Retry-After header (delta-seconds or
+    HTTP-date), or None when absent or unparseable.
+    """
+    value = response.headers.get("Retry-After")
+    if not value:
+        return None
+
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+
+def _wait_retry_after(fallback: Callable) -> Callable:
+    """
+    Tenacity wait that sleeps for the provider's Retry-After when one
+    was given and falls back to `fallback` otherwise.
+    """
+
+    def wait(retry_state) -> float:
+        exc = retry_state.outcome.exception()
+        if isinstance(exc, RetryableProviderError) and exc.retry_after is not None:
+            return min(exc.retry_after, MAX_RETRY_AFTER_SECONDS)
+        return fallback(retry_state)
+
+    return wait
+
+
+# -------------------------------------------------
+# Base provider client
+# -------------------------------------------------
+
+
+class ProviderClient(abc.ABC):
+    """
+    Async HTTP provider client with a persistent connection pool,
+    bounded concurrency and retry on transient failures.
+
+    Use as an async context manager so the pool is reused for the
+    whole burst and closed afterwards:
+
+        async with EmailClient.from_settings() as client:
+            await client.send_many(messages)
+    """
+
+    def __init__(
+        self,
+        url: str,
+        api_key: Optional[str] = None,
+        batch_size: int = 100,
+        concurrency: int = 10,
+        max_connections: int = 20,
+        timeout: float = 10.0,
+        max_attempts: int = 4,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ) -> None:
+        headers = {"Authorization": f"Bearer {api_key}"} if api_key else {}
+        self.url = url
+        self.batch_size = max(1, batch_size)
+        self.max_attempts = max_attempts
+        self._semaphore = asyncio.Semaphore(concurrency)
+        self._client = httpx.AsyncClient(
+            headers=headers,
+            timeout=timeout,
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_connections,
+            ),
+            transport=transport,
+        )
+
+    async def __aenter__(self) -> "ProviderClient":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        await self._client.aclose()
+
+    # ---------------------------------------
+    # Provider payload hooks
+    # ---------------------------------------
+
+    @abc.abstractmethod
+    def build_payload(self, batch: Sequence[Any]) -> Dict[str, Any]:
+        """
+        Request body sending `batch` in one provider call.
+        """
+
+    # ---------------------------------------
+    # Sending
+    # ---------------------------------------
+
+    async def _post(self, payload: Dict[str, Any]) -> None:
+        async for attempt in AsyncRetrying(
+            retry=retry_if_exception_type(
+                (httpx.TransportError, RetryableProviderError)
+            ),
+            stop=stop_after_attempt(self.max_attempts),
+            wait=_wait_retry_after(wait_random_exponential(multiplier=0.2, max=5)),
+            reraise=True,
+        ):
+            with attempt:
+                response = await self._client.post(self.url, json=payload)
+                if response.status_code == 429 or response.status_code >= 500:
+                    raise RetryableProviderError(
+                        f"{response.status_code} {response.text[:200]}",
+                        retry_after=_retry_after(response),
+                    )
+                response.raise_for_status()
+
+    async def _send_batch(self, batch: Sequence[Any], result: DeliveryResult) -> None:
+        async with self._semaphore:
+            try:
+                await self._post(self.build_payload(batch))
+            except Exception as exc:  # noqa: BLE001 - reported per message
+                logger.warning(
+                    "Delivery batch of {} to {} failed: {}",
+                    len(batch),
+                    self.url,
+                    exc,
+                )
+                result.failed.extend((message, str(exc)) for message in batch)
+            else:
+                result.sent += len(batch)
+
+    async def send_many(self, messages: Iterable[Any]) -> DeliveryResult:
+        """
+        Send messages in provider-sized batches, running at most
+        `concurrency` requests at a time over the shared pool.
+        """
+        messages = list(messages)
+        result = DeliveryResult()
+
+        await asyncio.gather(
+            *(
+                self._send_batch(messages[i:i + self.batch_size], result)
+                for i in range(0, len(messages), self.batch_size)
+            )
+        )
+        return result
+
+    async def send(self, message: Any) -> DeliveryResult:
+        return await self.send_many([message])
+
+
+# -------------------------------------------------
+# Email / SMS providers
+# -------------------------------------------------
+
+
+class EmailClient(ProviderClient):
+    """
+    JSON email API client (SendGrid / SES-style batch endpoint).
+    """
+
+    def __init__(self, url: str, sender: str, **kwargs: Any) -> None:
+        super().__init__(url, **kwargs)
+        self.sender = sender
+
+    @classmethod
+    def from_settings(cls, **overrides: Any) -> "EmailClient":
+        if not settings.EMAIL_API_URL:
+            raise RuntimeError("EMAIL_API_URL is not configured")
+
+        options = dict(
+            api_key=settings.EMAIL_API_KEY,
+            batch_size=settings.EMAIL_BATCH_SIZE,
+            concurrency=settings.DELIVERY_CONCURRENCY,
+            max_connections=settings.DELIVERY_MAX_CONNECTIONS,
+            timeout=settings.DELIVERY_TIMEOUT_SECONDS,
+            max_attempts=settings.DELIVERY_MAX_ATTEMPTS,
+        )
+        options.update(overrides)
+        return cls(settings.EMAIL_API_URL, settings.EMAIL_FROM, **options)
+
+    def build_payload(self, batch: Sequence[EmailMessage]) -> Dict[str, Any]:
+        return {
+            "from": self.sender,
+            "messages": [
+                {"to": m.to, "subject": m.subject, "text": m.text}
+                for m in batch
+            ],
+        }
+
+
+class SmsClient(ProviderClient):
+    """
+    JSON SMS gateway client (Twilio / MSG91-style bulk endpoint).
+    """
+
+    def __init__(self, url: str, sender_id: str, **kwargs: Any) -> None:
+        super().__init__(url, **kwargs)
+        self.sender_id = sender_id
+
+    @classmethod
+    def from_settings(cls, **overrides: Any) -> "SmsClient":
+        if not settings.SMS_API_URL:
+            raise RuntimeError("SMS_API_URL is not configured")
+
+        options = dict(
+            api_key=settings.SMS_API_KEY,
+            batch_size=settings.SMS_BATCH_SIZE,
+            concurrency=settings.DELIVERY_CONCURRENCY,
+            max_connections=settings.DELIVERY_MAX_CONNECTIONS,
+            timeout=settings.DELIVERY_TIMEOUT_SECONDS,
+            max_attempts=settings.DELIVERY_MAX_ATTEMPTS,
+        )
+        options.update(overrides)
+        return cls(settings.SMS_API_URL, settings.SMS_SENDER_ID, **options)
+
+    def build_payload(self, batch: Sequence[SmsMessage]) -> Dict[str, Any]:
+        return {
+            "sender": self.sender_id,
+            "messages": [{"to": m.to, "body": m.body} for m in batch],
+        }
+
+
+# -------------------------------------------------
+# Process-wide delivery worker
+# -------------------------------------------------
+
+
+class DeliveryWorker:
+    """
+    Long-lived provider client for synchronous code that sends one
+    message at a time (booking / payment flows).
+
+    The client lives on a background event loop thread started on first
+    use, so its connection pool is reused across calls and callers never
+    need (or conflict with) an event loop of their own. Messages
+    submitted within `linger` seconds of each other go out together in
+    provider-sized batches. Queued messages are flushed at exit.
+    """
+
+    def __init__(
+        self,
+        client_factory: Callable[[], ProviderClient],
+        linger: float = 0.05,
+    ) -> None:
+        self._client_factory = client_factory
+        self._linger = linger
+        self._lock = threading.Lock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._client: Optional[ProviderClient] = None
+
+        # Loop thread only
+        self._pending: List[Tuple[List[Any], Future]] = []
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        self._tasks: Set[asyncio.Task] = set()
+
+    def _start(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self._loop is None:
+                client = self._client_factory()
+                loop = asyncio.new_event_loop()
+                thread = threading.Thread(
+                    target=loop.run_forever,
+                    name="delivery-worker",
+                    daemon=True,
+                )
+                thread.start()
+                self._client, self._loop, self._thread = client, loop, thread
+                atexit.register(self.close)
+            return self._loop
+
+    def submit(self, messages: Sequence[Any]) -> "Future[DeliveryResult]":
+        """
+        Queue messages for delivery from any thread. The future resolves
+        to the DeliveryResult of these messages.
+        """
+        future: "Future[DeliveryResult]" = Future()
+        loop = self._start()
+        loop.call_soon_threadsafe(self._enqueue, list(messages), future)
+        return future
+
+    def _enqueue(self, messages: List[Any], future: Future) -> None:
+        self._pending.append((messages, future))
+
+        queued = sum(len(batch) for batch, _ in self._pending)
+        if queued >= self._client.batch_size:
+            self._flush()
+        elif self._flush_handle is None:
+            self._flush_handle = asyncio.get_running_loop().call_later(self._linger, self._flush)
+
+    def _flush(self) -> None:
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+
+        pending, self._pending = self._pending, []
+        if pending:
+            task = asyncio.get_running_loop().create_task(self._deliver(pending))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _deliver(self, pending: List[Tuple[List[Any], Future]]) -> None:
+        try:
+            result = await self._client.send_many(
+                [message for messages, _ in pending for message in messages]
+            )
+        except Exception as exc:  # noqa: BLE001 - handed to the callers
+            for _, future in pending:
+                future.set_exception(exc)
+            return
+
+        errors = {id(message): error for message, error in result.failed}
+        for messages, future in pending:
+            own = DeliveryResult()
+            for message in messages:
+                if id(message) in errors:
+                    own.failed.append((message, errors[id(message)]))
+                else:
+                    own.sent += 1
+            future.set_result(own)
+
+    async def _drain(self) -> None:
+        self._flush()
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+        await self._client.aclose()
+
+    def close(self, timeout: float = 30.0) -> None:
+        """
+        Deliver queued messages, close the pool and stop the loop.
+        """
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            self._loop = self._thread = None
+        if loop is None:
+            return
+
+        try:
+            asyncio.run_coroutine_threadsafe(self._drain(), loop).result(timeout)
+        finally:
+            loop.call_soon_threadsafe(loop.stop)
+            thread.join(timeout)
+            loop.close()
+            self._client = None
+
+
+def _log_failures(future: "Future[DeliveryResult]") -> None:
+    exc = future.exception()
+    if exc is not None:
+        logger.error("Delivery failed: {}", exc)
+        return
+    for message, error in future.result().failed:
+        logger.error("Delivery to {} failed: {}", message.to, error)
+
+
+email_worker = DeliveryWorker(EmailClient.from_settings)
+sms_worker = DeliveryWorker(SmsClient.from_settings)
+
+
+# -------------------------------------------------
+# Sync helpers for task code
+# -------------------------------------------------
+
+
+def queue_email(message: EmailMessage) -> "Future[DeliveryResult]":
+    """
+    Send one email through the shared client without waiting; failures
+    are logged.
+    """
+    future = email_worker.submit([message])
+    future.add_done_callback(_log_failures)
+    return future
+
+
+def queue_sms(message: SmsMessage) -> "Future[DeliveryResult]":
+    """
+    Send one SMS through the shared client without waiting; failures
+    are logged.
+    """
+    future = sms_worker.submit([message])
+    future.add_done_callback(_log_failures)
+    return future
+
+
+def deliver_emails(messages: Sequence[EmailMessage]) -> DeliveryResult:
+    """
+    Send emails from synchronous code through the shared client and
+    wait for the outcome.
+    """
+    return email_worker.submit(messages).result()
+
+
+def deliver_sms(messages: Sequence[SmsMessage]) -> DeliveryResult:
+    """
+    Send SMS from synchronous code through the shared client and wait
+    for the outcome.
+    """
+    return sms_worker.submit(messages).result()
@@ -0,0 +1,225 @@
+import hashlib
+import hmac
+from collections import defaultdict
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Tuple
+
+import orjson
+from sqlalchemy import String, column, select, update, values
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from app.models.payment import Payment
+from app.models.payment_event import PaymentEvent, PaymentEventKey
+from app.services.payment_service import apply_payment_transitions
+
+# -------------------------------------------------
+# Payment gateway webhooks
+# -------------------------------------------------
+# The request path only verifies the signature and appends the raw body
+# to payment_events. `process_payment_events` drains that table in
+# batches: it drops retries of already-applied provider event ids and
+# applies the resulting status changes with one bulk UPDATE.
+#
+# A malformed event is stamped with its error rather than raised, so one
+# bad row never rolls back the batch (which would then be claimed again).
+# Events naming a reference_id with no payment (yet) are stamped too but
+# keep no dedupe key, so a gateway retry of the same event id is applied
+# once the payment exists. The same goes for a reference_id shared by
+# several payments: none of them is changed until the duplicate is fixed.
+#
+# Expected payload:
+#     {"id": "evt_123", "type": "payment.paid",
+#      "data": {"reference_id": "PAY0000000042", "created_at": "2026-10-19T10:00:00Z"}}
+
+EVENT_STATUSES = {
+    "payment.paid": "PAID",
+    "payment.succeeded": "PAID",
+    "payment.captured": "PAID",
+    "payment.failed": "FAILED",
+}
+
+# payment_event_keys.event_id / payments.reference_id
+MAX_ID_LENGTH = 255
+
+
+def verify_signature(secret: str, body: bytes, signature: Optional[str]) -> bool:
+    """
+    Constant-time check of a hex HMAC-SHA256 of the raw body.
+    Accepts both "<hex>" and "sha256=<hex>".
+    """
+    if not signature:
+        return False
+    expected = hmac.new(secret.encode(), body, hashlib.sha256).hexdigest()
+    # Bytes: compare_digest rejects non-ASCII str, and headers can carry it
+    return hmac.compare_digest(
+        expected.encode(),
+        signature.removeprefix("sha256=").encode(),
+    )
+
+
+def enqueue_payment_event(db: Session, provider: str, body: bytes) -> None:
+    """
+    Append a raw webhook body. No parsing happens here.
+    """
+    db.execute(
+        insert(PaymentEvent).values(
+            provider=provider,
+            payload=body.decode("utf-8", errors="replace"),
+        )
+    )
+    db.commit()
+
+
+def _identifier(value, name: str) -> str:
+    # Gateways send ids as strings; numbers are accepted as their text
+    if isinstance(value, bool) or not isinstance(value, (str, int)):
+        raise ValueError(f"{name} must be a string")
+    value = str(value)
+    if not 0 < len(value) <= MAX_ID_LENGTH:
+        raise ValueError(f"{name} must be 1-{MAX_ID_LENGTH} characters")
+    return value
+
+
+def _parse_event(payload: str) -> Tuple[str, str, Optional[str], Optional[datetime]]:
+    """
+    (event id, type, reference_id, occurred_at) of a raw event. Raises
+    ValueError for anything that does not have the expected shape.
+    """
+    event = orjson.loads(payload)
+    if not isinstance(event, dict):
+        raise ValueError("event must be an object")
+
+    event_id = _identifier(event.get("id"), "id")
+    event_type = event.get("type")
+    if not isinstance(event_type, str):
+        raise ValueError("type must be a string")
+
+    data = event.get("data") or {}
+    if not isinstance(data, dict):
+        raise ValueError("data must be an object")
+
+    reference_id = data.get("reference_id")
+    if reference_id is not None:
+        reference_id = _identifier(reference_id, "reference_id")
+
+    occurred_at = None
+    if data.get("created_at"):
+        if not isinstance(data["created_at"], str):
+            raise ValueError("created_at must be a string")
+        occurred_at = datetime.fromisoformat(data["created_at"])
+        if occurred_at.tzinfo is not None:
+            occurred_at = occurred_at.astimezone(timezone.utc).replace(tzinfo=None)
+
+    return event_id, event_type, reference_id, occurred_at
+
+
+def process_payment_events(db: Session, batch_size: int = 500) -> int:
+    """
+    Apply one batch of unprocessed events; returns how many were taken.
+    Safe to run from several workers (rows are claimed with SKIP LOCKED).
+    """
+    events = db.execute(
+        select(PaymentEvent.id, PaymentEvent.provider, PaymentEvent.payload)
+        .where(PaymentEvent.processed_at.is_(None))
+        .order_by(PaymentEvent.id)
+        .limit(batch_size)
+        .with_for_update(skip_locked=True)
+    ).all()
+    if not events:
+        db.commit()
+        return 0
+
+    errors: Dict[int, str] = {}
+    parsed = {}
+    for event in events:
+        try:
+            event_id, event_type, reference_id, occurred_at = _parse_event(event.payload)
+        except (ValueError, OverflowError) as exc:  # orjson.JSONDecodeError is a ValueError
+            errors[event.id] = f"invalid payload: {exc}"[:255]
+            continue
+        # Retries inside the batch: the first copy wins
+        parsed.setdefault((event.provider, event_id), (event.id, event_type, reference_id, occurred_at))
+
+    # Status-changing events matching exactly one payment; the rest that
+    # change a status are reported and left retryable (no dedupe key).
+    # A reference shared by several payments is not guessed at, like
+    # duplicate_reference in reconciliation.
+    references = {
+        reference_id
+        for _, event_type, reference_id, _ in parsed.values()
+        if event_type in EVENT_STATUSES and reference_id
+    }
+    matches: Dict[str, List[int]] = defaultdict(list)
+    if references:
+        for reference_id, payment_id in db.execute(
+            select(Payment.reference_id, Payment.id)
+            .where(Payment.reference_id.in_(references))
+        ):
+            matches[reference_id].append(payment_id)
+    payment_ids = {reference_id: ids[0] for reference_id, ids in matches.items() if len(ids) == 1}
+
+    for key, (event_pk, event_type, reference_id, _) in list(parsed.items()):
+        if event_type not in EVENT_STATUSES:
+            continue
+        if not reference_id:
+            errors[event_pk] = "missing reference_id"
+        elif reference_id not in matches:
+            errors[event_pk] = "unknown reference_id"
+            del parsed[key]
+        elif reference_id not in payment_ids:
+            errors[event_pk] = f"duplicate reference_id ({len(matches[reference_id])} payments)"
+            del parsed[key]
+
+    # Retries across batches: only keys not seen before come back
+    fresh = set()
+    if parsed:
+        fresh = set(
+            db.execute(
+                insert(PaymentEventKey)
+                .values([
+                    {"provider": provider, "event_id": event_id, "payment_event_id": row[0]}
+                    for (provider, event_id), row in parsed.items()
+                ])
+                .on_conflict_do_nothing()
+                .returning(PaymentEventKey.provider, PaymentEventKey.event_id)
+            ).all()
+        )
+
+    now = datetime.utcnow()
+    transitions = {}
+    for event_pk, event_type, reference_id, occurred_at in sorted(parsed[key] for key in fresh):
+        status = EVENT_STATUSES.get(event_type)
+        if status is None or event_pk in errors:
+            continue
+        payment_id = payment_ids[reference_id]
+        # Oldest event per payment decides; later ones find it no longer PENDING
+        transitions.setdefault(
+            payment_id,
+            (payment_id, status, (occurred_at or now) if status == "PAID" else None),
+        )
+
+    if transitions:
+        apply_payment_transitions(db, list(transitions.values()))
+
+    db.execute(
+        update(PaymentEvent)
+        .where(PaymentEvent.id.in_([event.id for event in events]))
+        .values(processed_at=datetime.utcnow())
+        .execution_options(synchronize_session=False)
+    )
+    if errors:
+        failed = values(
+            column("id", PaymentEvent.id.type),
+            column("error", String),
+            name="failed",
+        ).data(list(errors.items()))
+        db.execute(
+            update(PaymentEvent)
+            .where(PaymentEvent.id == failed.c.id)
+            .values(error=failed.c.error)
+            .execution_options(synchronize_session=False)
+        )
+
+    db.commit()
+    return len(events)
@@ -1,8 +1,14 @@
+from datetime import datetime
 from decimal import Decimal
-from sqlalchemy.orm import Session
+from typing import Optional, Sequence, Tuple
+
+from sqlalchemy import DateTime, Integer, Numeric, String, cast, column, func, select, update, values
+from sqlalchemy.orm import Query, Session
 
 from app.models.booking import Booking
 from app.models.payment import Payment
+from app.services.guest_stats import refresh_guest_stats
+from app.services.revenue import REVENUE_DAY, refresh_revenue
 
 
 def record_payment(
@@ -15,8 +21,12 @@ def record_payment(
     """
     Record a payment against a booking.
     """
-    booking = db.query(Booking).filter(Booking.id == booking_id).first()
-    if not booking:
+    booking_exists = (
+        db.query(Booking.id)
+        .filter(Booking.id == booking_id)
+        .first()
+    )
+    if not booking_exists:
         raise ValueError("Booking not found")
 
     payment = Payment(
@@ -39,9 +49,93 @@ def mark_payment_paid(
     payment: Payment,
 ) -> Payment:
     """
-    Mark a payment as PAID.
+    Mark a payment as PAID. Booking balances are aggregated from PAID
+    payments on read (see `paid_totals`), so nothing else needs updating.
     """
     payment.status = "PAID"
+    if payment.paid_at is None:
+        payment.paid_at = datetime.utcnow()
     db.commit()
     db.refresh(payment)
     return payment
+
+
+# -------------------------------------------------
+# Booking balances
+# -------------------------------------------------
+
+def paid_totals(booking_ids=None):
+    """
+    (booking_id, paid_total) of PAID payments, one row per booking.
+    Pass the ids of the bookings being returned (values or a select)
+    so only their payments are aggregated.
+    """
+    stmt = (
+        select(Payment.booking_id, func.sum(Payment.amount).label("paid_total"))
+        .where(Payment.status == "PAID")
+        .group_by(Payment.booking_id)
+    )
+    if booking_ids is not None:
+        stmt = stmt.where(Payment.booking_id.in_(booking_ids))
+    return stmt.subquery("paid")
+
+
+def with_balance(query: Query, booking_ids=None) -> Query:
+    """
+    Append `paid_total` and `outstanding` columns to a Booking query
+    using one grouped payments subquery.
+    """
+    paid = paid_totals(booking_ids)
+    # Typed so bookings without payments read 0.00, like the sums
+    paid_total = func.coalesce(paid.c.paid_total, cast(0, Numeric(12, 2)))
+    return (
+        query.add_columns(
+            paid_total.label("paid_total"),
+            (Booking.total_amount - paid_total).label("outstanding"),
+        )
+        .outerjoin(paid, paid.c.booking_id == Booking.id)
+    )
+
+
+def apply_payment_transitions(
+    db: Session,
+    transitions: Sequence[Tuple[int, str, Optional[datetime]]],
+) -> None:
+    """
+    Move PENDING payments to (payment_id, status, paid_at) in one
+    UPDATE ... FROM (VALUES ...). Payments no longer PENDING are left
+    alone, so replays are no-ops. Does not commit.
+    """
+    if not transitions:
+        return
+
+    settled = values(
+        column("id", Integer),
+        column("status", String),
+        column("paid_at", DateTime),
+        name="settled",
+    ).data(list(transitions))
+
+    paid = db.execute(
+        update(Payment)
+        .where(Payment.id == settled.c.id, Payment.status == "PENDING")
+        .values(status=settled.c.status, paid_at=settled.c.paid_at)
+        .returning(REVENUE_DAY, Payment.method, Payment.status)
+        .execution_options(synchronize_session=False)
+    ).all()
+
+    # Bulk updates bypass the ORM flush hooks that maintain guest_stats
+    # and the revenue ledger. Rows were PENDING, so only new buckets change.
+    refresh_revenue(
+        db.connection(),
+        ((day, method) for day, method, status in paid if status == "PAID"),
+    )
+    refresh_guest_stats(
+        db.connection(),
+        db.execute(
+            select(Booking.guest_id)
+            .join(Payment, Payment.booking_id == Booking.id)
+            .where(Payment.id.in_([payment_id for payment_id, _, _ in transitions]))
+            .distinct()
+        ).scalars(),
+    )
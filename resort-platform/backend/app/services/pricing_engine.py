@@ -1,9 +1,115 @@
+import threading
+from collections import OrderedDict
 from datetime import date, timedelta
 from decimal import Decimal
-from sqlalchemy.orm import Session
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
 
+from sqlalchemy import event, inspect, literal, select, text, union_all, update
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.core.config import settings
+from app.core.metrics import PRICE_QUOTE_EVICTIONS, PRICE_QUOTE_LOOKUPS
 from app.models.room import Room
 from app.models.pricing import PricingRule
+from app.models.yield_rate import YieldRate
+from app.services.availability import MAX_STAY_NIGHTS
+
+# -------------------------------------------------
+# Quote cache
+# -------------------------------------------------
+# Quotes are keyed by (room, check_in, check_out, pricing_version). Any
+# write to a room's base price or pricing rules bumps its version in the
+# same transaction (see track_pricing; app.services.yield_pricing does
+# the same for applied yield rates), so every worker stops asking for
+# the old keys as soon as it commits; the writing worker also drops them
+# right away, the others let them age out of the LRU.
+
+QuoteKey = Tuple[int, date, date, int]
+
+
+class QuoteCache:
+    """
+    Thread-safe LRU of quoted totals, bounded to `maxsize` entries.
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        self.maxsize = maxsize
+        self._quotes: "OrderedDict[QuoteKey, Decimal]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: QuoteKey) -> Optional[Decimal]:
+        with self._lock:
+            total = self._quotes.get(key)
+            if total is not None:
+                self._quotes.move_to_end(key)
+
+        PRICE_QUOTE_LOOKUPS.inc(("miss" if total is None else "hit",))
+        return total
+
+    def put(self, key: QuoteKey, total: Decimal) -> None:
+        if self.maxsize <= 0:
+            return
+
+        evicted = 0
+        with self._lock:
+            self._quotes[key] = total
+            self._quotes.move_to_end(key)
+            while len(self._quotes) > self.maxsize:
+                self._quotes.popitem(last=False)
+                evicted += 1
+
+        if evicted:
+            PRICE_QUOTE_EVICTIONS.inc(("lru",), evicted)
+
+    def evict_rooms(self, room_ids: Iterable[int]) -> None:
+        room_ids = set(room_ids)
+        if not room_ids:
+            return
+
+        with self._lock:
+            stale = [key for key in self._quotes if key[0] in room_ids]
+            for key in stale:
+                del self._quotes[key]
+
+        if stale:
+            PRICE_QUOTE_EVICTIONS.inc(("invalidated",), len(stale))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._quotes.clear()
+
+    def __len__(self) -> int:
+        return len(self._quotes)
+
+
+quote_cache = QuoteCache(settings.PRICE_QUOTE_CACHE_SIZE)
+
+
+# -------------------------------------------------
+# Quotes
+# -------------------------------------------------
+
+def _nightly_total(
+    base_price: Decimal,
+    rules: List[Tuple[date, date, Decimal]],
+    check_in: date,
+    check_out: date,
+) -> Decimal:
+    total = Decimal("0.00")
+    current_date = check_in
+
+    while current_date < check_out:
+        daily_price = base_price
+
+        for start_date, end_date, price in rules:
+            if start_date <= current_date <= end_date:
+                daily_price = price
+                break
+
+        total += daily_price
+        current_date += timedelta(days=1)
+
+    return total
 
 
 def calculate_total_price(
@@ -14,30 +120,236 @@ def calculate_total_price(
 ) -> Decimal:
     """
     Calculate total price for a room over a date range
-    using base price + pricing rules.
+    using base price + pricing rules (first rule by id wins
+    where rules overlap), overridden by applied yield rates.
+    Served from quote_cache when possible.
     """
-    room = db.query(Room).filter(Room.id == room_id).first()
+    room = db.execute(
+        select(Room.base_price, Room.pricing_version).where(Room.id == room_id)
+    ).first()
     if not room:
         raise ValueError("Room not found")
 
-    rules = (
-        db.query(PricingRule)
-        .filter(PricingRule.room_id == room_id)
-        .all()
+    key = (room_id, check_in, check_out, room.pricing_version)
+    total = quote_cache.get(key)
+    if total is not None:
+        return total
+
+    # Applied yield rates (one night each) first, then the rules by id
+    rates = union_all(
+        select(
+            YieldRate.night.label("start_date"),
+            YieldRate.night.label("end_date"),
+            YieldRate.applied_rate.label("price"),
+            literal(0).label("source"),
+            literal(0).label("id"),
+        ).where(
+            YieldRate.room_id == room_id,
+            YieldRate.night >= check_in,
+            YieldRate.night < check_out,
+            YieldRate.applied_rate.is_not(None),
+        ),
+        select(
+            PricingRule.start_date,
+            PricingRule.end_date,
+            PricingRule.price,
+            literal(1),
+            PricingRule.id,
+        ).where(PricingRule.room_id == room_id),
+    ).subquery()
+    rules = db.execute(
+        select(rates.c.start_date, rates.c.end_date, rates.c.price)
+        .order_by(rates.c.source, rates.c.id)
+    ).all()
+
+    # Cached under the version read above: if the rules changed since,
+    # the room's version has moved on and this key is never asked again
+    total = _nightly_total(room.base_price, rules, check_in, check_out)
+    quote_cache.put(key, total)
+    return total
+
+
+# -------------------------------------------------
+# Rate grid
+# -------------------------------------------------
+# Effective nightly rate of every active room across a window, in one
+# statement: applied yield rate, else the first matching rule by id,
+# else the base price (the same precedence as calculate_total_price).
+# The optional overlay marks room-nights held by a non-cancelled
+# booking; its CTE is skipped entirely when not requested.
+
+RATE_GRID_MAX_NIGHTS = 366
+
+RATE_GRID_SQL = text(
+    """
+    WITH nights AS (
+        SELECT night::date AS night
+        FROM generate_series(
+            CAST(:start AS date), CAST(:end AS date) - 1, interval '1 day'
+        ) AS night
+    ),
+    booked AS (
+        SELECT DISTINCT b.room_id, night::date AS night
+        FROM bookings b,
+            generate_series(b.check_in, b.check_out - 1, interval '1 day') AS night
+        WHERE CAST(:occupancy AS boolean)
+          AND b.status <> 'CANCELLED'
+          AND b.check_in > CAST(:start AS date) - :max_stay
+          AND b.check_in < :end
+          AND b.check_out > :start
     )
+    SELECT
+        rooms.id,
+        rooms.name,
+        nights.night,
+        coalesce(y.applied_rate, rule.price, rooms.base_price) AS rate,
+        booked.room_id IS NOT NULL AS booked
+    FROM rooms
+    CROSS JOIN nights
+    LEFT JOIN yield_rates y
+        ON y.room_id = rooms.id AND y.night = nights.night
+    LEFT JOIN LATERAL (
+        SELECT r.price
+        FROM pricing_rules r
+        WHERE r.room_id = rooms.id
+          AND nights.night BETWEEN r.start_date AND r.end_date
+        ORDER BY r.id
+        LIMIT 1
+    ) rule ON true
+    LEFT JOIN booked
+        ON booked.room_id = rooms.id AND booked.night = nights.night
+    WHERE rooms.is_active
+    ORDER BY rooms.display_order, rooms.id, nights.night
+    """
+)
 
-    total = Decimal("0.00")
-    current_date = check_in
 
-    while current_date < check_out:
-        daily_price = room.base_price
+def rate_grid(
+    db: Session,
+    start: date,
+    end: date,
+    occupancy: bool = False,
+) -> Dict[str, Any]:
+    """
+    Rooms x nights rate grid for nights in [start, end). With
+    `occupancy`, adds per-room booked flags and the share of active
+    rooms booked each night.
+    """
+    nights = [start + timedelta(days=i) for i in range((end - start).days)]
+    rooms: List[Dict[str, Any]] = []
 
-        for rule in rules:
-            if rule.start_date <= current_date <= rule.end_date:
-                daily_price = rule.price
-                break
+    rows = db.execute(
+        RATE_GRID_SQL,
+        {
+            "start": start,
+            "end": end,
+            "occupancy": occupancy,
+            "max_stay": MAX_STAY_NIGHTS,
+        },
+    )
+    for room_id, name, night, rate, booked in rows:
+        if not rooms or rooms[-1]["room_id"] != room_id:
+            rooms.append({"room_id": room_id, "name": name, "rates": [], "booked": []})
+        rooms[-1]["rates"].append(rate)
+        rooms[-1]["booked"].append(booked)
 
-        total += daily_price
-        current_date += timedelta(days=1)
+    grid: Dict[str, Any] = {
+        "start": start,
+        "end": end,
+        "currency": "INR",
+        "nights": nights,
+        "rooms": rooms,
+    }
 
-    return total
+    if occupancy:
+        grid["occupancy"] = [
+            round(sum(room["booked"][i] for room in rooms) / len(rooms), 4) if rooms else 0.0
+            for i in range(len(nights))
+        ]
+    else:
+        for room in rooms:
+            del room["booked"]
+
+    return grid
+
+
+# -------------------------------------------------
+# Session hooks
+# -------------------------------------------------
+
+def _rule_room_ids(session: Session, rule: PricingRule) -> Set[int]:
+    state = inspect(rule)
+    # `rule.room = ...` only reaches room_id during the flush
+    room_ids = {rule.room_id}
+    room_ids |= {room.id for room in state.attrs.room.history.added if room is not None}
+    if rule.id is not None and state.attrs.room_id.history.has_changes():
+        # Moved to another room; the previous room_id is not in the
+        # history when the rule was expired before the change
+        room_ids.add(
+            session.connection().execute(
+                select(PricingRule.room_id).where(PricingRule.id == rule.id)
+            ).scalar()
+        )
+    return room_ids - {None}
+
+
+def _before_flush(session: Session, flush_context, instances) -> None:
+    room_ids: Set[int] = set()
+    # Room ids of new rules set through `rule.room` are only known after
+    # the flush
+    new_rules: List[PricingRule] = []
+
+    for obj in session.new:
+        if isinstance(obj, PricingRule):
+            new_rules.append(obj)
+
+    for obj in session.dirty:
+        if not session.is_modified(obj, include_collections=False):
+            continue
+        if isinstance(obj, PricingRule):
+            room_ids |= _rule_room_ids(session, obj)
+        elif isinstance(obj, Room):
+            if inspect(obj).attrs.base_price.history.has_changes():
+                room_ids.add(obj.id)
+
+    for obj in session.deleted:
+        if isinstance(obj, PricingRule):
+            room_ids |= _rule_room_ids(session, obj)
+        elif isinstance(obj, Room):
+            room_ids.add(obj.id)
+
+    session.info["pricing_pending"] = (room_ids, new_rules)
+
+
+def _after_flush(session: Session, flush_context) -> None:
+    room_ids, new_rules = session.info.pop("pricing_pending", (set(), []))
+    room_ids |= {rule.room_id for rule in new_rules}
+    if not room_ids:
+        return
+
+    session.connection().execute(
+        update(Room)
+        .where(Room.id.in_(sorted(room_ids)))
+        .values(pricing_version=Room.pricing_version + 1)
+    )
+    session.info.setdefault("pricing_rooms", set()).update(room_ids)
+
+
+def _after_commit(session: Session) -> None:
+    quote_cache.evict_rooms(session.info.pop("pricing_rooms", ()))
+
+
+def _after_rollback(session: Session) -> None:
+    session.info.pop("pricing_rooms", None)
+
+
+def track_pricing(session_factory: sessionmaker) -> None:
+    """
+    Bump Room.pricing_version on every flush that changes a room's base
+    price or pricing rules, and drop the room's cached quotes once the
+    transaction commits. Bulk UPDATE / DELETE statements bypass this.
+    """
+    event.listen(session_factory, "before_flush", _before_flush)
+    event.listen(session_factory, "after_flush", _after_flush)
+    event.listen(session_factory, "after_commit", _after_commit)
+    event.listen(session_factory, "after_rollback", _after_rollback)
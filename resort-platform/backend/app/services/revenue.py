@@ -0,0 +1,255 @@
+from datetime import date
+from decimal import Decimal
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from sqlalchemy import Date, String, and_, cast, column, event, func, inspect, select, values
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.models.archive import ArchivedRevenue
+from app.models.payment import Payment
+from app.models.revenue import RevenueLedger
+
+# -------------------------------------------------
+# Revenue ledger
+# -------------------------------------------------
+# revenue_ledger holds PAID totals per (day, method). Whenever a payment
+# enters or leaves PAID, or a PAID payment changes, the buckets it was in
+# and is now in are recomputed from payments. Only those buckets are
+# touched, via the partial expression index idx_payments_revenue_day.
+# Reports then sum ledger rows, a few per day, not the payments table.
+# Payments moved to the archive (app.services.archive) keep counting
+# through archived_revenue.
+
+# Must match idx_payments_revenue_day
+REVENUE_DAY = cast(func.coalesce(Payment.paid_at, Payment.created_at), Date)
+
+# Payment attributes that can move an amount between buckets
+LEDGER_ATTRIBUTES = ("status", "amount", "method", "paid_at")
+
+Bucket = Tuple[date, str]
+
+
+def paid_buckets(connection: Connection, payment_ids: Iterable[int]) -> Set[Bucket]:
+    """
+    Ledger buckets that the given payments currently count towards.
+    """
+    payment_ids = list(payment_ids)
+    if not payment_ids:
+        return set()
+    return set(
+        connection.execute(
+            select(REVENUE_DAY, Payment.method)
+            .where(Payment.id.in_(payment_ids), Payment.status == "PAID")
+            .distinct()
+        ).tuples()
+    )
+
+
+def _totals(buckets: Optional[List[Bucket]] = None):
+    """
+    (day, method, amount, payments) of the given buckets, or of every
+    bucket: PAID payments plus archived_revenue.
+    """
+    if buckets is None:
+        hot = (
+            select(
+                REVENUE_DAY.label("day"),
+                Payment.method.label("method"),
+                func.sum(Payment.amount).label("amount"),
+                func.count().label("payments"),
+            )
+            .where(Payment.status == "PAID")
+            .group_by(REVENUE_DAY, Payment.method)
+        )
+    else:
+        # Left join so buckets that lost their last payment drop to zero
+        keys = values(
+            column("day", Date),
+            column("method", String),
+            name="buckets",
+        ).data(buckets)
+        hot = (
+            select(
+                keys.c.day,
+                keys.c.method,
+                func.coalesce(func.sum(Payment.amount), 0).label("amount"),
+                func.count(Payment.id).label("payments"),
+            )
+            .select_from(keys)
+            .outerjoin(
+                Payment,
+                and_(
+                    Payment.status == "PAID",
+                    REVENUE_DAY == keys.c.day,
+                    Payment.method == keys.c.method,
+                ),
+            )
+            .group_by(keys.c.day, keys.c.method)
+        )
+
+    # Joined after grouping, so the payments side keeps using
+    # idx_payments_revenue_day
+    hot = hot.subquery("hot")
+    archived = ArchivedRevenue.__table__
+    return (
+        select(
+            func.coalesce(hot.c.day, archived.c.day).label("day"),
+            func.coalesce(hot.c.method, archived.c.method).label("method"),
+            (func.coalesce(hot.c.amount, 0) + func.coalesce(archived.c.amount, 0)).label("amount"),
+            (func.coalesce(hot.c.payments, 0) + func.coalesce(archived.c.payments, 0)).label("payments"),
+        )
+        .select_from(hot)
+        .join(
+            archived,
+            and_(archived.c.day == hot.c.day, archived.c.method == hot.c.method),
+            isouter=True,
+            # Archived-only buckets exist only in a full recompute
+            full=buckets is None,
+        )
+        .subquery("totals")
+    )
+
+
+def _ledger_upsert(buckets: Optional[List[Bucket]] = None):
+    totals = _totals(buckets)
+    stmt = insert(RevenueLedger).from_select(
+        ["day", "method", "amount", "payments", "updated_at"],
+        select(totals, func.now()),
+    )
+    return stmt.on_conflict_do_update(
+        index_elements=[RevenueLedger.day, RevenueLedger.method],
+        set_={
+            name: stmt.excluded[name]
+            for name in ("amount", "payments", "updated_at")
+        },
+    )
+
+
+def refresh_revenue(connection: Connection, buckets: Iterable[Bucket]) -> None:
+    """
+    Recompute the given (day, method) buckets inside the caller's
+    transaction.
+    """
+    buckets = sorted(set(buckets))
+    if not buckets:
+        return
+
+    # Same locking as refresh_guest_stats: concurrent writers to a bucket
+    # queue on its row, and the aggregate sees their committed changes.
+    lock = insert(RevenueLedger).values(
+        [{"day": day, "method": method} for day, method in buckets]
+    )
+    connection.execute(
+        lock.on_conflict_do_update(
+            index_elements=[RevenueLedger.day, RevenueLedger.method],
+            set_={"day": lock.excluded.day},
+        )
+    )
+    connection.execute(_ledger_upsert(buckets))
+
+
+def rebuild_revenue(connection: Connection) -> None:
+    """
+    Recompute the whole ledger (after bulk loads or backfills).
+    """
+    connection.execute(RevenueLedger.__table__.delete())
+    connection.execute(_ledger_upsert())
+
+
+def verify_revenue(connection: Connection) -> List[Tuple[date, str, Decimal, Decimal]]:
+    """
+    (day, method, ledger amount, actual amount) of every bucket where the
+    ledger disagrees with payments. Empty when the ledger is correct.
+    """
+    actual = _totals()
+    ledger = RevenueLedger.__table__
+
+    day = func.coalesce(ledger.c.day, actual.c.day)
+    method = func.coalesce(ledger.c.method, actual.c.method)
+    ledger_amount = func.coalesce(ledger.c.amount, 0)
+    actual_amount = func.coalesce(actual.c.amount, 0)
+    return list(
+        connection.execute(
+            select(day, method, ledger_amount, actual_amount)
+            .select_from(ledger)
+            .join(
+                actual,
+                and_(ledger.c.day == actual.c.day, ledger.c.method == actual.c.method),
+                full=True,
+            )
+            .where(
+                (ledger_amount != actual_amount)
+                | (func.coalesce(ledger.c.payments, 0) != func.coalesce(actual.c.payments, 0))
+            )
+            .order_by(day, method)
+        ).tuples()
+    )
+
+
+# -------------------------------------------------
+# Reads
+# -------------------------------------------------
+
+def revenue_totals(
+    db: Session,
+    start: Optional[date] = None,
+    end: Optional[date] = None,
+) -> Dict[str, Decimal]:
+    """
+    PAID revenue per method for days in [start, end).
+    """
+    query = (
+        db.query(RevenueLedger.method, func.sum(RevenueLedger.amount))
+        .group_by(RevenueLedger.method)
+        .having(func.sum(RevenueLedger.payments) > 0)
+    )
+    if start is not None:
+        query = query.filter(RevenueLedger.day >= start)
+    if end is not None:
+        query = query.filter(RevenueLedger.day < end)
+    return dict(query.all())
+
+
+# -------------------------------------------------
+# Session hooks
+# -------------------------------------------------
+
+def _ledger_changed(payment: Payment) -> bool:
+    attrs = inspect(payment).attrs
+    return any(attrs[name].history.has_changes() for name in LEDGER_ATTRIBUTES)
+
+
+def _before_flush(session: Session, flush_context, instances) -> None:
+    changed = [
+        obj for obj in session.dirty
+        if isinstance(obj, Payment) and _ledger_changed(obj)
+    ]
+    deleted = [obj for obj in session.deleted if isinstance(obj, Payment)]
+    new = [obj for obj in session.new if isinstance(obj, Payment)]
+    if not (changed or deleted or new):
+        return
+
+    # Buckets the rows count towards before this flush writes them
+    old = paid_buckets(session.connection(), [obj.id for obj in changed + deleted])
+    session.info["revenue_pending"] = (old, changed + new)
+
+
+def _after_flush(session: Session, flush_context) -> None:
+    pending = session.info.pop("revenue_pending", None)
+    if pending is None:
+        return
+
+    old, written = pending
+    written_ids = [obj.id for obj in written if obj.status == "PAID"]
+    connection = session.connection()
+    refresh_revenue(connection, old | paid_buckets(connection, written_ids))
+
+
+def track_revenue(session_factory: sessionmaker) -> None:
+    """
+    Keep revenue_ledger in step with every flush that writes payments.
+    """
+    event.listen(session_factory, "before_flush", _before_flush)
+    event.listen(session_factory, "after_flush", _after_flush)
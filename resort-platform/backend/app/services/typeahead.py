@@ -0,0 +1,54 @@
+from sqlalchemy import func, literal, literal_column, or_
+from sqlalchemy.orm import Query
+
+from app.models.booking import Booking
+from app.models.guest import Guest
+
+# -------------------------------------------------
+# Search documents
+# -------------------------------------------------
+# These expressions must stay identical to the pg_trgm GIN expression
+# indexes (idx_guests_trgm / idx_bookings_guest_trgm), otherwise the
+# planner falls back to a sequential scan. Separators are rendered as
+# SQL literals rather than bind parameters for the same reason.
+
+
+def _document(*parts):
+    separator = literal_column("' '")
+    expr = parts[0]
+    for part in parts[1:]:
+        expr = expr.op("||")(separator).op("||")(part)
+    return func.lower(expr)
+
+
+GUEST_DOCUMENT = _document(
+    Guest.full_name,
+    Guest.email,
+    func.coalesce(Guest.phone, literal_column("''")),
+)
+
+BOOKING_DOCUMENT = _document(
+    Booking.guest_name,
+    Booking.guest_email,
+    Booking.guest_phone,
+)
+
+
+def typeahead(query: Query, document, term: str, limit: int) -> Query:
+    """
+    Narrow `query` to rows whose document contains `term` or fuzzily
+    matches one of its words, best matches first.
+    """
+    term = term.strip().lower()
+    rank = func.word_similarity(term, document)
+
+    return (
+        query.filter(
+            or_(
+                document.contains(term, autoescape=True),
+                literal(term).op("<%")(document),
+            )
+        )
+        .order_by(rank.desc())
+        .limit(limit)
+    )
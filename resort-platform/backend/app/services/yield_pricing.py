@@ -0,0 +1,192 @@
+from datetime import date, datetime, timedelta
+from typing import Optional, Tuple
+
+from sqlalchemy import func, select, text
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.services.availability import MAX_STAY_NIGHTS
+
+# -------------------------------------------------
+# Yield pricing
+# -------------------------------------------------
+# One statement computes the demand signals of every night in the
+# horizon, spreads them over every active room's static rate and
+# upserts the results into yield_rates. Signals are resort-wide shares
+# of active rooms (a room itself is either booked for a night or not):
+#
+#   occupancy            rooms on the books for the night
+#   pickup               of those, rooms booked in the last
+#                        YIELD_PICKUP_DAYS
+#   last_year_occupancy  rooms on the books for the same weekday 52
+#                        weeks earlier, as of 52 weeks ago
+#
+# Applied rates take precedence over pricing rules in quotes
+# (app.services.pricing_engine); rooms whose applied rates change get
+# their pricing_version bumped in the same statement. Rows of past
+# nights are kept as the record of what was suggested and charged.
+
+# Serializes runs across workers; arbitrary but fixed
+YIELD_LOCK_ID = 0x7969656C
+
+# Same weekday last year
+LAST_YEAR = timedelta(weeks=52)
+
+YIELD_SQL = text(
+    """
+    WITH nights AS (
+        SELECT night::date AS night
+        FROM generate_series(
+            CAST(:start AS date), CAST(:end AS date) - 1, interval '1 day'
+        ) AS night
+    ),
+    active AS (
+        SELECT count(*) AS rooms FROM rooms WHERE is_active
+    ),
+    booked AS (
+        SELECT
+            night::date AS night,
+            count(DISTINCT b.room_id) AS rooms,
+            count(DISTINCT b.room_id) FILTER (WHERE b.created_at >= :pickup_since) AS picked_up
+        FROM bookings b,
+            generate_series(b.check_in, b.check_out - 1, interval '1 day') AS night
+        WHERE b.status <> 'CANCELLED'
+          AND b.check_in > CAST(:start AS date) - :max_stay
+          AND b.check_in < :end
+          AND b.check_out > :start
+        GROUP BY 1
+    ),
+    last_year AS (
+        SELECT
+            night::date + :last_year_days AS night,
+            count(DISTINCT b.room_id) AS rooms
+        FROM bookings b,
+            generate_series(b.check_in, b.check_out - 1, interval '1 day') AS night
+        WHERE b.status <> 'CANCELLED'
+          AND b.created_at <= :last_year_as_of
+          AND b.check_in > CAST(:last_year_start AS date) - :max_stay
+          AND b.check_in < :last_year_end
+          AND b.check_out > :last_year_start
+        GROUP BY 1
+    ),
+    signals AS (
+        SELECT
+            nights.night,
+            round(coalesce(booked.rooms, 0)::numeric / active.rooms, 4) AS occupancy,
+            round(coalesce(booked.picked_up, 0)::numeric / active.rooms, 4) AS pickup,
+            round(coalesce(last_year.rooms, 0)::numeric / active.rooms, 4) AS last_year_occupancy
+        FROM nights
+        CROSS JOIN active
+        LEFT JOIN booked ON booked.night = nights.night
+        LEFT JOIN last_year ON last_year.night = nights.night
+        WHERE active.rooms > 0
+    ),
+    rates AS (
+        SELECT
+            rooms.id AS room_id,
+            signals.*,
+            coalesce(rule.price, rooms.base_price) AS static_rate,
+            least(greatest(
+                1
+                + :occupancy_weight * (signals.occupancy - signals.last_year_occupancy)
+                + :pickup_weight * signals.pickup,
+                :min_factor), :max_factor) AS factor
+        FROM rooms
+        CROSS JOIN signals
+        -- First matching rule by id, as in pricing_engine
+        LEFT JOIN LATERAL (
+            SELECT r.price
+            FROM pricing_rules r
+            WHERE r.room_id = rooms.id
+              AND signals.night BETWEEN r.start_date AND r.end_date
+            ORDER BY r.id
+            LIMIT 1
+        ) rule ON true
+        WHERE rooms.is_active
+    ),
+    written AS (
+        INSERT INTO yield_rates AS y (
+            room_id, night, occupancy, pickup, last_year_occupancy,
+            static_rate, suggested_rate, applied_rate, computed_at
+        )
+        SELECT
+            room_id, night, occupancy, pickup, last_year_occupancy,
+            static_rate,
+            round(static_rate * factor, 0),
+            CASE WHEN :apply THEN round(static_rate * factor, 0) END,
+            :now
+        FROM rates
+        ON CONFLICT (room_id, night) DO UPDATE SET
+            occupancy = excluded.occupancy,
+            pickup = excluded.pickup,
+            last_year_occupancy = excluded.last_year_occupancy,
+            static_rate = excluded.static_rate,
+            suggested_rate = excluded.suggested_rate,
+            applied_rate = CASE WHEN :apply THEN excluded.suggested_rate ELSE y.applied_rate END,
+            computed_at = excluded.computed_at
+        RETURNING room_id, night, applied_rate
+    ),
+    -- yield_rates here is the snapshot from before the upsert
+    changed AS (
+        SELECT DISTINCT written.room_id
+        FROM written
+        LEFT JOIN yield_rates previous
+            ON previous.room_id = written.room_id AND previous.night = written.night
+        WHERE previous.applied_rate IS DISTINCT FROM written.applied_rate
+    ),
+    bumped AS (
+        UPDATE rooms SET pricing_version = rooms.pricing_version + 1
+        FROM changed
+        WHERE rooms.id = changed.room_id
+        RETURNING rooms.id
+    )
+    SELECT
+        (SELECT count(*) FROM written) AS written,
+        (SELECT count(*) FROM bumped) AS repriced
+    """
+)
+
+
+def compute_yield_rates(
+    db: Session,
+    start: Optional[date] = None,
+    apply: Optional[bool] = None,
+) -> Tuple[int, int]:
+    """
+    Recompute yield_rates for every active room over the
+    YIELD_HORIZON_DAYS from `start` (today) and commit. Returns the
+    room-nights written and the rooms whose quoted rates changed.
+    """
+    start = start or date.today()
+    end = start + timedelta(days=settings.YIELD_HORIZON_DAYS)
+    apply = settings.YIELD_AUTO_APPLY if apply is None else apply
+    now = datetime.utcnow()
+
+    try:
+        db.execute(select(func.pg_advisory_xact_lock(YIELD_LOCK_ID)))
+
+        written, repriced = db.execute(
+            YIELD_SQL,
+            {
+                "start": start,
+                "end": end,
+                "max_stay": MAX_STAY_NIGHTS,
+                "pickup_since": now - timedelta(days=settings.YIELD_PICKUP_DAYS),
+                "last_year_days": LAST_YEAR.days,
+                "last_year_as_of": now - LAST_YEAR,
+                "last_year_start": start - LAST_YEAR,
+                "last_year_end": end - LAST_YEAR,
+                "occupancy_weight": settings.YIELD_OCCUPANCY_WEIGHT,
+                "pickup_weight": settings.YIELD_PICKUP_WEIGHT,
+                "min_factor": settings.YIELD_MIN_FACTOR,
+                "max_factor": settings.YIELD_MAX_FACTOR,
+                "apply": apply,
+                "now": now,
+            },
+        ).one()
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+
+    return written, repriced
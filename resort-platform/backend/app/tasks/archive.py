@@ -0,0 +1,60 @@
+"""
+Move old completed / cancelled bookings to the Parquet archive.
+
+    python -m app.tasks.archive            # archive everything due
+    python -m app.tasks.archive --check    # compare archive_batches with the files, exit 1 on problems
+"""
+import argparse
+import sys
+
+from loguru import logger
+
+from app.core.config import settings
+from app.core.logging import setup_logging
+from app.db.session import SessionLocal
+from app.services.archive import archive_bookings, verify_archive
+from app.tasks.catalog import publish_catalog_snapshots
+
+# Initialize logging (safe if called multiple times)
+setup_logging()
+
+
+def archive_old_bookings() -> int:
+    if not settings.ARCHIVE_DIR:
+        logger.info("ARCHIVE_DIR not set; nothing archived")
+        return 0
+
+    db = SessionLocal()
+    try:
+        moved, reviews = archive_bookings(db)
+    finally:
+        db.close()
+    logger.info("Archived {} bookings ({} reviews) to {}", moved, reviews, settings.ARCHIVE_DIR)
+
+    # The published reviews document still lists the archived reviews
+    if reviews:
+        publish_catalog_snapshots()
+    return moved
+
+
+def check_archive() -> int:
+    db = SessionLocal()
+    try:
+        problems = verify_archive(db)
+    finally:
+        db.close()
+
+    for problem in problems:
+        logger.warning("Archive problem: {}", problem)
+    logger.info("Archive checked: {} problems", len(problems))
+    return len(problems)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--check", action="store_true", help="Verify archived batches instead of archiving")
+    args = parser.parse_args()
+
+    if args.check:
+        sys.exit(1 if check_archive() else 0)
+    archive_old_bookings()
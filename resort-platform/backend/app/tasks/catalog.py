@@ -0,0 +1,40 @@
+"""
+Publish the public catalog snapshots served by nginx.
+
+    python -m app.tasks.catalog                 # to CATALOG_DIR
+    python -m app.tasks.catalog --dir ./public  # somewhere else
+"""
+import argparse
+from typing import Optional
+
+from loguru import logger
+
+from app.core.logging import setup_logging
+from app.db.session import SessionLocal
+from app.services.catalog import publish_catalog
+
+# Initialize logging (safe if called multiple times)
+setup_logging()
+
+
+def publish_catalog_snapshots(directory: Optional[str] = None) -> None:
+    """
+    Safe as a background task: on failure the previous snapshot stays
+    in place and the error is logged.
+    """
+    db = SessionLocal()
+    try:
+        if publish_catalog(db, directory):
+            logger.info("Catalog snapshots published")
+    except Exception:
+        logger.exception("Catalog publish failed; previous snapshot kept")
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--dir", help="Output directory (default: CATALOG_DIR)")
+    args = parser.parse_args()
+
+    publish_catalog_snapshots(args.dir)
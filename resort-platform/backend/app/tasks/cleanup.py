@@ -1,8 +1,10 @@
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 
 from sqlalchemy.orm import Session
 
+from app.db.loaders import BOOKING_STATUS_ONLY
 from app.models.booking import Booking
+from app.services.availability import MAX_STAY_NIGHTS
 
 
 def cancel_expired_unpaid_bookings(
@@ -14,12 +16,17 @@ def cancel_expired_unpaid_bookings(
     Returns number of cancelled bookings.
     """
     cutoff_time = datetime.utcnow() - timedelta(minutes=expiry_minutes)
+    today = date.today()
 
     bookings = (
         db.query(Booking)
+        .options(*BOOKING_STATUS_ONLY)
         .filter(
             Booking.status == "CONFIRMED",
             Booking.created_at < cutoff_time,
+            # Lets the planner skip older check_in partitions. Bookings
+            # that old expired, and were swept, long before this run.
+            Booking.check_in > today - timedelta(days=MAX_STAY_NIGHTS),
         )
         .all()
     )
@@ -1,20 +1,27 @@
-from typing import Optional
+from typing import Iterable, Optional, Tuple
 
+from app.core.config import settings
 from app.core.logging import setup_logging
+from app.services.messaging import (
+    DeliveryResult,
+    EmailClient,
+    EmailMessage,
+    queue_email,
+)
 
 # Initialize logging (safe if called multiple times)
 setup_logging()
 
 
-def send_booking_confirmation_email(
+# -------------------------------------------------
+# Message builders
+# -------------------------------------------------
+
+def build_booking_confirmation_email(
     to_email: str,
     booking_id: int,
     guest_name: Optional[str] = None,
-) -> None:
-    """
-    Send booking confirmation email.
-    Replace implementation with real email provider.
-    """
+) -> EmailMessage:
     subject = "Your Resort Booking is Confirmed"
     message = (
         f"Hello {guest_name or 'Guest'},\n\n"
@@ -22,19 +29,14 @@ def send_booking_confirmation_email(
         f"We look forward to hosting you.\n\n"
         f"Regards,\nResort Team"
     )
+    return EmailMessage(to=to_email, subject=subject, text=message)
 
-    # Placeholder – integrate SendGrid / SES / SMTP here
-    print(f"[EMAIL] To: {to_email}\nSubject: {subject}\n\n{message}")
 
-
-def send_payment_receipt_email(
+def build_payment_receipt_email(
     to_email: str,
     amount: str,
     booking_id: int,
-) -> None:
-    """
-    Send payment receipt email.
-    """
+) -> EmailMessage:
     subject = "Payment Received"
     message = (
         f"Hello,\n\n"
@@ -42,5 +44,63 @@ def send_payment_receipt_email(
         f"for booking ID {booking_id}.\n\n"
         f"Thank you,\nResort Team"
     )
+    return EmailMessage(to=to_email, subject=subject, text=message)
+
+
+def _send(email: EmailMessage) -> None:
+    if not settings.EMAIL_API_URL:
+        # No provider configured (local development)
+        print(f"[EMAIL] To: {email.to}\nSubject: {email.subject}\n\n{email.text}")
+        return
+
+    # Batched with concurrent sends over the process-wide pool
+    queue_email(email)
+
+
+# -------------------------------------------------
+# Single sends
+# -------------------------------------------------
+
+def send_booking_confirmation_email(
+    to_email: str,
+    booking_id: int,
+    guest_name: Optional[str] = None,
+) -> None:
+    """
+    Send booking confirmation email.
+    """
+    _send(build_booking_confirmation_email(to_email, booking_id, guest_name))
+
+
+def send_payment_receipt_email(
+    to_email: str,
+    amount: str,
+    booking_id: int,
+) -> None:
+    """
+    Send payment receipt email.
+    """
+    _send(build_payment_receipt_email(to_email, amount, booking_id))
+
+
+# -------------------------------------------------
+# Bulk sends
+# -------------------------------------------------
+
+async def send_booking_confirmation_emails(
+    recipients: Iterable[Tuple[str, int, Optional[str]]],
+    client: Optional[EmailClient] = None,
+) -> DeliveryResult:
+    """
+    Send confirmations for many (email, booking_id, guest_name) tuples
+    over one pooled client, batched per provider limits.
+    """
+    messages = [
+        build_booking_confirmation_email(*recipient) for recipient in recipients
+    ]
+
+    if client is not None:
+        return await client.send_many(messages)
 
-    print(f"[EMAIL] To: {to_email}\nSubject: {subject}\n\n{message}")
+    async with EmailClient.from_settings() as client:
+        return await client.send_many(messages)
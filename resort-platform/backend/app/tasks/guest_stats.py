@@ -0,0 +1,52 @@
+"""
+Refresh guest_stats for stays that have ended since the last run.
+
+Checking out changes a guest's stays, nights and last_stay without any
+write to bookings, so the flush hooks never see it; run this daily.
+
+    python -m app.tasks.guest_stats              # guests whose stays ended in the last 2 days
+    python -m app.tasks.guest_stats --days 30    # catch up after an outage
+    python -m app.tasks.guest_stats --all        # recompute every guest
+"""
+import argparse
+from datetime import date, timedelta
+
+from loguru import logger
+
+from app.core.logging import setup_logging
+from app.db.session import engine
+from app.services.guest_stats import (
+    ended_stay_guest_ids,
+    rebuild_guest_stats,
+    refresh_guest_stats,
+)
+
+# Initialize logging (safe if called multiple times)
+setup_logging()
+
+
+def refresh_ended_stays(days: int = 2) -> int:
+    """
+    Refresh the guests whose stays checked out within the last `days`
+    days; returns how many were refreshed.
+    """
+    with engine.begin() as connection:
+        guest_ids = ended_stay_guest_ids(connection, date.today() - timedelta(days=days))
+        refresh_guest_stats(connection, guest_ids)
+
+    logger.info("Refreshed guest_stats of {} guests with ended stays", len(guest_ids))
+    return len(guest_ids)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--days", type=int, default=2, help="Look back this many days of check-outs")
+    parser.add_argument("--all", action="store_true", help="Recompute every guest")
+    args = parser.parse_args()
+
+    if args.all:
+        with engine.begin() as connection:
+            rebuild_guest_stats(connection)
+        logger.info("Rebuilt guest_stats")
+    else:
+        refresh_ended_stays(args.days)
@@ -0,0 +1,83 @@
+"""
+Report unused, redundant and missing indexes from the statistics views
+of the primary and every read replica.
+
+    python -m app.tasks.index_advisor                       # report
+    python -m app.tasks.index_advisor --min-rows 50000      # only flag larger seq scans
+    python -m app.tasks.index_advisor --check               # exit 1 when anything is reported
+"""
+import argparse
+import sys
+from typing import List, Tuple
+
+from loguru import logger
+from sqlalchemy.engine import Engine
+
+from app.core.logging import setup_logging
+from app.db.index_advisor import IndexReport, index_report
+from app.db.session import engine, replica_engines
+
+# Initialize logging (safe if called multiple times)
+setup_logging()
+
+
+def _servers() -> List[Tuple[str, Engine]]:
+    return [("primary", engine)] + [
+        (f"replica {i}", replica) for i, replica in enumerate(replica_engines)
+    ]
+
+
+def advise(min_rows: int = 10000, min_seq_scans: int = 100) -> int:
+    """
+    Log the report of every server; returns the number of findings.
+    An index counts as unused only if no server has scanned it.
+    """
+    reports: List[Tuple[str, IndexReport]] = []
+    for name, server in _servers():
+        with server.connect() as connection:
+            reports.append((name, index_report(connection, min_rows, min_seq_scans)))
+
+    findings = 0
+    primary = reports[0][1]
+
+    unused_everywhere = set.intersection(
+        *({item.index for item in report.unused} for _, report in reports)
+    )
+    unused = [item for item in primary.unused if item.index in unused_everywhere]
+
+    for item in unused:
+        logger.info("Unused index {} on {} ({} kB)", item.index, item.table, item.bytes // 1024)
+    for item in primary.redundant:
+        logger.info("Redundant index {} on {}: covered by {}", item.index, item.table, item.covered_by)
+    findings += len(unused) + len(primary.redundant)
+
+    for name, report in reports:
+        logger.info("{}: statistics since {}", name, report.stats_since or "cluster start")
+        for item in report.seq_scanned:
+            logger.info(
+                "{}: {} seq scanned {} times, {} of {} rows per scan, {} index scans",
+                name,
+                item.table,
+                item.seq_scans,
+                item.rows_per_scan,
+                item.live_rows,
+                item.index_scans,
+            )
+            for statement in item.statements:
+                logger.info("{}:   {}", name, statement)
+        findings += len(report.seq_scanned)
+
+    logger.info("Index advisor: {} findings", findings)
+    return findings
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--min-rows", type=int, default=10000, help="Smallest table / rows per seq scan to flag")
+    parser.add_argument("--min-seq-scans", type=int, default=100, help="Fewest seq scans to flag a table")
+    parser.add_argument("--check", action="store_true", help="Exit 1 when anything is reported")
+    args = parser.parse_args()
+
+    findings = advise(args.min_rows, args.min_seq_scans)
+    if args.check:
+        sys.exit(1 if findings else 0)
@@ -0,0 +1,55 @@
+"""
+Create the yearly bookings / payments partitions ahead of time.
+
+    python -m app.tasks.partitions                 # this year + PARTITION_YEARS_AHEAD
+    python -m app.tasks.partitions --from 2022     # also backfill older years
+    python -m app.tasks.partitions --check         # list payments / reviews without a booking, exit 1 if any
+"""
+import argparse
+import sys
+from datetime import date
+from typing import Optional
+
+from loguru import logger
+
+from app.core.config import settings
+from app.core.logging import setup_logging
+from app.db.partitions import ensure_partitions, orphaned_rows
+from app.db.session import engine
+
+# Initialize logging (safe if called multiple times)
+setup_logging()
+
+
+def create_upcoming_partitions(first_year: Optional[int] = None) -> None:
+    this_year = date.today().year
+    with engine.begin() as conn:
+        created = ensure_partitions(
+            conn,
+            first_year or this_year,
+            this_year + settings.PARTITION_YEARS_AHEAD,
+        )
+    for name in created:
+        logger.info("Created partition {}", name)
+    logger.info("Partitions up to date ({} created)", len(created))
+
+
+def check_booking_references() -> int:
+    with engine.connect() as conn:
+        orphans = orphaned_rows(conn)
+    for table, ids in orphans.items():
+        logger.warning("{} {} rows reference no booking: {}", len(ids), table, ids[:20])
+    count = sum(len(ids) for ids in orphans.values())
+    logger.info("Booking references checked: {} orphaned rows", count)
+    return count
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--from", dest="first_year", type=int, help="First year (default: this year)")
+    parser.add_argument("--check", action="store_true", help="Check payment / review booking references instead")
+    args = parser.parse_args()
+
+    if args.check:
+        sys.exit(1 if check_booking_references() else 0)
+    create_upcoming_partitions(args.first_year)
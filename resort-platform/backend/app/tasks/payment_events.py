@@ -0,0 +1,61 @@
+"""
+Drain the payment webhook queue.
+
+    python -m app.tasks.payment_events            # run forever
+    python -m app.tasks.payment_events --once     # drain and exit
+
+Several workers can run side by side; each claims its own batch.
+"""
+import argparse
+import time
+
+from loguru import logger
+
+from app.core.config import settings
+from app.core.logging import setup_logging
+from app.db.session import SessionLocal
+from app.services.payment_events import process_payment_events
+
+# Initialize logging (safe if called multiple times)
+setup_logging()
+
+
+def drain_payment_events(batch_size: int = settings.PAYMENT_EVENTS_BATCH_SIZE) -> int:
+    """
+    Process batches until the queue is empty. Returns events taken.
+    """
+    total = 0
+    db = SessionLocal()
+    try:
+        while taken := process_payment_events(db, batch_size):
+            total += taken
+    finally:
+        db.close()
+    return total
+
+
+def run_forever(
+    batch_size: int = settings.PAYMENT_EVENTS_BATCH_SIZE,
+    poll_seconds: float = settings.PAYMENT_EVENTS_POLL_SECONDS,
+) -> None:
+    logger.info("Payment event consumer started (batch={}, poll={}s)", batch_size, poll_seconds)
+    while True:
+        try:
+            taken = drain_payment_events(batch_size)
+            if taken:
+                logger.info("Processed {} payment events", taken)
+        except Exception:
+            logger.exception("Payment event batch failed; retrying")
+        time.sleep(poll_seconds)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--once", action="store_true")
+    parser.add_argument("--batch-size", type=int, default=settings.PAYMENT_EVENTS_BATCH_SIZE)
+    args = parser.parse_args()
+
+    if args.once:
+        logger.info("Processed {} payment events", drain_payment_events(args.batch_size))
+    else:
+        run_forever(args.batch_size)
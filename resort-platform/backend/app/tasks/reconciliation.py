@@ -0,0 +1,70 @@
+"""
+Reconcile a gateway settlement file against payments.
+
+    python -m app.tasks.reconciliation settlement.csv --report mismatches.csv
+"""
+import argparse
+import csv
+from dataclasses import asdict
+from typing import Optional
+
+from loguru import logger
+
+from app.core.logging import setup_logging
+from app.db.session import SessionLocal
+from app.services.reconciliation import (
+    MISMATCH_FIELDS,
+    ReconciliationReport,
+    reconcile_settlement,
+)
+
+# Initialize logging (safe if called multiple times)
+setup_logging()
+
+
+def reconcile_file(
+    path: str,
+    report_path: Optional[str] = None,
+    chunk_size: int = 1000,
+) -> ReconciliationReport:
+    """
+    Stream `path` through the reconciler, writing every mismatch to
+    `report_path` as CSV when given.
+    """
+    db = SessionLocal()
+    report_file = open(report_path, "w", newline="") if report_path else None
+    try:
+        on_mismatch = None
+        if report_file is not None:
+            writer = csv.DictWriter(report_file, fieldnames=MISMATCH_FIELDS)
+            writer.writeheader()
+            on_mismatch = lambda item: writer.writerow(asdict(item))  # noqa: E731
+
+        with open(path, newline="", encoding="utf-8-sig") as settlement:
+            report = reconcile_settlement(db, settlement, on_mismatch, chunk_size)
+    finally:
+        db.close()
+        if report_file is not None:
+            report_file.close()
+
+    logger.info(
+        "Settlement {} reconciled: {} lines, {} paid, {} failed, {} unchanged, {} mismatches {}",
+        path,
+        report.lines,
+        report.marked_paid,
+        report.marked_failed,
+        report.unchanged,
+        report.mismatches,
+        report.by_reason,
+    )
+    return report
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("settlement")
+    parser.add_argument("--report", help="Write mismatches to this CSV file")
+    parser.add_argument("--chunk-size", type=int, default=1000)
+    args = parser.parse_args()
+
+    reconcile_file(args.settlement, args.report, args.chunk_size)
@@ -0,0 +1,54 @@
+"""
+Check or rebuild the revenue ledger.
+
+    python -m app.tasks.revenue             # report drifted buckets, exit 1 if any
+    python -m app.tasks.revenue --rebuild   # recompute every bucket from payments
+"""
+import argparse
+import sys
+
+from loguru import logger
+
+from app.core.logging import setup_logging
+from app.db.session import engine
+from app.services.revenue import rebuild_revenue, verify_revenue
+
+# Initialize logging (safe if called multiple times)
+setup_logging()
+
+
+def check_revenue_ledger() -> int:
+    """
+    Log every bucket where the ledger disagrees with payments.
+    Returns the number of such buckets.
+    """
+    with engine.connect() as conn:
+        drift = verify_revenue(conn)
+
+    for day, method, ledger_amount, actual_amount in drift:
+        logger.warning(
+            "Revenue ledger drift on {} / {}: ledger {} != payments {}",
+            day,
+            method,
+            ledger_amount,
+            actual_amount,
+        )
+    logger.info("Revenue ledger checked: {} drifted buckets", len(drift))
+    return len(drift)
+
+
+def rebuild_revenue_ledger() -> None:
+    with engine.begin() as conn:
+        rebuild_revenue(conn)
+    logger.info("Revenue ledger rebuilt")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rebuild", action="store_true", help="Recompute the ledger from payments")
+    args = parser.parse_args()
+
+    if args.rebuild:
+        rebuild_revenue_ledger()
+    else:
+        sys.exit(1 if check_revenue_ledger() else 0)
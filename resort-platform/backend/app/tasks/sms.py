@@ -1,27 +1,65 @@
-from typing import Optional
+from typing import Iterable, Optional, Tuple
 
+from app.core.config import settings
 from app.core.logging import setup_logging
+from app.services.messaging import (
+    DeliveryResult,
+    SmsClient,
+    SmsMessage,
+    queue_sms,
+)
 
 setup_logging()
 
 
-def send_booking_confirmation_sms(
+# -------------------------------------------------
+# Message builders
+# -------------------------------------------------
+
+def build_booking_confirmation_sms(
     phone_number: str,
     booking_id: int,
     guest_name: Optional[str] = None,
-) -> None:
-    """
-    Send booking confirmation SMS.
-    Replace with real SMS gateway (Twilio, MSG91, etc.).
-    """
+) -> SmsMessage:
     message = (
         f"Dear {guest_name or 'Guest'}, "
         f"your booking (ID: {booking_id}) is confirmed. "
         f"Thank you for choosing our resort."
     )
+    return SmsMessage(to=phone_number, body=message)
+
+
+def build_payment_confirmation_sms(
+    phone_number: str,
+    amount: str,
+) -> SmsMessage:
+    message = f"Payment of {amount} received successfully. Thank you."
+    return SmsMessage(to=phone_number, body=message)
+
 
-    # Placeholder – integrate SMS gateway here
-    print(f"[SMS] To: {phone_number} | Message: {message}")
+def _send(sms: SmsMessage) -> None:
+    if not settings.SMS_API_URL:
+        # No gateway configured (local development)
+        print(f"[SMS] To: {sms.to} | Message: {sms.body}")
+        return
+
+    # Batched with concurrent sends over the process-wide pool
+    queue_sms(sms)
+
+
+# -------------------------------------------------
+# Single sends
+# -------------------------------------------------
+
+def send_booking_confirmation_sms(
+    phone_number: str,
+    booking_id: int,
+    guest_name: Optional[str] = None,
+) -> None:
+    """
+    Send booking confirmation SMS.
+    """
+    _send(build_booking_confirmation_sms(phone_number, booking_id, guest_name))
 
 
 def send_payment_confirmation_sms(
@@ -31,6 +69,27 @@ def send_payment_confirmation_sms(
     """
     Send payment confirmation SMS.
     """
-    message = f"Payment of {amount} received successfully. Thank you."
+    _send(build_payment_confirmation_sms(phone_number, amount))
+
+
+# -------------------------------------------------
+# Bulk sends
+# -------------------------------------------------
+
+async def send_booking_confirmation_sms_bulk(
+    recipients: Iterable[Tuple[str, int, Optional[str]]],
+    client: Optional[SmsClient] = None,
+) -> DeliveryResult:
+    """
+    Send confirmations for many (phone, booking_id, guest_name) tuples
+    over one pooled client, batched per gateway limits.
+    """
+    messages = [
+        build_booking_confirmation_sms(*recipient) for recipient in recipients
+    ]
+
+    if client is not None:
+        return await client.send_many(messages)
 
-    print(f"[SMS] To: {phone_number} | Message: {message}")
+    async with SmsClient.from_settings() as client:
+        return await client.send_many(messages)
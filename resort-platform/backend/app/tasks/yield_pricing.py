@@ -0,0 +1,43 @@
+"""
+Recompute occupancy-driven rate suggestions for every room-night in the
+yield horizon (hourly).
+
+    python -m app.tasks.yield_pricing            # suggest (apply if YIELD_AUTO_APPLY)
+    python -m app.tasks.yield_pricing --apply    # also make the suggestions the quoted rates
+"""
+import argparse
+import time
+from typing import Optional
+
+from loguru import logger
+
+from app.core.logging import setup_logging
+from app.db.session import SessionLocal
+from app.services.yield_pricing import compute_yield_rates
+
+# Initialize logging (safe if called multiple times)
+setup_logging()
+
+
+def refresh_yield_rates(apply: Optional[bool] = None) -> int:
+    started = time.perf_counter()
+    db = SessionLocal()
+    try:
+        written, repriced = compute_yield_rates(db, apply=apply)
+    finally:
+        db.close()
+    logger.info(
+        "Yield rates computed for {} room-nights in {:.2f}s; {} rooms repriced",
+        written,
+        time.perf_counter() - started,
+        repriced,
+    )
+    return written
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--apply", action="store_true", help="Apply the suggested rates regardless of YIELD_AUTO_APPLY")
+    args = parser.parse_args()
+
+    refresh_yield_rates(apply=True if args.apply else None)
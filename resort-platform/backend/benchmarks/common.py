@@ -0,0 +1,82 @@
+"""
+Shared helpers for the benchmark scripts: percentiles and result files.
+"""
+import json
+import platform
+import subprocess
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Sequence
+
+RESULTS_DIR = Path(__file__).resolve().parent / "results"
+
+
+def percentile(sorted_values: Sequence[float], pct: float) -> float:
+    """
+    Nearest-rank percentile of an already sorted sequence.
+    """
+    if not sorted_values:
+        return 0.0
+    rank = max(0, min(len(sorted_values) - 1, round(pct / 100 * len(sorted_values)) - 1))
+    return sorted_values[rank]
+
+
+def summarize(latencies: List[float], elapsed: float) -> Dict[str, float]:
+    """
+    Latency summary in milliseconds plus throughput in ops/s.
+    """
+    values = sorted(latencies)
+    return {
+        "count": len(values),
+        "p50_ms": percentile(values, 50) * 1000,
+        "p95_ms": percentile(values, 95) * 1000,
+        "p99_ms": percentile(values, 99) * 1000,
+        "max_ms": (values[-1] if values else 0.0) * 1000,
+        "throughput_per_s": len(values) / elapsed if elapsed else 0.0,
+    }
+
+
+def _git_revision() -> str:
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "--short", "HEAD"],
+            stderr=subprocess.DEVNULL,
+            text=True,
+        ).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def save_results(name: str, params: Dict[str, Any], results: Dict[str, Any]) -> Path:
+    """
+    Write a result file tagged with revision and parameters so runs
+    can be compared with `python -m benchmarks.compare`.
+    """
+    RESULTS_DIR.mkdir(exist_ok=True)
+    stamp = datetime.utcnow().strftime("%Y%m%dT%H%M%S")
+    path = RESULTS_DIR / f"{name}-{stamp}.json"
+
+    document = {
+        "benchmark": name,
+        "revision": _git_revision(),
+        "timestamp": stamp,
+        "python": platform.python_version(),
+        "params": params,
+        "results": results,
+    }
+    path.write_text(json.dumps(document, indent=2, default=str))
+    return path
+
+
+class Timer:
+    """
+    Context manager measuring wall time in seconds.
+    """
+
+    def __enter__(self) -> "Timer":
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.elapsed = time.perf_counter() - self.start
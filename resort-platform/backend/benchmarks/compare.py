@@ -0,0 +1,50 @@
+"""
+Compare two benchmark result files.
+
+    python -m benchmarks.compare results/micro-A.json results/micro-B.json
+"""
+import argparse
+import json
+from typing import Dict, Iterator, Tuple
+
+METRICS = ("p50_ms", "p95_ms", "p99_ms", "throughput_per_s")
+
+
+def _flatten(results: Dict, prefix: str = "") -> Iterator[Tuple[str, Dict]]:
+    for key, value in results.items():
+        if not isinstance(value, dict):
+            continue
+        if any(metric in value for metric in METRICS):
+            yield prefix + key, value
+        else:
+            yield from _flatten(value, prefix + key + ".")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("baseline")
+    parser.add_argument("candidate")
+    args = parser.parse_args()
+
+    with open(args.baseline) as fh:
+        baseline = json.load(fh)
+    with open(args.candidate) as fh:
+        candidate = json.load(fh)
+
+    print(f"baseline  {baseline['revision']} ({baseline['timestamp']})")
+    print(f"candidate {candidate['revision']} ({candidate['timestamp']})\n")
+
+    candidate_cases = dict(_flatten(candidate["results"]))
+    for case, before in _flatten(baseline["results"]):
+        after = candidate_cases.get(case)
+        if after is None:
+            continue
+        for metric in METRICS:
+            if metric not in before or metric not in after:
+                continue
+            change = (after[metric] - before[metric]) / before[metric] * 100 if before[metric] else 0.0
+            print(f"{case:<28} {metric:<18} {before[metric]:>12.3f} {after[metric]:>12.3f} {change:+7.1f}%")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,266 @@
+"""
+Deterministic synthetic data loader for benchmarking.
+
+Bulk-loads rooms, guests, bookings, payments and reviews into the
+configured Postgres database with COPY. The same seed and volumes always
+produce the same rows, so benchmark runs are comparable.
+
+    python -m benchmarks.datagen --rooms 200 --guests 300000 \\
+        --bookings 1000000 --payments 1500000 --reviews 100000
+
+WARNING: truncates the target tables first.
+"""
+import argparse
+import io
+import json
+import random
+import time
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+from typing import Callable, Iterable, Iterator
+
+from sqlalchemy import text
+
+import app.db.base  # noqa: F401  (registers all models)
+from app.db.base import Base
+from app.db.partitions import ensure_partitions
+from app.db.session import engine
+from app.services.guest_stats import rebuild_guest_stats
+from app.services.revenue import rebuild_revenue
+
+START_DATE = date(2022, 1, 1)
+HORIZON_DAYS = 365 * 5
+AMENITIES = ["wifi", "ac", "pool_view", "sea_view", "balcony", "kitchenette", "bathtub", "garden_view"]
+BOOKING_STATUSES = ["CONFIRMED"] * 7 + ["COMPLETED"] * 2 + ["CANCELLED"]
+PAYMENT_STATUSES = ["PAID"] * 8 + ["PENDING"] + ["FAILED"]
+PAYMENT_METHODS = ["UPI", "CARD", "NETBANKING", "CASH"]
+
+
+class _IterStream(io.RawIOBase):
+    """
+    Read-only file object over an iterator of text lines, so COPY can
+    stream rows without materializing the whole table.
+    """
+
+    def __init__(self, lines: Iterable[str]) -> None:
+        self._lines = iter(lines)
+        self._buffer = b""
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, target) -> int:
+        wanted = len(target)
+        chunks, size = [self._buffer], len(self._buffer)
+        while size < wanted:
+            try:
+                line = next(self._lines).encode()
+            except StopIteration:
+                break
+            chunks.append(line)
+            size += len(line)
+
+        data = b"".join(chunks)
+        size = min(wanted, len(data))
+        target[:size] = data[:size]
+        self._buffer = data[size:]
+        return size
+
+
+def _csv(*values) -> str:
+    out = []
+    for value in values:
+        if value is None:
+            out.append("")
+        else:
+            text = str(value)
+            if any(ch in text for ch in ',"\n'):
+                text = '"' + text.replace('"', '""') + '"'
+            out.append(text)
+    return ",".join(out) + "\n"
+
+
+# -------------------------------------------------
+# Row generators
+# -------------------------------------------------
+
+def room_prices(rooms: int, seed: int) -> list:
+    rng = random.Random(seed)
+    return [Decimal(rng.randrange(2500, 25000, 250)) for _ in range(rooms)]
+
+
+def gen_rooms(rooms: int, seed: int) -> Iterator[str]:
+    rng = random.Random(seed + 1)
+    now = datetime(2022, 1, 1)
+    for room_id, price in enumerate(room_prices(rooms, seed), start=1):
+        amenities = {name: True for name in rng.sample(AMENITIES, rng.randint(2, 6))}
+        yield _csv(
+            room_id,
+            f"Villa {room_id}",
+            f"Synthetic room {room_id} " + "lorem ipsum " * rng.randint(5, 40),
+            price,
+            rng.randint(1, 4),
+            rng.randint(0, 3),
+            json.dumps(amenities),
+            "true",
+            room_id,
+            now,
+            now,
+        )
+
+
+def gen_guests(guests: int, seed: int) -> Iterator[str]:
+    rng = random.Random(seed + 2)
+    for guest_id in range(1, guests + 1):
+        yield _csv(
+            guest_id,
+            f"Guest {guest_id}",
+            f"guest{guest_id}@example.com",
+            f"+91{rng.randint(6000000000, 9999999999)}",
+            None,
+            "false",
+            START_DATE + timedelta(days=rng.randrange(HORIZON_DAYS)),
+        )
+
+
+def gen_bookings(bookings: int, rooms: int, guests: int, seed: int) -> Iterator[str]:
+    rng = random.Random(seed + 3)
+    prices = room_prices(rooms, seed)
+    for booking_id in range(1, bookings + 1):
+        room_id = rng.randint(1, rooms)
+        guest = rng.randint(1, max(guests, 1))
+        check_in = START_DATE + timedelta(days=rng.randrange(HORIZON_DAYS))
+        nights = rng.randint(1, 7)
+        created_at = datetime.combine(
+            check_in - timedelta(days=rng.randint(0, 120)),
+            datetime.min.time(),
+        ) + timedelta(seconds=rng.randrange(86400))
+        yield _csv(
+            booking_id,
+            room_id,
+            guest,
+            f"Guest {guest}",
+            f"guest{guest}@example.com",
+            f"+91{9000000000 + guest}",
+            check_in,
+            check_in + timedelta(days=nights),
+            rng.randint(1, 3),
+            rng.randint(0, 2),
+            prices[room_id - 1] * nights,
+            rng.choice(BOOKING_STATUSES),
+            "Late check-in please" if rng.random() < 0.2 else None,
+            created_at,
+            created_at,
+        )
+
+
+def gen_payments(payments: int, bookings: int, seed: int) -> Iterator[str]:
+    rng = random.Random(seed + 4)
+    for payment_id in range(1, payments + 1):
+        booking_id = (payment_id - 1) % bookings + 1
+        status = rng.choice(PAYMENT_STATUSES)
+        created_at = datetime.combine(
+            START_DATE + timedelta(days=rng.randrange(HORIZON_DAYS)),
+            datetime.min.time(),
+        ) + timedelta(seconds=rng.randrange(86400))
+        yield _csv(
+            payment_id,
+            booking_id,
+            Decimal(rng.randrange(1000, 50000, 50)),
+            rng.choice(PAYMENT_METHODS),
+            status,
+            f"PAY{payment_id:010d}",
+            created_at + timedelta(minutes=5) if status == "PAID" else None,
+            created_at,
+        )
+
+
+def gen_reviews(reviews: int, seed: int) -> Iterator[str]:
+    rng = random.Random(seed + 5)
+    words = ["lovely", "pool", "clean", "staff", "breakfast", "view", "noisy", "quiet", "beach", "spa"]
+    for review_id in range(1, reviews + 1):
+        yield _csv(
+            review_id,
+            review_id,  # booking_id is unique per review
+            f"Guest {review_id}",
+            rng.randint(1, 5),
+            " ".join(rng.choices(words, k=rng.randint(5, 30))),
+            "true" if rng.random() < 0.9 else "false",
+            START_DATE + timedelta(days=rng.randrange(HORIZON_DAYS)),
+        )
+
+
+# -------------------------------------------------
+# Loader
+# -------------------------------------------------
+
+TABLES = [
+    ("rooms", "id, name, description, base_price, max_adults, max_children, amenities, is_active, display_order, created_at, updated_at"),
+    ("guests", "id, full_name, email, phone, hashed_password, is_admin, created_at"),
+    ("bookings", "id, room_id, guest_id, guest_name, guest_email, guest_phone, check_in, check_out, adults, children, total_amount, status, special_requests, created_at, updated_at"),
+    ("payments", "id, booking_id, amount, method, status, reference_id, paid_at, created_at"),
+    ("reviews", "id, booking_id, guest_name, rating, comment, is_approved, created_at"),
+]
+
+
+def load(args: argparse.Namespace) -> None:
+    Base.metadata.create_all(engine)
+    with engine.begin() as conn:
+        # Yearly partitions for every date the generators produce
+        ensure_partitions(conn, START_DATE.year, (START_DATE + timedelta(days=HORIZON_DAYS + 7)).year)
+
+    generators: dict[str, Callable[[], Iterator[str]]] = {
+        "rooms": lambda: gen_rooms(args.rooms, args.seed),
+        "guests": lambda: gen_guests(args.guests, args.seed),
+        "bookings": lambda: gen_bookings(args.bookings, args.rooms, args.guests, args.seed),
+        "payments": lambda: gen_payments(args.payments, args.bookings, args.seed),
+        "reviews": lambda: gen_reviews(min(args.reviews, args.bookings), args.seed),
+    }
+
+    connection = engine.raw_connection()
+    try:
+        cursor = connection.cursor()
+        cursor.execute(
+            "TRUNCATE " + ", ".join(name for name, _ in reversed(TABLES))
+            + " RESTART IDENTITY CASCADE"
+        )
+
+        for table, columns in TABLES:
+            start = time.perf_counter()
+            cursor.copy_expert(
+                f"COPY {table} ({columns}) FROM STDIN WITH (FORMAT csv)",
+                io.BufferedReader(_IterStream(generators[table]()), buffer_size=1 << 20),
+            )
+            cursor.execute(
+                f"SELECT setval(pg_get_serial_sequence('{table}', 'id'), "
+                f"COALESCE(MAX(id), 1)) FROM {table}"
+            )
+            print(f"{table:<10} loaded in {time.perf_counter() - start:6.1f}s")
+
+        connection.commit()
+    finally:
+        connection.close()
+
+    start = time.perf_counter()
+    with engine.begin() as conn:
+        rebuild_guest_stats(conn)
+    print(f"{'guest_stats':<10} built in {time.perf_counter() - start:6.1f}s")
+
+    start = time.perf_counter()
+    with engine.begin() as conn:
+        rebuild_revenue(conn)
+    print(f"{'revenue':<10} built in {time.perf_counter() - start:6.1f}s")
+
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+        conn.execute(text("VACUUM ANALYZE"))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--rooms", type=int, default=200)
+    parser.add_argument("--guests", type=int, default=300_000)
+    parser.add_argument("--bookings", type=int, default=1_000_000)
+    parser.add_argument("--payments", type=int, default=1_500_000)
+    parser.add_argument("--reviews", type=int, default=100_000)
+    load(parser.parse_args())
@@ -0,0 +1,143 @@
+"""
+Scripted HTTP scenario: search -> quote -> book -> pay.
+
+Runs `--concurrency` virtual guests for `--iterations` journeys each
+against a running API and reports p50/p95/p99 latency and throughput
+per step.
+
+    python -m benchmarks.http_scenarios --base-url http://localhost:8000 \\
+        --concurrency 32 --iterations 50
+"""
+import argparse
+import asyncio
+import json
+import random
+import time
+from collections import Counter, defaultdict
+from datetime import date, timedelta
+from typing import Dict, List
+
+import httpx
+
+from benchmarks.common import save_results, summarize
+
+API = "/api/v1"
+
+
+class ScenarioStats:
+    def __init__(self) -> None:
+        self.latencies: Dict[str, List[float]] = defaultdict(list)
+        self.statuses: Dict[str, Counter] = defaultdict(Counter)
+
+    async def timed(self, step: str, request) -> httpx.Response:
+        start = time.perf_counter()
+        response = await request
+        self.latencies[step].append(time.perf_counter() - start)
+        self.statuses[step][response.status_code] += 1
+        return response
+
+
+async def guest_journey(
+    client: httpx.AsyncClient,
+    stats: ScenarioStats,
+    rng: random.Random,
+    guest_no: int,
+) -> None:
+    response = await stats.timed("search", client.get(f"{API}/rooms/"))
+    rooms = response.json() if response.status_code == 200 else []
+    if not rooms:
+        return
+
+    room = rng.choice(rooms)
+    check_in = date.today() + timedelta(days=rng.randint(30, 400))
+    check_out = check_in + timedelta(days=rng.randint(1, 5))
+
+    response = await stats.timed(
+        "quote",
+        client.get(
+            f"{API}/pricing/room/{room['id']}/price",
+            params={"check_in": check_in.isoformat(), "check_out": check_out.isoformat()},
+        ),
+    )
+    if response.status_code != 200:
+        return
+    total = response.json()["total_price"]
+
+    response = await stats.timed(
+        "book",
+        client.post(
+            f"{API}/bookings/",
+            json={
+                "room_id": room["id"],
+                "guest_name": f"Bench Guest {guest_no}",
+                "guest_email": f"bench{guest_no}@example.com",
+                "guest_phone": f"+91{8000000000 + guest_no}",
+                "check_in": check_in.isoformat(),
+                "check_out": check_out.isoformat(),
+                "adults": 2,
+                "children": 0,
+                "total_amount": str(total),
+            },
+        ),
+    )
+    if response.status_code != 201:
+        return
+
+    await stats.timed(
+        "pay",
+        client.post(
+            f"{API}/payments/",
+            json={
+                "booking_id": response.json()["id"],
+                "amount": str(total),
+                "method": "UPI",
+                "reference_id": f"BENCH{guest_no:09d}",
+            },
+        ),
+    )
+
+
+async def run(args: argparse.Namespace) -> Dict:
+    stats = ScenarioStats()
+    limits = httpx.Limits(max_connections=args.concurrency, max_keepalive_connections=args.concurrency)
+
+    async with httpx.AsyncClient(base_url=args.base_url, limits=limits, timeout=30) as client:
+        async def worker(worker_id: int) -> None:
+            rng = random.Random(args.seed * 1000 + worker_id)
+            for i in range(args.iterations):
+                await guest_journey(client, stats, rng, worker_id * args.iterations + i)
+
+        start = time.perf_counter()
+        await asyncio.gather(*(worker(w) for w in range(args.concurrency)))
+        elapsed = time.perf_counter() - start
+
+    return {
+        "elapsed_s": elapsed,
+        "steps": {
+            step: {
+                **summarize(latencies, elapsed),
+                "statuses": dict(stats.statuses[step]),
+            }
+            for step, latencies in stats.latencies.items()
+        },
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--base-url", default="http://localhost:8000")
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--iterations", type=int, default=25)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    results = asyncio.run(run(args))
+    for step, summary in results["steps"].items():
+        print(f"{step:<8} {json.dumps(summary)}")
+
+    path = save_results("http_scenarios", vars(args), results)
+    print(f"saved {path}")
+
+
+if __name__ == "__main__":
+    main()
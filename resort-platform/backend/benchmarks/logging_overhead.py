@@ -0,0 +1,68 @@
+"""
+Per-record overhead of the stdlib -> loguru logging pipeline.
+
+Run from the backend directory:
+
+    python -m benchmarks.logging_overhead --records 50000
+"""
+import argparse
+import logging
+import os
+import time
+
+from loguru import logger
+
+from app.core import logging as app_logging
+
+
+def _configure(json_logs: bool, resolve_frames: bool, sampling: dict):
+    sink = app_logging.NonBlockingSink(open(os.devnull, "w"), maxsize=100_000)
+
+    logger.remove()
+    logger.configure(
+        patcher=app_logging._patch_json if json_logs else app_logging._patch_record,
+    )
+    logger.add(
+        sink,
+        format=(lambda _: app_logging.JSON_FORMAT) if json_logs else app_logging.LOG_FORMAT,
+        colorize=False,
+    )
+
+    bench_logger = logging.getLogger("sqlalchemy.engine.Engine")
+    bench_logger.handlers = [
+        app_logging.InterceptHandler(
+            resolve_frames=resolve_frames,
+            sampling=sampling,
+        )
+    ]
+    bench_logger.propagate = False
+    bench_logger.setLevel(logging.INFO)
+    return bench_logger, sink
+
+
+def run(records: int) -> None:
+    scenarios = [
+        ("text, frame walk", False, True, {}),
+        ("json, no frame walk", True, False, {}),
+        ("json, sampled 5%", True, False, {"sqlalchemy.engine": 0.05}),
+    ]
+
+    for label, json_logs, resolve_frames, sampling in scenarios:
+        bench_logger, sink = _configure(json_logs, resolve_frames, sampling)
+
+        start = time.perf_counter()
+        for i in range(records):
+            bench_logger.info("SELECT bookings.id FROM bookings WHERE id = %s", i)
+        elapsed = time.perf_counter() - start
+
+        sink.stop()
+        print(
+            f"{label:<24} {elapsed / records * 1e6:8.2f} us/record "
+            f"(dropped {sink.dropped})"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--records", type=int, default=50_000)
+    run(parser.parse_args().records)
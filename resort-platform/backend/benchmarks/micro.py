@@ -0,0 +1,160 @@
+"""
+Microbenchmarks for hot service functions and response serialization.
+
+DB-backed cases run against the configured database (load it with
+`python -m benchmarks.datagen` first); serialization runs in memory.
+
+    python -m benchmarks.micro --iterations 2000 --rows 10000
+"""
+import argparse
+import json
+import random
+import time
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+from typing import Callable, Dict, List
+
+from fastapi.encoders import jsonable_encoder
+
+import app.db.base  # noqa: F401  (registers all models)
+from app.core.serialization import rows_response
+from app.db.session import SessionLocal
+from app.models.booking import Booking
+from app.models.room import Room
+from app.schemas.booking import BookingOut
+from app.services.availability import is_room_available
+from app.services.pricing_engine import calculate_total_price
+from benchmarks.common import save_results, summarize
+
+
+def _measure(fn: Callable[[int], None], iterations: int) -> Dict[str, float]:
+    latencies: List[float] = []
+    start = time.perf_counter()
+    for i in range(iterations):
+        t0 = time.perf_counter()
+        fn(i)
+        latencies.append(time.perf_counter() - t0)
+    return summarize(latencies, time.perf_counter() - start)
+
+
+def synthetic_bookings(rows: int, seed: int = 42) -> List[Booking]:
+    rng = random.Random(seed)
+    now = datetime(2026, 1, 1)
+    bookings = []
+    for i in range(1, rows + 1):
+        check_in = date(2026, 1, 1) + timedelta(days=rng.randrange(365))
+        bookings.append(
+            Booking(
+                id=i,
+                room_id=rng.randint(1, 200),
+                guest_name=f"Guest {i}",
+                guest_email=f"guest{i}@example.com",
+                guest_phone=f"+91{9000000000 + i}",
+                check_in=check_in,
+                check_out=check_in + timedelta(days=rng.randint(1, 7)),
+                adults=2,
+                children=0,
+                total_amount=Decimal("12500.00"),
+                status="CONFIRMED",
+                special_requests=None,
+                created_at=now,
+                updated_at=now,
+            )
+        )
+    return bookings
+
+
+# -------------------------------------------------
+# Cases
+# -------------------------------------------------
+
+def bench_pricing(iterations: int, seed: int) -> Dict[str, float]:
+    db = SessionLocal()
+    try:
+        room_ids = [room_id for (room_id,) in db.query(Room.id).all()]
+        rng = random.Random(seed)
+
+        def run(_: int) -> None:
+            check_in = date(2026, 1, 1) + timedelta(days=rng.randrange(365))
+            calculate_total_price(db, rng.choice(room_ids), check_in, check_in + timedelta(days=3))
+
+        return _measure(run, iterations)
+    finally:
+        db.close()
+
+
+def bench_availability(iterations: int, seed: int) -> Dict[str, float]:
+    db = SessionLocal()
+    try:
+        room_ids = [room_id for (room_id,) in db.query(Room.id).all()]
+        rng = random.Random(seed)
+
+        def run(_: int) -> None:
+            check_in = date(2026, 1, 1) + timedelta(days=rng.randrange(365))
+            is_room_available(db, rng.choice(room_ids), check_in, check_in + timedelta(days=3))
+
+        return _measure(run, iterations)
+    finally:
+        db.close()
+
+
+def bench_serialization(rows: int, repeats: int) -> Dict[str, float]:
+    bookings = synthetic_bookings(rows)
+
+    def run(_: int) -> None:
+        models = [BookingOut.model_validate(b) for b in bookings]
+        json.dumps(jsonable_encoder(models))
+
+    result = _measure(run, repeats)
+    result["rows"] = rows
+    return result
+
+
+def bench_serialization_fast(rows: int, repeats: int) -> Dict[str, float]:
+    """
+    Row tuples -> orjson, as served by the list endpoints.
+    """
+    fields = list(BookingOut.model_fields)
+    tuples = [
+        tuple(getattr(b, name) for name in fields)
+        for b in synthetic_bookings(rows)
+    ]
+
+    def run(_: int) -> None:
+        rows_response(tuples, BookingOut)
+
+    result = _measure(run, repeats)
+    result["rows"] = rows
+    return result
+
+
+CASES = ("pricing", "availability", "serialization", "serialization_fast")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--iterations", type=int, default=2000)
+    parser.add_argument("--rows", type=int, default=10_000)
+    parser.add_argument("--repeats", type=int, default=10)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--only", choices=CASES, action="append")
+    args = parser.parse_args()
+
+    results = {}
+    for case in args.only or CASES:
+        if case == "pricing":
+            results[case] = bench_pricing(args.iterations, args.seed)
+        elif case == "availability":
+            results[case] = bench_availability(args.iterations, args.seed)
+        elif case == "serialization":
+            results[case] = bench_serialization(args.rows, args.repeats)
+        else:
+            results[case] = bench_serialization_fast(args.rows, args.repeats)
+        print(f"{case:<14} {json.dumps(results[case])}")
+
+    path = save_results("micro", vars(args), results)
+    print(f"saved {path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,190 @@
+"""
+Season-rush simulator for the booking path.
+
+Fires `--requests` concurrent POST /bookings/ for overlapping date
+ranges on a handful of rooms, then reports success / 409 rates, tail
+latency, lock waits sampled from pg_stat_activity during the run, and
+any double bookings that slipped through the availability check.
+
+Run against the docker-compose stack (API on :80 via nginx or :8000,
+Postgres on :5432 as configured in Settings):
+
+    python -m benchmarks.season_rush --base-url http://localhost:8000 \\
+        --hot-rooms 20 --requests 2000 --concurrency 200
+
+Exits non-zero when a double booking is detected.
+"""
+import argparse
+import asyncio
+import json
+import random
+import sys
+import threading
+import time
+import uuid
+from collections import Counter
+from datetime import date, timedelta
+from typing import Dict, List
+
+import httpx
+from sqlalchemy import text
+
+from app.db.session import engine
+from benchmarks.common import save_results, summarize
+
+API = "/api/v1"
+
+LOCK_WAITS_SQL = text(
+    """
+    SELECT count(*)
+    FROM pg_stat_activity
+    WHERE datname = current_database()
+      AND wait_event_type = 'Lock'
+    """
+)
+
+DOUBLE_BOOKINGS_SQL = text(
+    """
+    SELECT a.room_id, a.id AS first_id, b.id AS second_id,
+           a.check_in, a.check_out, b.check_in, b.check_out
+    FROM bookings a
+    JOIN bookings b
+      ON a.room_id = b.room_id
+     AND a.id < b.id
+     AND a.check_in < b.check_out
+     AND a.check_out > b.check_in
+    WHERE a.status = 'CONFIRMED'
+      AND b.status = 'CONFIRMED'
+      AND (a.guest_email LIKE :tag OR b.guest_email LIKE :tag)
+    """
+)
+
+CLEANUP_SQL = text("DELETE FROM bookings WHERE guest_email LIKE :tag")
+
+
+class LockWaitSampler(threading.Thread):
+    """
+    Polls pg_stat_activity for backends waiting on heavyweight locks.
+    """
+
+    def __init__(self, interval: float) -> None:
+        super().__init__(daemon=True)
+        self.interval = interval
+        self.samples: List[int] = []
+        self._stop_event = threading.Event()
+
+    def run(self) -> None:
+        with engine.connect() as conn:
+            while not self._stop_event.is_set():
+                self.samples.append(conn.execute(LOCK_WAITS_SQL).scalar() or 0)
+                conn.rollback()
+                self._stop_event.wait(self.interval)
+
+    def stop(self) -> Dict[str, float]:
+        self._stop_event.set()
+        self.join()
+        return {
+            "samples": len(self.samples),
+            "max_waiting": max(self.samples, default=0),
+            "mean_waiting": sum(self.samples) / len(self.samples) if self.samples else 0.0,
+            "pct_samples_with_waits": (
+                100 * sum(1 for s in self.samples if s) / len(self.samples)
+                if self.samples else 0.0
+            ),
+        }
+
+
+async def rush(args: argparse.Namespace, run_tag: str) -> Dict:
+    limits = httpx.Limits(max_connections=args.concurrency, max_keepalive_connections=args.concurrency)
+    async with httpx.AsyncClient(base_url=args.base_url, limits=limits, timeout=60) as client:
+        rooms = (await client.get(f"{API}/rooms/")).json()
+        room_ids = [room["id"] for room in rooms][: args.hot_rooms]
+        if not room_ids:
+            raise SystemExit("No active rooms; load data with benchmarks.datagen first")
+
+        rng = random.Random(args.seed)
+        opening = date.fromisoformat(args.opening) if args.opening else date.today() + timedelta(days=60)
+        payloads = []
+        for i in range(args.requests):
+            check_in = opening + timedelta(days=rng.randrange(args.window_days))
+            payloads.append({
+                "room_id": rng.choice(room_ids),
+                "guest_name": f"Rush Guest {i}",
+                "guest_email": f"{run_tag}-{i}@example.com",
+                "guest_phone": f"+91{7000000000 + i}",
+                "check_in": check_in.isoformat(),
+                "check_out": (check_in + timedelta(days=rng.randint(1, args.max_nights))).isoformat(),
+                "adults": 2,
+                "children": 0,
+                "total_amount": "10000.00",
+            })
+
+        semaphore = asyncio.Semaphore(args.concurrency)
+        latencies: List[float] = []
+        statuses: Counter = Counter()
+        start_gate = asyncio.Event()
+
+        async def book(payload: Dict) -> None:
+            await start_gate.wait()
+            async with semaphore:
+                t0 = time.perf_counter()
+                try:
+                    response = await client.post(f"{API}/bookings/", json=payload)
+                    statuses[response.status_code] += 1
+                except httpx.HTTPError as exc:
+                    statuses[type(exc).__name__] += 1
+                latencies.append(time.perf_counter() - t0)
+
+        tasks = [asyncio.create_task(book(p)) for p in payloads]
+        sampler = LockWaitSampler(args.sample_interval)
+        sampler.start()
+
+        start = time.perf_counter()
+        start_gate.set()
+        await asyncio.gather(*tasks)
+        elapsed = time.perf_counter() - start
+
+    return {
+        "rooms": room_ids,
+        "latency": summarize(latencies, elapsed),
+        "statuses": {str(k): v for k, v in statuses.items()},
+        "success_rate": statuses[201] / args.requests,
+        "conflict_rate": statuses[409] / args.requests,
+        "lock_waits": sampler.stop(),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--base-url", default="http://localhost:8000")
+    parser.add_argument("--hot-rooms", type=int, default=20)
+    parser.add_argument("--requests", type=int, default=1000)
+    parser.add_argument("--concurrency", type=int, default=100)
+    parser.add_argument("--opening", help="First night of the rush window (YYYY-MM-DD)")
+    parser.add_argument("--window-days", type=int, default=4)
+    parser.add_argument("--max-nights", type=int, default=3)
+    parser.add_argument("--sample-interval", type=float, default=0.05)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--keep", action="store_true", help="Keep the bookings created by the run")
+    args = parser.parse_args()
+
+    run_tag = f"rush-{uuid.uuid4().hex[:8]}"
+    results = asyncio.run(rush(args, run_tag))
+
+    with engine.begin() as conn:
+        conflicts = conn.execute(DOUBLE_BOOKINGS_SQL, {"tag": f"{run_tag}-%"}).fetchall()
+        results["double_bookings"] = [list(row) for row in conflicts]
+        if not args.keep:
+            conn.execute(CLEANUP_SQL, {"tag": f"{run_tag}-%"})
+
+    print(json.dumps({k: v for k, v in results.items() if k != "double_bookings"}, indent=2, default=str))
+    print(f"double bookings: {len(conflicts)}")
+
+    path = save_results("season_rush", vars(args), results)
+    print(f"saved {path}")
+
+    sys.exit(1 if conflicts else 0)
+
+
+if __name__ == "__main__":
+    main()
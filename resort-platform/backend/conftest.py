@@ -0,0 +1,82 @@
+from contextlib import contextmanager
+from typing import Dict, Optional
+
+import pytest
+
+# Fixtures needing the application run against the database configured
+# in the environment (infrastructure/env/backend.env), like the app.
+
+ADMIN_EMAIL = "pytest-admin@example.com"
+
+
+@pytest.fixture(scope="session")
+def client():
+    """
+    TestClient for the application, shared by the session.
+    """
+    from fastapi.testclient import TestClient
+
+    from app.main import app
+
+    with TestClient(app) as client:
+        yield client
+
+
+@pytest.fixture(scope="session")
+def admin_headers() -> Dict[str, str]:
+    """
+    Authorization header of an admin account created for the session.
+    """
+    from app.api.v1.auth import create_access_token
+    from app.db.session import SessionLocal
+    from app.models.guest import Guest
+
+    with SessionLocal() as db:
+        admin = db.query(Guest).filter(Guest.email == ADMIN_EMAIL).first()
+        created = admin is None
+        if created:
+            db.add(Guest(full_name="Pytest Admin", email=ADMIN_EMAIL, is_admin=True))
+            db.commit()
+
+    yield {"Authorization": f"Bearer {create_access_token(subject=ADMIN_EMAIL)}"}
+
+    if created:
+        with SessionLocal() as db:
+            db.query(Guest).filter(Guest.email == ADMIN_EMAIL).delete()
+            db.commit()
+
+
+@pytest.fixture
+def query_budget():
+    """
+    Assert that a block stays within a statement budget and does not
+    repeat one statement shape (N+1):
+
+        def test_list_bookings(client, admin_headers, query_budget):
+            with query_budget(route="GET /api/v1/bookings/"):
+                client.get("/api/v1/bookings/", headers=admin_headers)
+    """
+    from app.core.query_debug import QUERY_BUDGETS, enable_query_debug, track_queries
+    from app.db.session import engine
+
+    enable_query_debug(engine)
+
+    @contextmanager
+    def budget(
+        max_queries: Optional[int] = None,
+        route: Optional[str] = None,
+        repeat_threshold: int = 3,
+    ):
+        if route is not None:
+            max_queries = QUERY_BUDGETS[route]
+
+        with track_queries(
+            label=route or "query_budget",
+            max_queries=max_queries,
+            repeat_threshold=repeat_threshold,
+        ) as tracker:
+            yield tracker
+
+        assert not tracker.violations(), tracker.describe()
+
+    return budget
@@ -0,0 +1,199 @@
+import json
+import threading
+import time
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import List, Tuple
+
+import pytest
+
+from app.services.messaging import (
+    DeliveryWorker,
+    EmailClient,
+    EmailMessage,
+    ProviderClient,
+    SmsClient,
+    SmsMessage,
+)
+
+
+# -------------------------------------------------
+# Stub provider
+# -------------------------------------------------
+
+class StubProvider:
+    """
+    Local HTTP provider recording each request's payload and client
+    address. `responses` is consumed per request; once empty every
+    request gets 202.
+    """
+
+    def __init__(self) -> None:
+        self.requests: List[Tuple[Tuple[str, int], dict]] = []
+        self.responses: List[Tuple[int, dict]] = []
+        self._lock = threading.Lock()
+
+    @property
+    def url(self) -> str:
+        host, port = self.server.server_address
+        return f"http://{host}:{port}/send"
+
+    @property
+    def connections(self) -> int:
+        return len({address for address, _ in self.requests})
+
+    @property
+    def messages(self) -> list:
+        return [m for _, payload in self.requests for m in payload["messages"]]
+
+    def handler(self):
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            # Keep-alive, so pooled connections can be observed
+            protocol_version = "HTTP/1.1"
+
+            def do_POST(self) -> None:
+                body = self.rfile.read(int(self.headers["Content-Length"]))
+                with stub._lock:
+                    stub.requests.append((self.client_address, json.loads(body)))
+                    status, headers = stub.responses.pop(0) if stub.responses else (202, {})
+
+                self.send_response(status)
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+
+            def log_message(self, *args) -> None:
+                pass
+
+        return Handler
+
+
+@pytest.fixture
+def provider():
+    stub = StubProvider()
+    stub.server = ThreadingHTTPServer(("127.0.0.1", 0), stub.handler())
+    thread = threading.Thread(target=stub.server.serve_forever, daemon=True)
+    thread.start()
+    yield stub
+    stub.server.shutdown()
+    stub.server.server_close()
+
+
+def emails(count: int) -> List[EmailMessage]:
+    return [EmailMessage(f"guest{i}@example.com", "Hello", "Body") for i in range(count)]
+
+
+# -------------------------------------------------
+# Provider clients
+# -------------------------------------------------
+
+def test_provider_client_is_abstract():
+    with pytest.raises(TypeError):
+        ProviderClient("http://localhost")
+
+
+@pytest.mark.asyncio
+async def test_send_many_batches_over_one_connection(provider):
+    async with EmailClient(provider.url, "Resort <no-reply@resort.com>", batch_size=100, concurrency=1) as client:
+        result = await client.send_many(emails(250))
+
+    assert result.sent == 250 and not result.failed
+    assert [len(payload["messages"]) for _, payload in provider.requests] == [100, 100, 50]
+    assert len(provider.messages) == 250
+    assert provider.connections == 1
+
+
+@pytest.mark.asyncio
+async def test_sms_payload(provider):
+    async with SmsClient(provider.url, "RESORT") as client:
+        await client.send(SmsMessage("+10000000000", "Confirmed"))
+
+    _, payload = provider.requests[0]
+    assert payload == {"sender": "RESORT", "messages": [{"to": "+10000000000", "body": "Confirmed"}]}
+
+
+@pytest.mark.asyncio
+async def test_retry_after_is_honoured(provider):
+    provider.responses = [(429, {"Retry-After": "1"})]
+
+    async with EmailClient(provider.url, "Resort") as client:
+        started = time.monotonic()
+        result = await client.send_many(emails(1))
+
+    # Without the header the first retry waits at most 0.2s
+    assert time.monotonic() - started >= 0.9
+    assert result.sent == 1
+    assert len(provider.requests) == 2
+
+
+@pytest.mark.asyncio
+async def test_failures_are_reported_per_message(provider):
+    provider.responses = [(500, {})] * 2
+
+    async with EmailClient(provider.url, "Resort", max_attempts=2) as client:
+        result = await client.send_many(emails(3))
+
+    assert result.sent == 0
+    assert len(result.failed) == 3
+    assert result.failed[0][1].startswith("500")
+
+
+# -------------------------------------------------
+# Delivery worker
+# -------------------------------------------------
+
+@contextmanager
+def worker_for(provider, **options):
+    clients = []
+
+    def factory():
+        clients.append(EmailClient(provider.url, "Resort", **options))
+        return clients[-1]
+
+    worker = DeliveryWorker(factory, linger=0.2)
+    try:
+        yield worker, clients
+    finally:
+        worker.close()
+
+
+def test_worker_batches_single_sends_on_one_client(provider):
+    with worker_for(provider) as (worker, clients):
+        futures = []
+        threads = [
+            threading.Thread(target=lambda m=m: futures.append(worker.submit([m])))
+            for m in emails(20)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        results = [future.result(timeout=5) for future in futures]
+
+    assert all(result.sent == 1 for result in results)
+    assert len(clients) == 1
+    assert len(provider.requests) == 1
+    assert len(provider.messages) == 20
+
+
+def test_worker_reports_failures(provider):
+    provider.responses = [(400, {})]
+
+    with worker_for(provider) as (worker, _):
+        result = worker.submit(emails(2)).result(timeout=5)
+
+    assert result.sent == 0
+    assert len(result.failed) == 2
+
+
+@pytest.mark.asyncio
+async def test_worker_submit_inside_running_loop(provider):
+    with worker_for(provider) as (worker, _):
+        future = worker.submit(emails(1))
+
+    # close() flushed the queue
+    assert future.result(timeout=0).sent == 1
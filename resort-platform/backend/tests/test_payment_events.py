@@ -0,0 +1,65 @@
+import hashlib
+import hmac
+
+import orjson
+import pytest
+
+import app.db.base  # noqa: F401  (registers all models before the service imports them)
+from app.services.payment_events import _parse_event, verify_signature
+
+SECRET = "whsec_test"
+BODY = b'{"id": "evt_1"}'
+
+
+def sign(body: bytes) -> str:
+    return hmac.new(SECRET.encode(), body, hashlib.sha256).hexdigest()
+
+
+@pytest.mark.parametrize("prefix", ["", "sha256="])
+def test_valid_signature(prefix):
+    assert verify_signature(SECRET, BODY, prefix + sign(BODY))
+
+
+@pytest.mark.parametrize("signature", [None, "", "deadbeef", "sha256=" + "0" * 64, "ü" * 64])
+def test_invalid_signature(signature):
+    assert not verify_signature(SECRET, BODY, signature)
+
+
+def event(**fields) -> str:
+    payload = {"id": "evt_1", "type": "payment.paid", "data": {"reference_id": "PAY1"}}
+    payload.update(fields)
+    return orjson.dumps(payload).decode()
+
+
+def test_parse_event():
+    payload = event(data={"reference_id": "PAY1", "created_at": "2026-10-19T10:00:00+02:00"})
+    event_id, event_type, reference_id, occurred_at = _parse_event(payload)
+
+    assert (event_id, event_type, reference_id) == ("evt_1", "payment.paid", "PAY1")
+    assert occurred_at.isoformat() == "2026-10-19T08:00:00"
+
+
+def test_numeric_ids_become_text():
+    assert _parse_event(event(id=42, data={"reference_id": 7}))[::2] == ("42", "7")
+
+
+@pytest.mark.parametrize(
+    "payload",
+    [
+        "not json",
+        "[]",
+        event(type=["payment.paid"]),
+        event(type={"a": 1}),
+        event(id=None),
+        event(id=True),
+        event(id="x" * 256),
+        event(data=[1]),
+        event(data={"reference_id": {"a": 1}}),
+        event(data={"reference_id": "x" * 256}),
+        event(data={"reference_id": "PAY1", "created_at": 5}),
+        event(data={"reference_id": "PAY1", "created_at": "yesterday"}),
+    ],
+)
+def test_malformed_events_raise_value_error(payload):
+    with pytest.raises(ValueError):
+        _parse_event(payload)
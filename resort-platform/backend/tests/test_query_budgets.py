@@ -0,0 +1,192 @@
+from datetime import date, timedelta
+from typing import Dict, Optional
+
+import pytest
+from sqlalchemy import func, text
+
+from app.core.query_debug import QUERY_BUDGETS
+from app.db.session import SessionLocal
+from app.models.booking import Booking
+from app.models.dining import DiningItem
+from app.models.guest import Guest
+from app.models.payment import Payment
+from app.models.room import Room
+
+# One test per router: every GET route listed in QUERY_BUDGETS is
+# requested and must stay within its budget without repeating a
+# statement shape.
+
+
+@pytest.fixture(scope="module")
+def ids() -> Dict[str, Optional[int]]:
+    """
+    An existing id per resource (None when the table is empty).
+    """
+    with SessionLocal() as db:
+        return {
+            name: db.query(func.min(model.id)).scalar()
+            for name, model in (
+                ("room", Room),
+                ("booking", Booking),
+                ("payment", Payment),
+                ("guest", Guest),
+                ("dining", DiningItem),
+            )
+        }
+
+
+@pytest.fixture(scope="module")
+def trigram() -> bool:
+    """
+    Whether pg_trgm (typeahead search) is installed.
+    """
+    with SessionLocal() as db:
+        return db.execute(text("SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm'")).first() is not None
+
+
+@pytest.fixture
+def check(client, admin_headers, query_budget):
+    """
+    Request `path` and assert the budget of `route`.
+    """
+
+    def request(route: str, path: str, admin: bool = False) -> None:
+        headers = admin_headers if admin else {}
+        with query_budget(route=route):
+            response = client.get(path, headers=headers)
+        assert response.status_code == 200, response.text
+
+    return request
+
+
+def needs(ids: Dict[str, Optional[int]], *names: str) -> None:
+    missing = [name for name in names if ids[name] is None]
+    if missing:
+        pytest.skip(f"no {', '.join(missing)} rows to request")
+
+
+def test_every_budget_is_covered():
+    tested = {
+        route
+        for test in (
+            test_rooms, test_bookings, test_pricing, test_payments, test_guests,
+            test_reviews, test_dining, test_catalog, test_auth,
+        )
+        for route in test.routes
+    }
+    gets = {route for route in QUERY_BUDGETS if route.startswith("GET ")}
+    assert gets <= tested
+
+
+def routes(*names: str):
+    def mark(test):
+        test.routes = names
+        return test
+
+    return mark
+
+
+@routes("GET /api/v1/rooms/", "GET /api/v1/rooms/search", "GET /api/v1/rooms/{room_id}")
+def test_rooms(check, ids):
+    needs(ids, "room")
+    check("GET /api/v1/rooms/", "/api/v1/rooms/")
+    check("GET /api/v1/rooms/search", "/api/v1/rooms/search?adults=2")
+    check("GET /api/v1/rooms/{room_id}", f"/api/v1/rooms/{ids['room']}")
+
+
+@routes(
+    "GET /api/v1/bookings/",
+    "GET /api/v1/bookings/search",
+    "GET /api/v1/bookings/{booking_id}",
+    "GET /api/v1/bookings/{booking_id}/balance",
+)
+def test_bookings(check, ids, trigram):
+    needs(ids, "booking")
+    check("GET /api/v1/bookings/", "/api/v1/bookings/", admin=True)
+    check("GET /api/v1/bookings/", "/api/v1/bookings/?balance=true", admin=True)
+    if trigram:
+        check("GET /api/v1/bookings/search", "/api/v1/bookings/search?q=example", admin=True)
+    check("GET /api/v1/bookings/{booking_id}", f"/api/v1/bookings/{ids['booking']}", admin=True)
+    check(
+        "GET /api/v1/bookings/{booking_id}/balance",
+        f"/api/v1/bookings/{ids['booking']}/balance",
+        admin=True,
+    )
+
+
+@routes(
+    "GET /api/v1/pricing/room/{room_id}",
+    "GET /api/v1/pricing/room/{room_id}/price",
+    "GET /api/v1/pricing/grid",
+)
+def test_pricing(check, ids):
+    needs(ids, "room")
+    start = date.today() + timedelta(days=30)
+    end = start + timedelta(days=7)
+
+    check("GET /api/v1/pricing/room/{room_id}", f"/api/v1/pricing/room/{ids['room']}")
+    check(
+        "GET /api/v1/pricing/room/{room_id}/price",
+        f"/api/v1/pricing/room/{ids['room']}/price?check_in={start}&check_out={end}",
+    )
+    check("GET /api/v1/pricing/grid", f"/api/v1/pricing/grid?start={start}&end={end}", admin=True)
+
+
+@routes("GET /api/v1/payments/", "GET /api/v1/payments/{payment_id}")
+def test_payments(check, ids):
+    needs(ids, "payment")
+    check("GET /api/v1/payments/", "/api/v1/payments/", admin=True)
+    check("GET /api/v1/payments/{payment_id}", f"/api/v1/payments/{ids['payment']}", admin=True)
+
+
+@routes(
+    "GET /api/v1/guests/",
+    "GET /api/v1/guests/search",
+    "GET /api/v1/guests/stats",
+    "GET /api/v1/guests/{guest_id}/stats",
+    "GET /api/v1/guests/{guest_id}",
+)
+def test_guests(check, ids, trigram):
+    check("GET /api/v1/guests/", "/api/v1/guests/", admin=True)
+    if trigram:
+        check("GET /api/v1/guests/search", "/api/v1/guests/search?q=example", admin=True)
+    check("GET /api/v1/guests/stats", "/api/v1/guests/stats", admin=True)
+    check("GET /api/v1/guests/{guest_id}", f"/api/v1/guests/{ids['guest']}", admin=True)
+
+    with SessionLocal() as db:
+        guest_id = db.query(func.min(Booking.guest_id)).scalar()
+    if guest_id is not None:
+        check("GET /api/v1/guests/{guest_id}/stats", f"/api/v1/guests/{guest_id}/stats", admin=True)
+
+
+@routes(
+    "GET /api/v1/reviews/",
+    "GET /api/v1/reviews/search",
+    "GET /api/v1/reviews/admin",
+    "GET /api/v1/reviews/admin/search",
+    "GET /api/v1/reviews/admin/pending",
+)
+def test_reviews(check):
+    check("GET /api/v1/reviews/", "/api/v1/reviews/")
+    check("GET /api/v1/reviews/search", "/api/v1/reviews/search?q=room")
+    check("GET /api/v1/reviews/admin", "/api/v1/reviews/admin", admin=True)
+    check("GET /api/v1/reviews/admin/search", "/api/v1/reviews/admin/search?q=room", admin=True)
+    check("GET /api/v1/reviews/admin/pending", "/api/v1/reviews/admin/pending", admin=True)
+
+
+@routes("GET /api/v1/dining/", "GET /api/v1/dining/{item_id}")
+def test_dining(check, ids):
+    check("GET /api/v1/dining/", "/api/v1/dining/")
+    needs(ids, "dining")
+    check("GET /api/v1/dining/{item_id}", f"/api/v1/dining/{ids['dining']}")
+
+
+@routes("GET /api/v1/catalog/{name}")
+def test_catalog(check):
+    for name in ("rooms", "dining", "reviews"):
+        check("GET /api/v1/catalog/{name}", f"/api/v1/catalog/{name}")
+
+
+@routes("GET /api/v1/auth/me")
+def test_auth(check):
+    check("GET /api/v1/auth/me", "/api/v1/auth/me", admin=True)
@@ -3,6 +3,8 @@
 -- PostgreSQL
 -- =============================================
 
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
 -- -----------------------------
 -- Guests (Admins + CRM Guests)
 -- -----------------------------
@@ -16,7 +18,11 @@ CREATE TABLE guests (
     created_at TIMESTAMP WITHOUT TIME ZONE NOT NULL DEFAULT CURRENT_TIMESTAMP
 );
 
-CREATE INDEX idx_guests_email ON guests (email);
+-- Booking -> guest linkage (app.services.guest_stats)
+CREATE INDEX idx_guests_email_normalized ON guests (lower(trim(email)));
+-- Front desk typeahead (app.services.typeahead.GUEST_DOCUMENT)
+CREATE INDEX idx_guests_trgm ON guests
+    USING GIN ((lower(full_name || ' ' || email || ' ' || coalesce(phone, ''))) gin_trgm_ops);
 
 -- -----------------------------
 -- Rooms
@@ -29,6 +35,7 @@ CREATE TABLE rooms (
     max_adults INTEGER NOT NULL DEFAULT 2,
     max_children INTEGER NOT NULL DEFAULT 0,
     amenities JSONB,
+    pricing_version INTEGER NOT NULL DEFAULT 1,
     is_active BOOLEAN NOT NULL DEFAULT TRUE,
     display_order INTEGER NOT NULL DEFAULT 0,
     created_at TIMESTAMP WITHOUT TIME ZONE NOT NULL DEFAULT CURRENT_TIMESTAMP,
@@ -36,13 +43,18 @@ CREATE TABLE rooms (
 );
 
 CREATE INDEX idx_rooms_active ON rooms (is_active);
+-- Amenity search (amenities @> '{"pool": true}')
+CREATE INDEX idx_rooms_amenities ON rooms USING GIN (amenities jsonb_path_ops);
 
 -- -----------------------------
 -- Bookings
 -- -----------------------------
+-- Range partitioned by check_in, one partition per year
+-- (app.db.partitions); the key therefore includes check_in.
 CREATE TABLE bookings (
-    id SERIAL PRIMARY KEY,
+    id SERIAL,
     room_id INTEGER NOT NULL,
+    guest_id INTEGER,
     guest_name VARCHAR(255) NOT NULL,
     guest_email VARCHAR(255) NOT NULL,
     guest_phone VARCHAR(50) NOT NULL,
@@ -55,21 +67,40 @@ CREATE TABLE bookings (
     special_requests TEXT,
     created_at TIMESTAMP WITHOUT TIME ZONE NOT NULL DEFAULT CURRENT_TIMESTAMP,
     updated_at TIMESTAMP WITHOUT TIME ZONE NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (id, check_in),
     CONSTRAINT fk_bookings_room
         FOREIGN KEY (room_id)
         REFERENCES rooms (id)
-        ON DELETE RESTRICT
-);
+        ON DELETE RESTRICT,
+    CONSTRAINT fk_bookings_guest
+        FOREIGN KEY (guest_id)
+        REFERENCES guests (id)
+        ON DELETE SET NULL
+) PARTITION BY RANGE (check_in);
+
+CREATE TABLE bookings_default PARTITION OF bookings DEFAULT;
 
 CREATE INDEX idx_bookings_room_id ON bookings (room_id);
+CREATE INDEX idx_bookings_guest_id ON bookings (guest_id);
 CREATE INDEX idx_bookings_dates ON bookings (check_in, check_out);
 CREATE INDEX idx_bookings_status ON bookings (status);
+-- Availability overlap checks (app.services.availability)
+CREATE INDEX idx_bookings_overlap ON bookings (room_id, check_out, check_in) WHERE status = 'CONFIRMED';
+-- Expiry sweep (app.tasks.cleanup)
+CREATE INDEX idx_bookings_confirmed_created ON bookings (created_at) WHERE status = 'CONFIRMED';
+-- Front desk typeahead (app.services.typeahead.BOOKING_DOCUMENT)
+CREATE INDEX idx_bookings_guest_trgm ON bookings
+    USING GIN ((lower(guest_name || ' ' || guest_email || ' ' || guest_phone)) gin_trgm_ops);
 
 -- -----------------------------
 -- Payments
 -- -----------------------------
+-- Range partitioned by created_at, one partition per year. booking_id has
+-- no foreign key: a partitioned bookings table can only be referenced by
+-- (id, check_in); the ORM cascades deletes instead and
+-- `python -m app.tasks.partitions --check` reports orphaned rows.
 CREATE TABLE payments (
-    id SERIAL PRIMARY KEY,
+    id SERIAL,
     booking_id INTEGER NOT NULL,
     amount NUMERIC(10, 2) NOT NULL,
     method VARCHAR(50) NOT NULL,
@@ -77,14 +108,40 @@ CREATE TABLE payments (
     reference_id VARCHAR(255),
     paid_at TIMESTAMP WITHOUT TIME ZONE,
     created_at TIMESTAMP WITHOUT TIME ZONE NOT NULL DEFAULT CURRENT_TIMESTAMP,
-    CONSTRAINT fk_payments_booking
-        FOREIGN KEY (booking_id)
-        REFERENCES bookings (id)
-        ON DELETE CASCADE
-);
+    PRIMARY KEY (id, created_at)
+) PARTITION BY RANGE (created_at);
+
+CREATE TABLE payments_default PARTITION OF payments DEFAULT;
 
 CREATE INDEX idx_payments_booking_id ON payments (booking_id);
 CREATE INDEX idx_payments_status ON payments (status);
+CREATE INDEX idx_payments_reference_id ON payments (reference_id);
+-- Admin list, newest first
+CREATE INDEX idx_payments_created_at ON payments (created_at);
+-- Revenue ledger buckets (app.services.revenue.REVENUE_DAY)
+CREATE INDEX idx_payments_revenue_day ON payments ((coalesce(paid_at, created_at)::date), method)
+    WHERE status = 'PAID';
+
+-- -----------------------------
+-- Payment Webhook Events (append-only queue, app.services.payment_events)
+-- -----------------------------
+CREATE TABLE payment_events (
+    id BIGSERIAL PRIMARY KEY,
+    provider VARCHAR(50) NOT NULL,
+    payload TEXT NOT NULL,
+    received_at TIMESTAMP WITHOUT TIME ZONE NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    processed_at TIMESTAMP WITHOUT TIME ZONE,
+    error VARCHAR(255)
+);
+
+CREATE INDEX idx_payment_events_pending ON payment_events (id) WHERE processed_at IS NULL;
+
+CREATE TABLE payment_event_keys (
+    provider VARCHAR(50) NOT NULL,
+    event_id VARCHAR(255) NOT NULL,
+    payment_event_id BIGINT NOT NULL,
+    PRIMARY KEY (provider, event_id)
+);
 
 -- -----------------------------
 -- Pricing Rules
@@ -105,9 +162,32 @@ CREATE TABLE pricing_rules (
 CREATE INDEX idx_pricing_room_id ON pricing_rules (room_id);
 CREATE INDEX idx_pricing_dates ON pricing_rules (start_date, end_date);
 
+-- -----------------------------
+-- Yield Rates
+-- -----------------------------
+-- Demand signals and rates per room-night (app.services.yield_pricing);
+-- applied_rate overrides pricing_rules in quotes
+CREATE TABLE yield_rates (
+    room_id INTEGER NOT NULL,
+    night DATE NOT NULL,
+    occupancy NUMERIC(5, 4) NOT NULL,
+    pickup NUMERIC(5, 4) NOT NULL,
+    last_year_occupancy NUMERIC(5, 4) NOT NULL,
+    static_rate NUMERIC(10, 2) NOT NULL,
+    suggested_rate NUMERIC(10, 2) NOT NULL,
+    applied_rate NUMERIC(10, 2),
+    computed_at TIMESTAMP WITHOUT TIME ZONE NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (room_id, night),
+    CONSTRAINT fk_yield_rates_room
+        FOREIGN KEY (room_id)
+        REFERENCES rooms (id)
+        ON DELETE CASCADE
+);
+
 -- -----------------------------
 -- Reviews
 -- -----------------------------
+-- booking_id has no foreign key (bookings is partitioned, see payments)
 CREATE TABLE reviews (
     id SERIAL PRIMARY KEY,
     booking_id INTEGER NOT NULL UNIQUE,
@@ -116,13 +196,78 @@ CREATE TABLE reviews (
     comment TEXT,
     is_approved BOOLEAN NOT NULL DEFAULT FALSE,
     created_at TIMESTAMP WITHOUT TIME ZONE NOT NULL DEFAULT CURRENT_TIMESTAMP,
-    CONSTRAINT fk_reviews_booking
-        FOREIGN KEY (booking_id)
-        REFERENCES bookings (id)
-        ON DELETE CASCADE
+    search_vector TSVECTOR GENERATED ALWAYS AS (
+        setweight(to_tsvector('english', coalesce(guest_name, '')), 'A') ||
+        setweight(to_tsvector('english', coalesce(comment, '')), 'B')
+    ) STORED
 );
 
 CREATE INDEX idx_reviews_approved ON reviews (is_approved);
+CREATE INDEX idx_reviews_search ON reviews USING GIN (search_vector);
+CREATE INDEX idx_reviews_pending ON reviews (id) WHERE is_approved = FALSE;
+
+-- -----------------------------
+-- Guest Stats (maintained by app.services.guest_stats)
+-- -----------------------------
+CREATE TABLE guest_stats (
+    guest_id INTEGER PRIMARY KEY,
+    stays INTEGER NOT NULL DEFAULT 0,
+    nights INTEGER NOT NULL DEFAULT 0,
+    last_stay DATE,
+    paid_total NUMERIC(12, 2) NOT NULL DEFAULT 0,
+    updated_at TIMESTAMP WITHOUT TIME ZONE NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    CONSTRAINT fk_guest_stats_guest
+        FOREIGN KEY (guest_id)
+        REFERENCES guests (id)
+        ON DELETE CASCADE
+);
+
+-- -----------------------------
+-- Revenue Ledger (maintained by app.services.revenue)
+-- -----------------------------
+CREATE TABLE revenue_ledger (
+    day DATE NOT NULL,
+    method VARCHAR(50) NOT NULL,
+    amount NUMERIC(14, 2) NOT NULL DEFAULT 0,
+    payments INTEGER NOT NULL DEFAULT 0,
+    updated_at TIMESTAMP WITHOUT TIME ZONE NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (day, method)
+);
+
+-- -----------------------------
+-- Booking Archive (app.services.archive)
+-- -----------------------------
+-- Batches moved to Parquet, with the row counts they were verified against
+CREATE TABLE archive_batches (
+    name VARCHAR(64) PRIMARY KEY,
+    bookings INTEGER NOT NULL,
+    payments INTEGER NOT NULL,
+    reviews INTEGER NOT NULL,
+    first_check_in DATE NOT NULL,
+    last_check_out DATE NOT NULL,
+    archived_at TIMESTAMP WITHOUT TIME ZONE NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+
+-- Totals of archived rows, added into revenue_ledger / guest_stats
+CREATE TABLE archived_revenue (
+    day DATE NOT NULL,
+    method VARCHAR(50) NOT NULL,
+    amount NUMERIC(14, 2) NOT NULL DEFAULT 0,
+    payments INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (day, method)
+);
+
+CREATE TABLE archived_guest_stats (
+    guest_id INTEGER PRIMARY KEY,
+    stays INTEGER NOT NULL DEFAULT 0,
+    nights INTEGER NOT NULL DEFAULT 0,
+    last_stay DATE,
+    paid_total NUMERIC(12, 2) NOT NULL DEFAULT 0,
+    CONSTRAINT fk_archived_guest_stats_guest
+        FOREIGN KEY (guest_id)
+        REFERENCES guests (id)
+        ON DELETE CASCADE
+);
 
 -- -----------------------------
 -- Dining Items
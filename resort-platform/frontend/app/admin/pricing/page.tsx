@@ -15,6 +15,22 @@ type PricingResponse = {
   currency: string;
 };
 
+type RateGridRoom = {
+  room_id: number;
+  name: string;
+  rates: string[];
+  booked?: boolean[];
+};
+
+type RateGrid = {
+  start: string;
+  end: string;
+  currency: string;
+  nights: string[];
+  rooms: RateGridRoom[];
+  occupancy?: number[];
+};
+
 export default function PricingPage() {
   const [rooms, setRooms] = useState<Room[]>([]);
   const [roomId, setRoomId] = useState("");
@@ -24,6 +40,13 @@ export default function PricingPage() {
   const [loading, setLoading] = useState(false);
   const [error, setError] = useState<string | null>(null);
 
+  const [gridStart, setGridStart] = useState("");
+  const [gridEnd, setGridEnd] = useState("");
+  const [showOccupancy, setShowOccupancy] = useState(false);
+  const [grid, setGrid] = useState<RateGrid | null>(null);
+  const [gridLoading, setGridLoading] = useState(false);
+  const [gridError, setGridError] = useState<string | null>(null);
+
   // --------------------------------------------
   // Fetch rooms
   // --------------------------------------------
@@ -71,11 +94,53 @@ export default function PricingPage() {
     }
   }
 
+  // --------------------------------------------
+  // Fetch season rate grid (all rooms x nights)
+  // --------------------------------------------
+  async function handleLoadGrid() {
+    if (!gridStart || !gridEnd) {
+      setGridError("Please select season dates");
+      return;
+    }
+
+    setGridLoading(true);
+    setGridError(null);
+    setGrid(null);
+
+    try {
+      const token = localStorage.getItem("admin_token");
+
+      if (!token) {
+        throw new Error("Unauthorized");
+      }
+
+      const res = await fetch(
+        `/api/v1/pricing/grid?start=${gridStart}&end=${gridEnd}&occupancy=${showOccupancy}`,
+        {
+          headers: {
+            Authorization: `Bearer ${token}`,
+          },
+        }
+      );
+
+      if (!res.ok) {
+        throw new Error("Unable to load rate grid");
+      }
+
+      const data = await res.json();
+      setGrid(data);
+    } catch (err: any) {
+      setGridError(err.message || "Unable to load rate grid");
+    } finally {
+      setGridLoading(false);
+    }
+  }
+
   // --------------------------------------------
   // Render
   // --------------------------------------------
   return (
-    <div className="max-w-3xl mx-auto px-4 py-10">
+    <div className="max-w-6xl mx-auto px-4 py-10">
       <h1 className="text-3xl font-semibold mb-6">
         Pricing & Availability
       </h1>
@@ -137,6 +202,104 @@ export default function PricingPage() {
           </p>
         </div>
       )}
+
+      <h2 className="text-2xl font-semibold mt-12 mb-4">
+        Season Rates
+      </h2>
+
+      <div className="grid grid-cols-2 gap-4 mb-4">
+        <input
+          type="date"
+          value={gridStart}
+          onChange={(e) => setGridStart(e.target.value)}
+          className="border rounded px-3 py-2"
+        />
+        <input
+          type="date"
+          value={gridEnd}
+          onChange={(e) => setGridEnd(e.target.value)}
+          className="border rounded px-3 py-2"
+        />
+      </div>
+
+      <label className="flex items-center gap-2 mb-4 text-sm">
+        <input
+          type="checkbox"
+          checked={showOccupancy}
+          onChange={(e) => setShowOccupancy(e.target.checked)}
+        />
+        Show occupancy
+      </label>
+
+      <button
+        onClick={handleLoadGrid}
+        disabled={gridLoading}
+        className="w-full bg-black text-white py-3 rounded hover:bg-gray-800 transition mb-6"
+      >
+        {gridLoading ? "Loading..." : "Load Rates"}
+      </button>
+
+      {gridError && (
+        <p className="text-center text-red-600 mb-4">
+          {gridError}
+        </p>
+      )}
+
+      {grid && (
+        <div className="overflow-x-auto border rounded-lg">
+          <table className="text-sm whitespace-nowrap">
+            <thead>
+              <tr className="bg-gray-50">
+                <th className="sticky left-0 bg-gray-50 px-3 py-2 text-left">
+                  Room
+                </th>
+                {grid.nights.map((night) => (
+                  <th key={night} className="px-3 py-2 font-medium">
+                    {new Date(`${night}T00:00:00`).toLocaleDateString("en-IN", {
+                      weekday: "short",
+                      day: "numeric",
+                      month: "short",
+                    })}
+                  </th>
+                ))}
+              </tr>
+            </thead>
+            <tbody>
+              {grid.rooms.map((room) => (
+                <tr key={room.room_id} className="border-t">
+                  <td className="sticky left-0 bg-white px-3 py-2 font-medium">
+                    {room.name}
+                  </td>
+                  {room.rates.map((rate, i) => (
+                    <td
+                      key={grid.nights[i]}
+                      className={`px-3 py-2 text-right ${
+                        room.booked?.[i] ? "bg-gray-200 text-gray-500" : ""
+                      }`}
+                    >
+                      ₹{Number(rate).toLocaleString("en-IN")}
+                    </td>
+                  ))}
+                </tr>
+              ))}
+            </tbody>
+            {grid.occupancy && (
+              <tfoot>
+                <tr className="border-t bg-gray-50">
+                  <td className="sticky left-0 bg-gray-50 px-3 py-2 font-medium">
+                    Occupancy
+                  </td>
+                  {grid.occupancy.map((share, i) => (
+                    <td key={grid.nights[i]} className="px-3 py-2 text-right">
+                      {Math.round(share * 100)}%
+                    </td>
+                  ))}
+                </tr>
+              </tfoot>
+            )}
+          </table>
+        </div>
+      )}
     </div>
   );
 }